@@ -25,6 +25,8 @@ IMPLEMENTATION:
 Replace the methods in server-2.6.0/music_assistant/providers/apple_music/__init__.py
 """
 
+import asyncio
+from collections import deque
 from typing import TYPE_CHECKING, Any, AsyncGenerator
 
 if TYPE_CHECKING:
@@ -37,88 +39,106 @@ if TYPE_CHECKING:
 # Replace lines 771-786 in __init__.py with this:
 
 async def _get_all_items_streaming(
-    self, endpoint: str, key: str = "data", **kwargs
+    self, endpoint: str, key: str = "data", prefetch: int = 4, **kwargs
 ) -> AsyncGenerator[dict, None]:
     """
     Stream items from a paged API endpoint.
 
     Yields items one-by-one as pages are fetched, avoiding memory buildup.
+    Keeps up to `prefetch` later pages in flight while the current page is
+    being consumed; items still come out in offset order.
     Includes progress logging and per-page error handling.
 
     Args:
         endpoint: API endpoint to call
         key: JSON key containing items (default: "data")
+        prefetch: Pages to request ahead of the consumer (0 = serial)
         **kwargs: Additional query parameters
 
     Yields:
         Individual items from the paginated response
     """
     limit = 50
-    offset = 0
+    next_offset = 0
     page_num = 0
     total_items = 0
+    pending = deque()  # (offset, task) in offset order
+
+    try:
+        while True:
+            # Top up the look-ahead window
+            while len(pending) <= prefetch and next_offset // limit <= 10000:
+                params = {**kwargs, "limit": limit, "offset": next_offset}
+                pending.append(
+                    (next_offset, asyncio.ensure_future(self._get_data(endpoint, **params)))
+                )
+                next_offset += limit
+            offset, page_task = pending.popleft()
 
-    while True:
-        kwargs["limit"] = limit
-        kwargs["offset"] = offset
-
-        try:
-            result = await self._get_data(endpoint, **kwargs)
-        except Exception as exc:
-            # Log error but don't stop entire sync
-            self.logger.warning(
-                "Error fetching page %d (offset %d) from %s: %s",
-                page_num, offset, endpoint, exc
-            )
-            # If it's a 404 with pagination, we've reached the end
-            if "404" in str(exc) or "not found" in str(exc).lower():
+            try:
+                result = await page_task
+            except Exception as exc:
+                # Log error but don't stop entire sync
+                self.logger.warning(
+                    "Error fetching page %d (offset %d) from %s: %s",
+                    page_num, offset, endpoint, exc
+                )
+                # If it's a 404 with pagination, we've reached the end
+                if "404" in str(exc) or "not found" in str(exc).lower():
+                    break
+                # For other errors, stop to avoid infinite loop
+                raise
+
+            # Check if response has the expected key
+            if key not in result:
+                self.logger.debug(
+                    "No '%s' key in response for %s (offset %d), ending pagination",
+                    key, endpoint, offset
+                )
                 break
-            # For other errors, stop to avoid infinite loop
-            raise
-
-        # Check if response has the expected key
-        if key not in result:
-            self.logger.debug(
-                "No '%s' key in response for %s (offset %d), ending pagination",
-                key, endpoint, offset
-            )
-            break
-
-        items = result[key]
-        items_in_page = len(items)
-
-        # Yield items one by one
-        for item in items:
-            if item:  # Skip None/empty items
-                total_items += 1
-                yield item
-
-        # Log progress every 5 pages
-        if page_num % 5 == 0:
-            self.logger.debug(
-                "Fetched page %d from %s: %d items (total so far: %d)",
-                page_num, endpoint, items_in_page, total_items
-            )
 
-        # Check if there are more pages
-        if not result.get("next"):
-            self.logger.info(
-                "Completed fetching from %s: %d total items across %d pages",
-                endpoint, total_items, page_num + 1
-            )
-            break
+            items = result[key]
+            items_in_page = len(items)
 
-        # Move to next page
-        offset += limit
-        page_num += 1
+            # Yield items one by one
+            for item in items:
+                if item:  # Skip None/empty items
+                    total_items += 1
+                    yield item
 
-        # Safety check: prevent infinite loops
-        if page_num > 10000:  # 10000 pages × 50 = 500k items max
-            self.logger.error(
-                "Safety limit reached: %d pages fetched from %s. Stopping.",
-                page_num, endpoint
-            )
-            break
+            # Log progress every 5 pages
+            if page_num % 5 == 0:
+                self.logger.debug(
+                    "Fetched page %d from %s: %d items (total so far: %d)",
+                    page_num, endpoint, items_in_page, total_items
+                )
+
+            # Check if there are more pages
+            if not result.get("next"):
+                self.logger.info(
+                    "Completed fetching from %s: %d total items across %d pages",
+                    endpoint, total_items, page_num + 1
+                )
+                break
+
+            # Move to next page
+            page_num += 1
+
+            # Safety check: prevent infinite loops
+            if page_num > 10000:  # 10000 pages × 50 = 500k items max
+                self.logger.error(
+                    "Safety limit reached: %d pages fetched from %s. Stopping.",
+                    page_num, endpoint
+                )
+                break
+    finally:
+        # Cancel look-ahead pages that will never be consumed
+        for _offset, task in pending:
+            if task.done():
+                if not task.cancelled():
+                    task.exception()
+            else:
+                task.cancel()
 
 
 # Replace get_library_artists (lines 330-335) with:
@@ -209,7 +229,12 @@ async def _get_all_items_chunked(
     Stream items in chunks from a paged API endpoint.
 
     Yields batches of items every `chunk_size` pages, balancing memory
-    usage and processing efficiency.
+    usage and processing efficiency. Pages come from
+    _get_all_items_streaming(), so chunks inherit its look-ahead (and the
+    opt-in meta.total fan-out of the Unicode-safe version in
+    apple_music_unicode_fix.py when that one is installed). A page error
+    ends the stream the way it always has: the partial chunk is yielded
+    and the generator stops without raising.
 
     Args:
         endpoint: API endpoint to call
@@ -221,62 +246,54 @@ async def _get_all_items_chunked(
         Lists of items (batches)
     """
     limit = 50
-    offset = 0
-    page_num = 0
+    fetched = 0
     chunk_items = []
 
-    while True:
-        kwargs["limit"] = limit
-        kwargs["offset"] = offset
-
-        try:
-            result = await self._get_data(endpoint, **kwargs)
-        except Exception as exc:
-            # Yield accumulated items before error
-            if chunk_items:
-                yield chunk_items
-            self.logger.warning(
-                "Error at offset %d from %s: %s", offset, endpoint, exc
-            )
-            break
+    try:
+        async for item in self._get_all_items_streaming(endpoint, key, **kwargs):
+            chunk_items.append(item)
 
-        if key not in result:
-            break
-
-        # Accumulate items
-        chunk_items.extend(result[key])
-        page_num += 1
-
-        # Yield chunk every `chunk_size` pages
-        if page_num % chunk_size == 0:
-            self.logger.debug(
-                "Yielding chunk: %d items from %s (page %d)",
-                len(chunk_items), endpoint, page_num
-            )
-            yield chunk_items
-            chunk_items = []
-
-        # Check for more pages
-        if not result.get("next"):
-            # Yield remaining items
-            if chunk_items:
+            # Yield chunk every `chunk_size` pages
+            if len(chunk_items) >= chunk_size * limit:
+                self.logger.debug(
+                    "Yielding chunk: %d items from %s", len(chunk_items), endpoint
+                )
+                fetched += len(chunk_items)
                 yield chunk_items
-            break
+                chunk_items = []
+    except Exception as exc:
+        # The streaming reader re-raises page errors; keep the chunked
+        # contract instead: yield what was accumulated and stop cleanly
+        self.logger.warning(
+            "Error after %d items from %s: %s",
+            fetched + len(chunk_items), endpoint, exc
+        )
 
-        offset += limit
+    # Yield remaining items
+    if chunk_items:
+        yield chunk_items
 
 
 # Usage example for chunked approach:
-async def get_library_artists_chunked(self) -> AsyncGenerator[Artist, None]:
-    """Retrieve library artists using chunked batching."""
+async def get_library_artists_chunked(
+    self, chunk_size: int = 4
+) -> AsyncGenerator[list[Artist], None]:
+    """
+    Retrieve library artists using chunked batching.
+
+    Each chunk is parsed as a whole and yielded as one list, so the caller
+    can upsert it in a single DB transaction. The default of 4 pages (200
+    items) matches DB_TRANSACTION_SIZE in apple_music_unicode_fix.py.
+    """
     endpoint = "me/library/artists"
 
     async for items_batch in self._get_all_items_chunked(
-        endpoint, chunk_size=5, include="catalog", extend="editorialNotes"
+        endpoint, chunk_size=chunk_size, include="catalog", extend="editorialNotes"
     ):
-        for item in items_batch:
-            if item and item.get("id"):
-                yield self._parse_artist(item)
+        artists = [
+            self._parse_artist(item) for item in items_batch if item and item.get("id")
+        ]
+        yield [artist for artist in artists if artist]
 
 
 # ============================================================================
@@ -33,19 +33,301 @@ IMPLEMENTATION:
 Replace methods in server-2.6.0/music_assistant/providers/apple_music/__init__.py
 """
 
+import asyncio
+import codecs
 import json
 import logging
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
 import unicodedata
-from typing import TYPE_CHECKING, Any, AsyncGenerator
-
-if TYPE_CHECKING:
-    from music_assistant_models.media_items import Artist, Album, Track, Playlist
-
+import zlib
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncGenerator, Awaitable, Callable, Iterator
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+try:
+    import orjson
+except ImportError:  # The stdlib parses bytes as well, only slower
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # Without it responses are decoded to plain dicts
+    msgspec = None
+
+try:
+    import brotli
+except ImportError:  # gzip is still offered
+    brotli = None
+
+from music_assistant_models.enums import ImageType, MediaType
+from music_assistant_models.media_items import (
+    Album,
+    Artist,
+    ItemMapping,
+    MediaItemImage,
+    Playlist,
+    ProviderMapping,
+    Track,
+)
+
+
+# Apple Music API base URL for endpoint paths; `next` cursors
+# ("/v1/me/library/songs?offset=50") are resolved against the origin
+APPLE_MUSIC_API_ORIGIN = "https://api.music.apple.com"
+APPLE_MUSIC_API_URL = f"{APPLE_MUSIC_API_ORIGIN}/v1/"
+
+# Apple Music page size for me/library/* endpoints
+PAGE_LIMIT = 50
+
+# Pages kept in flight ahead of the consumer by _get_all_items_streaming
+PREFETCH_PAGES = 4
+
+# Fan-out mode (first page has meta.total): concurrent page requests and
+# the number of pages that may be buffered ahead of the consumer. Opt-in
+# (pass workers=FANOUT_WORKERS): pages fetched side by side can straddle
+# library changes that the meta.total re-read cannot undo, and items a
+# sync skips are removed from the library
+FANOUT_WORKERS = 8
+FANOUT_WINDOW_PAGES = 16
+
+# Abort a sync after this many page errors in a row
+MAX_CONSECUTIVE_PAGE_ERRORS = 3
+
+# Safety limit: 10000 pages × 50 = 500k items max
+MAX_PAGES = 10000
+
+# Library syncs save a resume checkpoint every N pages; checkpoints older
+# than CHECKPOINT_MAX_AGE seconds are ignored and the sync starts over
+CHECKPOINT_EVERY_PAGES = 4
+CHECKPOINT_MAX_AGE = 6 * 3600
+
+# Catalog IDs per ids= lookup (300 results in 504 timeouts)
+CATALOG_BATCH_SIZE = 200
+
+# Deferred repair of pages that failed mid-sync: attempts per page, base
+# backoff in seconds (doubles per attempt) and concurrent repairs
+GAP_REPAIR_ATTEMPTS = 3
+GAP_REPAIR_BACKOFF = 2.0
+GAP_REPAIR_WORKERS = 4
+
+# Seen-ID dedup across offset shifts (items added/removed mid-sync): at
+# most SEEN_IDS_MAX 64-bit ID hashes are kept (~800 KB), new hashes are
+# merged into the sorted array every SEEN_IDS_MERGE_EVERY items, and a
+# drop in meta.total re-reads at most SHIFT_REREAD_MAX_PAGES pages back
+SEEN_IDS_MAX = 100_000
+SEEN_IDS_MERGE_EVERY = 4096
+SHIFT_REREAD_MAX_PAGES = 4
+
+# Items per batch on the batch-native sync path (get_library_*_batched),
+# i.e. per DB transaction on the consumer side; rounded up to whole pages
+DB_TRANSACTION_SIZE = 200
+
+# Failed items a ParseReport keeps (ID, name, error) for its log line;
+# the rest are only counted per exception type
+PARSE_ERROR_SAMPLES = 3
+
+# Request profiles per library sync phase: the query parameters its
+# requests send. "full" is what the sync has always asked for. "lean"
+# uses sparse fieldsets (fields[type]=...) to ask only for the attributes
+# the parsers read, leaves out editorialNotes (get_editorial_notes()
+# fetches them on demand) and keeps artwork only on the synced items
+# themselves, not on the artists/albums embedded in them. A fields[type]
+# list covers relationships as well as attributes (JSON:API sparse
+# fieldsets), so each one also names the relationships the phase
+# includes and the parsers follow (catalog, artists, albums)
+_ARTIST_FIELDS = "name,url,artwork,genreNames"
+_ALBUM_FIELDS = (
+    "name,artistName,url,artwork,genreNames,releaseDate,recordLabel,copyright,upc,"
+    "contentRating,isSingle,isCompilation,trackCount,audioTraits,playParams"
+)
+_SONG_FIELDS = (
+    "name,artistName,albumName,composerName,url,artwork,genreNames,releaseDate,"
+    "durationInMillis,trackNumber,discNumber,isrc,contentRating,audioTraits,playParams"
+)
+SYNC_REQUEST_PROFILES: dict[str, dict[str, dict[str, str]]] = {
+    "full": {
+        "artists": {"include": "catalog", "extend": "editorialNotes"},
+        "albums": {"include": "catalog,artists", "extend": "editorialNotes"},
+        "songs": {},
+        "catalog_songs": {"include": "artists,albums"},
+        "playlists": {},
+    },
+    "lean": {
+        "artists": {
+            "include": "catalog",
+            "fields[library-artists]": "name,catalog",
+            "fields[artists]": _ARTIST_FIELDS,
+        },
+        "albums": {
+            "include": "catalog,artists",
+            "fields[library-albums]": f"{_ALBUM_FIELDS},catalog,artists",
+            "fields[albums]": f"{_ALBUM_FIELDS},artists",
+            "fields[artists]": "name,url",
+        },
+        "songs": {"fields[library-songs]": _SONG_FIELDS},
+        "catalog_songs": {
+            "include": "artists,albums",
+            "fields[songs]": f"{_SONG_FIELDS},artists,albums",
+            "fields[artists]": "name,url",
+            "fields[albums]": "name,artistName,url,releaseDate,upc,contentRating,isSingle,isCompilation",
+        },
+        "playlists": {
+            "fields[library-playlists]": (
+                "name,description,artwork,url,curatorName,canEdit,hasCatalog,"
+                "lastModifiedDate,playParams"
+            ),
+        },
+    },
+}
+SYNC_REQUEST_PROFILE = "full"
+
+# Library sync pipeline: batches queued between stages, concurrent parse
+# workers, and how often (in batches) stage stats are logged
+PIPELINE_QUEUE_DEPTH = 4
+PIPELINE_PARSE_WORKERS = 2
+PIPELINE_STATS_EVERY = 20
+
+# Provider-wide adaptive rate limit (requests per second). The floor is the
+# old fixed 1 req/2 s throttle; the limiter climbs from the initial rate
+# while responses are clean and halves on 429/504.
+RATE_LIMIT_INITIAL = 2.0
+RATE_LIMIT_MIN = 0.5
+RATE_LIMIT_MAX = 20.0
+RATE_LIMIT_BURST = 5
+
+# On-disk conditional-request cache (ETag / Last-Modified): total size
+# of stored response bodies before least recently used ones are evicted
+RESPONSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# In-memory catalog cache (catalog/{storefront}/...): TTL in seconds per
+# resource type, TTL for other types, and the memory cap for entries
+CATALOG_CACHE_TTLS = {
+    "songs": 24 * 3600,
+    "albums": 24 * 3600,
+    "artists": 12 * 3600,
+    "playlists": 3600,
+}
+CATALOG_CACHE_DEFAULT_TTL = 6 * 3600
+CATALOG_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Micro-batched single catalog lookups: how long to gather lookups before
+# sending one ids= request, and the most IDs per request for each type
+CATALOG_LOADER_WINDOW = 0.005
+CATALOG_LOADER_MAX_IDS = {
+    "songs": CATALOG_BATCH_SIZE,
+    "albums": 100,
+    "artists": 25,
+    "playlists": 25,
+}
+CATALOG_LOADER_DEFAULT_MAX_IDS = 25
+
+# Retries for 429/504 responses inside _request_data
+MAX_REQUEST_RETRIES = 5
+
+# Compressed transfer: encodings offered to Apple (br only with a brotli
+# module) and the network read size; bodies are decompressed chunk by
+# chunk as they arrive instead of after the whole body is in memory
+ACCEPT_ENCODING = "br, gzip" if brotli is not None else "gzip"
+TRANSFER_CHUNK_SIZE = 64 * 1024
+
+# Provider-owned connection pool for api.music.apple.com: connections per
+# host (fan-out workers + prefetch + hedges fit), seconds an idle
+# connection is kept alive, DNS cache TTL in seconds, and how many
+# connections handle_async_init opens before the first sync (one per
+# fan-out worker)
+API_POOL_LIMIT_PER_HOST = 16
+API_POOL_KEEPALIVE = 75.0
+API_POOL_DNS_TTL = 600
+API_POOL_WARMUP_CONNECTIONS = FANOUT_WORKERS
+
+# Hedged requests: duplicate a request once it runs past the endpoint's
+# observed HEDGE_PERCENTILE latency (needs HEDGE_MIN_SAMPLES samples out of
+# the last LATENCY_WINDOW, never sooner than HEDGE_MIN_DELAY seconds), for
+# at most HEDGE_MAX_FRACTION of requests
+HEDGING_ENABLED = True
+HEDGE_PERCENTILE = 0.95
+HEDGE_MIN_SAMPLES = 20
+HEDGE_MIN_DELAY = 0.25
+HEDGE_MAX_FRACTION = 0.05
+LATENCY_WINDOW = 200
+
+# Sync-scoped string interning (StringPool): distinct strings kept per
+# pool, and the longest string worth a lookup (names, genres and artwork
+# URLs repeat across a library; descriptions don't). Opt-in: on a
+# 10k-track sync it cut the memory held by parsed tracks 2.1x but made
+# decode + parse 0.6-0.95x as fast (benchmark_string_interning())
+SYNC_STRING_INTERNING = False
+INTERN_POOL_MAX = 50_000
+INTERN_MAX_LENGTH = 200
+
+# NFC-normalize every API response once, as it is decoded (see
+# _decode_json_body()); the batch parsers then take its strings as they are.
+# Off by default: the parsers read only a few fields of each resource, so
+# normalizing all of them measured slower than safe_unicode_str()'s
+# per-field _nfc() on a full library sync (0.6-0.9x on Apple's NFC
+# payloads, ~0.35x on decomposed ones; benchmark_payload_normalization()).
+# Turn it on when every string handed to Music Assistant must be NFC,
+# including the ones the parsers pass through untouched.
+PAYLOAD_NFC = False
+# Characters per is_normalized() call when checking a whole body: the
+# check stops at the first slice that is not in NFC instead of composing
+# the entire document
+NFC_CHECK_SLICE = 8192
 
 # ============================================================================
 # UNICODE UTILITIES
 # ============================================================================
 
+def _nfc(text: str) -> str:
+    """
+    NFC form of `text`, with the fast path safe_unicode_str() runs on.
+
+    ASCII is always NFC and comes back as is (str.isascii() reads a flag
+    CPython keeps on the string). Everything else goes straight to
+    normalize(), which returns NFC input unchanged after its own quick
+    check. Neither an is_normalized() pre-check nor a memo of composed
+    strings paid for itself: the pre-check scans decomposed strings
+    twice, and the memo's hash and lookup cost NFC text (nearly all of
+    what Apple sends) more than it saved on repeated NFD names (see
+    benchmark_unicode_normalization()).
+    """
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
+# True while a batch parser reads API payloads that _decode_json_body() or
+# DataItemStream already normalized (PAYLOAD_NFC): safe_unicode_str()
+# then takes str values as they are. Set by normalized_strings()
+_strings_normalized: ContextVar[bool] = ContextVar(
+    "apple_music_strings_normalized", default=False
+)
+
+
+@contextmanager
+def normalized_strings(enabled: bool = True) -> Iterator[None]:
+    """Let safe_unicode_str() skip NFC for str values within the block."""
+    if not enabled:
+        yield
+        return
+    token = _strings_normalized.set(True)
+    try:
+        yield
+    finally:
+        _strings_normalized.reset(token)
+
+
 def safe_unicode_str(value: Any, fallback: str = "") -> str:
     """
     Safely convert any value to a Unicode string.
@@ -70,10 +352,11 @@ def safe_unicode_str(value: Any, fallback: str = "") -> str:
     if isinstance(value, str):
         # Normalize to NFC (Canonical Composition) for consistent representation
         # This ensures "é" is stored as single codepoint, not "e" + combining accent
-        return unicodedata.normalize('NFC', value)
+        # (already done once for the whole payload inside normalized_strings())
+        text = value if _strings_normalized.get() else _nfc(value)
 
     # If it's bytes, decode with error handling
-    if isinstance(value, bytes):
+    elif isinstance(value, bytes):
         try:
             # Try UTF-8 first
             decoded = value.decode('utf-8')
@@ -83,13 +366,18 @@ def safe_unicode_str(value: Any, fallback: str = "") -> str:
                 decoded = value.decode('latin-1')
             except Exception:
                 return fallback
-        return unicodedata.normalize('NFC', decoded)
+        text = _nfc(decoded)
 
     # For other types, convert to string and normalize
-    try:
-        return unicodedata.normalize('NFC', str(value))
-    except Exception:
-        return fallback
+    else:
+        try:
+            text = _nfc(str(value))
+        except Exception:
+            return fallback
+
+    # Inside a batch parse, repeated strings share one object (StringPool)
+    pool = _active_string_pool.get()
+    return text if pool is None else pool.intern(text)
 
 
 def safe_json_get(data: dict, *keys, default: Any = None) -> Any:
@@ -110,8 +398,8 @@ def safe_json_get(data: dict, *keys, default: Any = None) -> Any:
     """
     current = data
     for key in keys:
-        # Handle dictionary keys
-        if isinstance(current, dict):
+        # Handle dictionary keys (and typed structs)
+        if isinstance(current, JSON_MAPPINGS):
             current = current.get(key)
             if current is None:
                 return default
@@ -153,84 +441,857 @@ def truncate_for_log(text: str, max_length: int = 100) -> str:
     return text[:max_length - 3] + "..."
 
 
+# ============================================================================
+# SYNC-SCOPED STRING INTERNING
+# ============================================================================
+
+class StringPool:
+    """
+    Bounded interning table for the strings one library sync repeats.
+
+    Every decoded page carries its own copy of each artist name, album
+    name, genre and artwork URL, and every parsed item would keep that
+    copy alive. Routed through the pool (see interning()), equal strings
+    resolve to the first copy seen; genre sets are still built per item
+    (MediaItemMetadata.update() merges into them) from the pooled names.
+    Strings longer than `max_length` are passed
+    through; once `max_size` strings are held new ones are passed through
+    too (no eviction: the table lives only as long as the sync).
+    """
+
+    def __init__(self, max_size: int = INTERN_POOL_MAX, max_length: int = INTERN_MAX_LENGTH) -> None:
+        self.max_size = max_size
+        self.max_length = max_length
+        self._strings: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.passed = 0
+
+    def intern(self, text: str) -> str:
+        """The pooled copy of `text` (added on first sight while there is room)."""
+        if len(text) > self.max_length:
+            self.passed += 1
+            return text
+        pooled = self._strings.get(text)
+        if pooled is not None:
+            self.hits += 1
+            return pooled
+        if len(self._strings) >= self.max_size:
+            self.passed += 1
+            return text
+        self.misses += 1
+        self._strings[text] = text
+        return text
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "strings": len(self._strings),
+            "hits": self.hits,
+            "misses": self.misses,
+            "passed": self.passed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __str__(self) -> str:
+        stats = self.stats()
+        return (
+            f"{stats['strings']} strings, "
+            f"{stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, {stats['passed']} passed through)"
+        )
+
+
+# The pool safe_unicode_str() interns into; set by interning() around a
+# (synchronous) batch parse, None everywhere else
+_active_string_pool: ContextVar[StringPool | None] = ContextVar(
+    "apple_music_string_pool", default=None
+)
+
+
+@contextmanager
+def interning(pool: StringPool | None) -> Iterator[None]:
+    """Route safe_unicode_str() through `pool` for the duration of the block."""
+    if pool is None:
+        yield
+        return
+    token = _active_string_pool.set(pool)
+    try:
+        yield
+    finally:
+        _active_string_pool.reset(token)
+
+
+# ============================================================================
+# PERSISTED PAGINATION CHECKPOINTS
+# ============================================================================
+
+class SyncCheckpointStore:
+    """
+    Small JSON file holding one pagination checkpoint per library endpoint.
+
+    A checkpoint records where the last (interrupted) sync of an endpoint
+    got to: offset, the `next` href, items already yielded and a timestamp.
+    Entries are keyed by endpoint plus the query parameters, so
+    include/extend variants never share a checkpoint.
+
+    Writes go to a temp file and are moved into place, so a crash mid-write
+    leaves the previous checkpoint intact.
+    """
+
+    def __init__(self, path: str, max_age: float = CHECKPOINT_MAX_AGE) -> None:
+        self.path = path
+        self.max_age = max_age
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Stable key for an endpoint + query parameter combination."""
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{endpoint}?{query}" if query else endpoint
+
+    def _read_all(self) -> dict[str, dict]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            logging.getLogger(__name__).warning(
+                "Ignoring unreadable sync checkpoint file %s: %s", self.path, exc
+            )
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_all(self, data: dict[str, dict]) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def load(self, key: str) -> dict | None:
+        """Return the checkpoint for `key` if it is recent enough to resume."""
+        checkpoint = self._read_all().get(key)
+        if not checkpoint:
+            return None
+        if time.time() - checkpoint.get("timestamp", 0) > self.max_age:
+            return None
+        return checkpoint
+
+    def save(self, key: str, checkpoint: dict) -> None:
+        """Store (or replace) the checkpoint for `key`."""
+        data = self._read_all()
+        data[key] = checkpoint
+        self._write_all(data)
+
+    def clear(self, key: str) -> None:
+        """Forget the checkpoint for `key` (sync finished)."""
+        data = self._read_all()
+        if data.pop(key, None) is not None:
+            self._write_all(data)
+
+
 # ============================================================================
 # STREAMING PAGINATION WITH UNICODE SAFETY
 # ============================================================================
 
-async def _get_all_items_streaming(
-    self, endpoint: str, key: str = "data", **kwargs
-) -> AsyncGenerator[dict, None]:
+def _cancel_pending_pages(pending: deque) -> None:
+    """
+    Cancel prefetched page requests that will never be consumed.
+
+    Tasks that already finished have their exception retrieved so asyncio
+    does not log "Task exception was never retrieved" for them.
+    """
+    for _offset, task in pending:
+        if task.done():
+            if not task.cancelled():
+                task.exception()
+        else:
+            task.cancel()
+    pending.clear()
+
+
+def _cursor_offset(next_href: str, endpoint: str, params: dict) -> int | None:
+    """
+    Offset a `next` cursor points at, if offset math can reproduce it.
+
+    That is the case for "/v1/<endpoint>?offset=N" with any other query
+    parameters equal to the ones sent in `params`. Anything else (another
+    path, a non-numeric offset, unknown cursor parameters) returns None.
+    """
+    parts = urlsplit(next_href)
+    path = parts.path.strip("/")
+    if path.startswith("v1/"):
+        path = path[3:]
+    if path != endpoint.strip("/"):
+        return None
+    query = dict(parse_qsl(parts.query))
+    offset = query.pop("offset", "")
+    query.pop("limit", None)
+    if not offset.isdigit() or any(str(params.get(name)) != value for name, value in query.items()):
+        return None
+    return int(offset)
+
+
+class SeenIdSet:
+    """
+    Compact set of item IDs already yielded by one paginated fetch.
+
+    IDs are stored as 64-bit hashes in a sorted array('Q') (8 bytes per
+    item instead of a str object plus set slot), with a small set of
+    recent hashes merged in every `merge_every` additions. Once `capacity`
+    hashes are stored, new IDs are no longer recorded (`full` is set) and
+    are always reported as unseen, so memory stays bounded for any library
+    size at the cost of dedup coverage past the cap.
     """
-    Stream items from a paged API endpoint with Unicode-safe error handling.
 
-    Yields items one-by-one as pages are fetched, avoiding memory buildup.
-    Includes robust error handling, progress logging, and Unicode safety.
+    def __init__(self, capacity: int = SEEN_IDS_MAX, merge_every: int = SEEN_IDS_MERGE_EVERY) -> None:
+        self.capacity = capacity
+        self.merge_every = merge_every
+        self.full = False
+        self._sorted = array("Q")
+        self._recent: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._sorted) + len(self._recent)
+
+    def add(self, item_id: str) -> bool:
+        """Record `item_id`; return False if it was already seen."""
+        # hash() of a str is stable within the process, which is all a
+        # single sync needs; 64 bits keep collisions negligible at 100k
+        hashed = hash(item_id) & 0xFFFF_FFFF_FFFF_FFFF
+        if hashed in self._recent:
+            return False
+        idx = bisect_left(self._sorted, hashed)
+        if idx < len(self._sorted) and self._sorted[idx] == hashed:
+            return False
+        if len(self) >= self.capacity:
+            self.full = True
+            return True
+        self._recent.add(hashed)
+        if len(self._recent) >= self.merge_every:
+            self._sorted = array("Q", sorted((*self._sorted, *self._recent)))
+            self._recent.clear()
+        return True
+
+
+@dataclass
+class PaginationReport:
+    """Outcome of one paginated fetch, filled in by _get_pages_streaming()."""
+
+    endpoint: str
+    start_offset: int = 0
+    pages: int = 0
+    items: int = 0
+    completed: bool = False
+    # Offsets whose page failed during the main scan, the subset still
+    # missing after the repair pass, and whether the repair pass is running
+    failed_offsets: list[int] = field(default_factory=list)
+    gaps: list[int] = field(default_factory=list)
+    repairing: bool = False
+    # First offset never requested because the scan stopped after
+    # MAX_CONSECUTIVE_PAGE_ERRORS failures in a row (None: nothing left out)
+    unscanned_from: int | None = None
+    # Seen-ID dedup: items dropped as already seen, pages that started
+    # with an already-seen item (forward shift), windows re-read after
+    # meta.total changed and items those re-reads recovered
+    duplicates: int = 0
+    shifts: int = 0
+    rereads: int = 0
+    recovered: int = 0
+
+
+def _drop_seen_items(items: list, seen: SeenIdSet, report: PaginationReport) -> list:
+    """Return `items` without the ones whose ID is already in `seen`."""
+    kept = []
+    for idx, item in enumerate(items):
+        item_id = item.get("id") if isinstance(item, JSON_MAPPINGS) else None
+        if item_id is None or seen.add(item_id):
+            kept.append(item)
+            continue
+        report.duplicates += 1
+        if idx == 0:
+            # Overlap at the page boundary: items were inserted before
+            # this offset since the previous page was read
+            report.shifts += 1
+    return kept
+
+
+async def _get_pages_streaming(
+    self,
+    endpoint: str,
+    key: str = "data",
+    prefetch: int = PREFETCH_PAGES,
+    workers: int = 0,
+    start_offset: int = 0,
+    report: PaginationReport | None = None,
+    repair_offsets: list[int] | None = None,
+    follow_cursor: bool = False,
+    typed: bool = False,
+    **kwargs,
+) -> AsyncGenerator[tuple[int, dict], None]:
+    """
+    Stream raw pages from a paged API endpoint, in offset order.
+
+    Up to `prefetch` later pages are requested while the consumer is still
+    handling the current one, so network round trips overlap with parsing
+    and DB writes.
+
+    With `workers` set (fan-out is opt-in, see FANOUT_WORKERS) and
+    `meta.total` on the first page, every remaining offset is known up
+    front: pagination switches to fan-out mode and shards those offsets
+    across `workers` concurrent requests, with up to FANOUT_WINDOW_PAGES
+    pages buffered ahead of the consumer. Otherwise it keeps following
+    `next` with speculative look-ahead.
+
+    Either way pages are yielded strictly in offset order and memory stays
+    bounded by the window size, not the library size.
+
+    A page that fails with a non-404 error no longer loses its items: the
+    offset is recorded and the scan moves on. After the main scan the
+    failed pages are retried concurrently with backoff by
+    _repair_page_gaps() and yielded late (out of offset order, with
+    `report.repairing` set). Offsets that still fail end up in
+    `report.gaps`. MAX_CONSECUTIVE_PAGE_ERRORS failures in a row stop the
+    scan; once the repair pass gets its pages through, scanning resumes
+    after the last failed offset. If the repair fails too, the first
+    offset never requested is left in `report.unscanned_from`.
+
+    Offset pagination shifts when the library changes mid-sync. Items are
+    deduplicated on their Apple ID (SeenIdSet), which absorbs the overlap
+    an insertion causes at the next page boundary. A removal shows up as a
+    drop in meta.total between pages and would silently skip items, so the
+    window the items slid back into is re-read and whatever was not seen
+    yet is prepended to the current page. On any meta.total change the
+    look-ahead pages, fetched before or during the change, are requested
+    again, and the rest of the scan drops fan-out and look-ahead: pages
+    in flight together can straddle further changes that no total
+    comparison catches. Counts end up in `report`.
+
+    Each page's `next` cursor is checked against offset math. While they
+    agree, look-ahead and fan-out keep requesting pages by offset; once a
+    cursor points anywhere else (Apple changed its format, or the page
+    came back short) speculation stops and every following page is
+    requested from `next` exactly as returned. `follow_cursor=True` (or
+    prefetch=0 with workers=0) follows `next` from the first page on.
 
     Args:
         endpoint: API endpoint to call
         key: JSON key containing items (default: "data")
+        prefetch: Number of pages to keep in flight ahead of the consumer
+            (0 restores the old one-page-at-a-time behaviour)
+        workers: Concurrent page requests in fan-out mode (default 0:
+            no fan-out)
+        start_offset: Offset of the first page (resumed syncs)
+        report: Optional PaginationReport updated as pages arrive;
+            `completed` is set only when the endpoint was exhausted
+        repair_offsets: Failed offsets carried over from a checkpoint,
+            retried in the repair pass
+        follow_cursor: Always request `next` as returned, no look-ahead
+        typed: Decode pages into typed structs (see decode_resource_list();
+            only for consumers that hand items straight to the parsers)
         **kwargs: Additional query parameters
 
     Yields:
-        Individual items from the paginated response
+        (offset, response) tuples; response always contains `key`
     """
-    limit = 50
-    offset = 0
-    page_num = 0
-    total_items = 0
+    limit = PAGE_LIMIT
+    page_num = start_offset // limit
     consecutive_errors = 0
-    max_consecutive_errors = 3
+    max_consecutive_errors = MAX_CONSECUTIVE_PAGE_ERRORS
+    report = report or PaginationReport(endpoint)
+    report.start_offset = start_offset
+    report.failed_offsets.extend(repair_offsets or ())
+
+    # Window of (offset, task) pairs in offset order. Until the total is
+    # known, pages past the end of the library come back as {} (404 with
+    # limit/offset) and are cancelled as soon as a page without "next" is
+    # seen. The semaphore caps how many of them are on the wire at once.
+    pending: deque[tuple[int, asyncio.Task]] = deque()
+    next_offset = start_offset
+    first_page = True
+    end_offset: int | None = None  # Set from meta.total in fan-out mode
+    window = prefetch + 1
+    in_flight = asyncio.Semaphore(window)
+    seen = SeenIdSet()
+    last_total: int | None = None
+    # Cursor mode: pages come from `next` hrefs, one at a time
+    cursor_mode = follow_cursor or (prefetch <= 0 and workers <= 0)
+    last_href: str | None = None
+
+    async def fetch_page(page_offset: int) -> dict:
+        async with in_flight:
+            return await self._get_data_hedged(
+                endpoint, typed=typed, **{**kwargs, "limit": limit, "offset": page_offset}
+            )
 
-    while True:
-        kwargs["limit"] = limit
-        kwargs["offset"] = offset
+    async def fetch_cursor(next_href: str) -> dict:
+        # The href already carries its own cursor/offset; _get_data only
+        # appends the parameters it lacks (limit, include, ...)
+        async with in_flight:
+            return await self._get_data_hedged(next_href, typed=typed, **{**kwargs, "limit": limit})
+
+    def schedule_pages() -> None:
+        nonlocal next_offset
+        # In cursor mode pages are chained from `next`; offsets are only
+        # used for the first page and to skip past a failed one
+        slots = 1 if cursor_mode else window
+        while (
+            len(pending) < slots
+            and next_offset // limit <= MAX_PAGES
+            and (end_offset is None or next_offset < end_offset)
+        ):
+            pending.append((next_offset, asyncio.ensure_future(fetch_page(next_offset))))
+            next_offset += limit
+
+    def start_fanout(total: int) -> None:
+        nonlocal end_offset, window, in_flight
+        end_offset = total
+        window = max(window, FANOUT_WINDOW_PAGES)
+        in_flight = asyncio.Semaphore(max(workers, 1))
+        # Drop speculative look-ahead that lies past the known end
+        while pending and pending[-1][0] >= total:
+            _cancel_pending_pages(deque([pending.pop()]))
+        self.logger.debug(
+            "%s: meta.total=%d, fanning out %d pages across %d workers",
+            endpoint, total, -(-total // limit), workers
+        )
+
+    async def reread_window(page_offset: int, shrunk_by: int, page_total: int) -> list:
+        # Items before page_offset slid back by up to `shrunk_by` places,
+        # so the ones not read yet now sit in [page_offset - shrunk_by,
+        # page_offset); everything else there is dropped as already seen.
+        # If the library changed again since the page was read, the window
+        # is widened once by that drift.
+        max_window = SHIFT_REREAD_MAX_PAGES * limit
+        window_start = max(0, page_offset - min(shrunk_by, max_window))
+        window_end = page_offset
+        drift_checked = False
+        report.rereads += 1
+        recovered = []
+        reread_offset = window_start
+        while reread_offset < window_end:
+            try:
+                reread = await self._get_data_hedged(
+                    endpoint,
+                    typed=typed,
+                    **{**kwargs, "limit": min(limit, window_end - reread_offset), "offset": reread_offset},
+                )
+            except Exception as exc:
+                self.logger.warning(
+                    "Re-reading %s at offset %d after a library change failed: %s",
+                    endpoint, reread_offset, truncate_for_log(safe_unicode_str(str(exc)), 80)
+                )
+                reread_offset += limit
+                continue
+            recovered.extend(
+                _drop_seen_items([item for item in reread.get(key, []) if item], seen, report)
+            )
+            reread_offset += limit
+            reread_total = safe_json_get(reread, "meta", "total")
+            if not drift_checked and isinstance(reread_total, int) and reread_total != page_total:
+                drift_checked = True
+                # Inserts and removals may both be in that drift: widen
+                # both ends by its size
+                drift = abs(reread_total - page_total)
+                window_start = max(0, window_start - drift, page_offset - 2 * max_window)
+                window_end += min(drift, max_window)
+                reread_offset = window_start
+        report.recovered += len(recovered)
+        self.logger.info(
+            "%s shrank by %d item(s) mid-sync; re-read offsets %d-%d, recovered %d item(s)",
+            endpoint, shrunk_by, window_start, window_end, len(recovered)
+        )
+        return recovered
 
+    # A scan aborted by consecutive errors resumes after its repair pass
+    repaired_count = 0
+    while True:
         try:
-            # Fetch page with explicit encoding
-            result = await self._get_data(endpoint, **kwargs)
-            consecutive_errors = 0  # Reset error counter on success
+            while True:
+                schedule_pages()
+                if not pending:
+                    break
+                offset, page_task = pending.popleft()
 
-        except Exception as exc:
-            consecutive_errors += 1
+                try:
+                    # Fetch page with explicit encoding
+                    result = await page_task
+                    consecutive_errors = 0  # Reset error counter on success
+
+                except Exception as exc:
+                    consecutive_errors += 1
+
+                    # Log error with safe Unicode handling
+                    error_msg = safe_unicode_str(str(exc), "Unknown error")
+                    self.logger.warning(
+                        "Error fetching page %d (offset %d) from %s: %s",
+                        page_num, offset, endpoint, truncate_for_log(error_msg)
+                    )
 
-            # Log error with safe Unicode handling
-            error_msg = safe_unicode_str(str(exc), "Unknown error")
+                    # If it's a 404 with pagination, we've reached the end
+                    if "404" in error_msg or "not found" in error_msg.lower():
+                        self.logger.info(
+                            "Reached end of %s at page %d (404 response)",
+                            endpoint, page_num
+                        )
+                        report.completed = True
+                        break
+
+                    # Remember the page for the repair pass
+                    report.failed_offsets.append(offset)
+
+                    # Stop if too many consecutive errors; the rest of the
+                    # library is scanned after the repair pass
+                    if consecutive_errors >= max_consecutive_errors:
+                        self.logger.error(
+                            "Stopping %s sync after %d consecutive errors",
+                            endpoint, consecutive_errors
+                        )
+                        report.unscanned_from = offset + limit
+                        break
+
+                    # Continue to next page (already in flight); the failed one
+                    # is retried after the main scan
+                    page_num += 1
+                    continue
+
+                # Check if response has the expected key
+                if key not in result:
+                    self.logger.debug(
+                        "No '%s' key in response for %s (offset %d), ending pagination",
+                        key, endpoint, offset
+                    )
+                    report.completed = True
+                    break
+
+                # First page tells us whether every offset is known up front
+                if first_page and workers > 0 and end_offset is None and not cursor_mode:
+                    total = safe_json_get(result, "meta", "total")
+                    if isinstance(total, int):
+                        start_fanout(total)
+                first_page = False
+
+                # Drop items seen on earlier pages, recover ones a removal
+                # pushed back behind this offset
+                page_items = _drop_seen_items([item for item in result[key] if item], seen, report)
+                total = safe_json_get(result, "meta", "total")
+                if isinstance(total, int):
+                    if last_total is not None and total != last_total:
+                        if total < last_total and offset > 0:
+                            page_items[:0] = await reread_window(offset, last_total - total, total)
+                        # Look-ahead pages may straddle the change: fetch them
+                        # again so the rest of the scan sees the new layout
+                        if pending:
+                            report.rereads += 1
+                            _cancel_pending_pages(pending)
+                            next_offset = offset + limit
+                        # Concurrent pages can straddle further changes the
+                        # re-read cannot see: read the rest one at a time
+                        if window > 1:
+                            self.logger.info(
+                                "%s changed mid-sync (meta.total %d -> %d), reading "
+                                "the remaining pages one at a time",
+                                endpoint, last_total, total
+                            )
+                            end_offset = None
+                            window = 1
+                            in_flight = asyncio.Semaphore(1)
+                    last_total = total
+                result = {**result, key: page_items}
+
+                report.pages += 1
+                report.items += len(page_items)
+
+                # Hand the page over; look-ahead pages keep downloading meanwhile
+                yield offset, result
+
+                # Check if there are more pages
+                if not result.get("next"):
+                    self.logger.info(
+                        "Completed %s: %d total items across %d pages",
+                        endpoint, report.items, report.pages
+                    )
+                    report.completed = True
+                    break
+
+                # meta.total went stale (items added mid-sync): the page at the
+                # old end still has "next", so go back to following it
+                if end_offset is not None and offset + limit >= end_offset:
+                    end_offset = None
+
+                # Follow the cursor as returned once offset math stops matching it
+                next_href = result["next"]
+                cursor_offset = _cursor_offset(next_href, endpoint, kwargs)
+                if not cursor_mode and cursor_offset != offset + limit:
+                    self.logger.info(
+                        "%s: next cursor %s does not match offset %d, following cursors from here",
+                        endpoint, truncate_for_log(safe_unicode_str(next_href), 80), offset + limit
+                    )
+                    cursor_mode = True
+                    _cancel_pending_pages(pending)
+                if cursor_mode:
+                    if next_href == last_href:
+                        self.logger.error(
+                            "%s returned the same next cursor twice (%s), stopping",
+                            endpoint, truncate_for_log(safe_unicode_str(next_href), 80)
+                        )
+                        break
+                    last_href = next_href
+                    page_offset = offset + limit if cursor_offset is None else cursor_offset
+                    pending.append((page_offset, asyncio.ensure_future(fetch_cursor(next_href))))
+                    next_offset = page_offset + limit
+
+                # Move to next page
+                page_num += 1
+
+                # Safety check: prevent infinite loops
+                if page_num > MAX_PAGES:  # 10000 pages × 50 = 500k items max
+                    self.logger.error(
+                        "Safety limit reached: %d pages fetched from %s. Stopping.",
+                        page_num, endpoint
+                    )
+                    break
+        finally:
+            # Drop look-ahead requests on completion, abort or consumer break
+            _cancel_pending_pages(pending)
+
+        # Deferred gap repair for pages that failed during the main scan
+        new_failures = report.failed_offsets[repaired_count:]
+        repaired_count = len(report.failed_offsets)
+        if new_failures:
+            async for offset, result in self._repair_page_gaps(
+                endpoint, key, report, seen, new_failures, typed, **kwargs
+            ):
+                yield offset, result
+
+        if report.unscanned_from is None:
+            break
+        if report.gaps:
+            # Still failing after the repair retries: give up on the rest
             self.logger.warning(
-                "Error fetching page %d (offset %d) from %s: %s",
-                page_num, offset, endpoint, truncate_for_log(error_msg)
+                "%s: scan stopped at offset %d and was not resumed; everything "
+                "from there on was never fetched",
+                endpoint, report.unscanned_from
             )
+            break
+        # The repair pass got through, so the outage is over: scan the rest
+        self.logger.info(
+            "%s: resuming scan at offset %d after the repair pass",
+            endpoint, report.unscanned_from
+        )
+        next_offset = report.unscanned_from
+        report.unscanned_from = None
+        consecutive_errors = 0
+
+    if report.duplicates or report.rereads:
+        self.logger.info(
+            "%s changed during sync: %d duplicate(s) removed, %d shift(s) at page "
+            "boundaries, %d window re-read(s) recovering %d item(s)",
+            endpoint, report.duplicates, report.shifts, report.rereads, report.recovered
+        )
+    if seen.full:
+        self.logger.warning(
+            "%s: seen-ID dedup stopped recording after %d items", endpoint, seen.capacity
+        )
 
-            # If it's a 404 with pagination, we've reached the end
-            if "404" in error_msg or "not found" in error_msg.lower():
-                self.logger.info(
-                    "Reached end of %s at page %d (404 response)",
-                    endpoint, page_num
-                )
-                break
 
-            # Stop if too many consecutive errors
-            if consecutive_errors >= max_consecutive_errors:
-                self.logger.error(
-                    "Stopping %s sync after %d consecutive errors",
-                    endpoint, consecutive_errors
+async def _repair_page_gaps(
+    self,
+    endpoint: str,
+    key: str,
+    report: PaginationReport,
+    seen: SeenIdSet | None = None,
+    offsets: list[int] | None = None,
+    typed: bool = False,
+    **kwargs,
+) -> AsyncGenerator[tuple[int, dict], None]:
+    """
+    Retry pages that failed during the main scan, concurrently.
+
+    Each failed offset gets up to GAP_REPAIR_ATTEMPTS tries with jittered
+    exponential backoff (GAP_REPAIR_BACKOFF seconds doubling per attempt),
+    at most GAP_REPAIR_WORKERS at a time. Repaired pages are yielded as
+    soon as they arrive, so one slow page never holds up the others.
+    Offsets that are still missing afterwards are listed in `report.gaps`
+    and logged as the sync's open gaps. With `seen`, items the main scan
+    already yielded are dropped from repaired pages. `offsets` limits the
+    pass to those failed offsets (default: all of report.failed_offsets);
+    `typed` as for _get_pages_streaming().
+    """
+    failed = sorted(set(report.failed_offsets if offsets is None else offsets))
+    report.repairing = True
+    repair_slots = asyncio.Semaphore(GAP_REPAIR_WORKERS)
+    self.logger.info(
+        "Repairing %d failed page(s) of %s: offsets %s", len(failed), endpoint, failed
+    )
+
+    async def repair(offset: int) -> tuple[int, dict | None]:
+        for attempt in range(1, GAP_REPAIR_ATTEMPTS + 1):
+            await asyncio.sleep(GAP_REPAIR_BACKOFF * 2 ** (attempt - 1) * random.uniform(0.5, 1.5))
+            try:
+                async with repair_slots:
+                    result = await self._get_data(
+                        endpoint, typed=typed, **{**kwargs, "limit": PAGE_LIMIT, "offset": offset}
+                    )
+                return offset, result
+            except Exception as exc:
+                self.logger.debug(
+                    "Repair attempt %d/%d for %s offset %d failed: %s",
+                    attempt, GAP_REPAIR_ATTEMPTS, endpoint, offset,
+                    truncate_for_log(safe_unicode_str(str(exc)), 80)
                 )
-                break
+        return offset, None
 
-            # Continue to next page for non-404 errors
-            offset += limit
-            page_num += 1
-            continue
+    tasks = [asyncio.ensure_future(repair(offset)) for offset in failed]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            offset, result = await next_done
+            if result is None:
+                report.gaps.append(offset)
+                continue
+            if key not in result:
+                # Library shrank since the main scan: nothing left there
+                continue
+            if seen is not None:
+                result = {**result, key: _drop_seen_items(result[key], seen, report)}
+            report.pages += 1
+            report.items += len(result[key])
+            yield offset, result
+    finally:
+        for task in tasks:
+            task.cancel()
+        report.repairing = False
+
+    if report.gaps:
+        report.gaps.sort()
+        self.logger.warning(
+            "%s: %d page(s) still missing after repair (offsets %s, up to %d items)",
+            endpoint, len(report.gaps), report.gaps, len(report.gaps) * PAGE_LIMIT
+        )
+    elif report.unscanned_from is not None:
+        self.logger.info(
+            "%s: all %d failed page(s) repaired, offset %d on not scanned yet",
+            endpoint, len(failed), report.unscanned_from
+        )
+    else:
+        self.logger.info("%s: all %d failed page(s) repaired", endpoint, len(failed))
 
-        # Check if response has the expected key
-        if key not in result:
-            self.logger.debug(
-                "No '%s' key in response for %s (offset %d), ending pagination",
-                key, endpoint, offset
-            )
-            break
 
+async def _load_sync_checkpoint(self, checkpoint_key: str) -> tuple[int, int, list[int]]:
+    """
+    Look up a resumable checkpoint for a library sync.
+
+    Returns:
+        (start_offset, items_already_yielded, failed_offsets_to_repair);
+        (0, 0, []) when starting fresh
+    """
+    resume_from = await asyncio.to_thread(self._checkpoint_store.load, checkpoint_key)
+    if not resume_from:
+        return 0, 0, []
+    self.logger.info(
+        "Resuming %s from checkpoint at offset %d (%d items already synced)",
+        resume_from["endpoint"], resume_from["offset"], resume_from.get("items_yielded", 0)
+    )
+    return (
+        resume_from["offset"],
+        resume_from.get("items_yielded", 0),
+        resume_from.get("failed_offsets", []),
+    )
+
+
+async def _save_sync_checkpoint(
+    self,
+    checkpoint_key: str,
+    endpoint: str,
+    offset: int,
+    next_href: str | None,
+    items: int,
+    failed_offsets: list[int],
+) -> None:
+    """Persist how far a library sync got (everything before `offset` is handled)."""
+    await asyncio.to_thread(
+        self._checkpoint_store.save,
+        checkpoint_key,
+        {
+            "endpoint": endpoint,
+            "offset": offset,
+            "next": next_href,
+            "items_yielded": items,
+            "failed_offsets": failed_offsets,
+            "timestamp": time.time(),
+        },
+    )
+
+
+async def _get_all_items_streaming(
+    self,
+    endpoint: str,
+    key: str = "data",
+    prefetch: int = PREFETCH_PAGES,
+    workers: int = 0,
+    checkpoint: bool = False,
+    checkpoint_every: int = CHECKPOINT_EVERY_PAGES,
+    stream_items: bool = False,
+    typed: bool = False,
+    **kwargs,
+) -> AsyncGenerator[dict, None]:
+    """
+    Stream items from a paged API endpoint with Unicode-safe error handling.
+
+    Yields items one-by-one as pages arrive from _get_pages_streaming()
+    (look-ahead, meta.total fan-out, per-page error handling), so memory
+    stays bounded by the page window while items come out in offset order.
+
+    With `checkpoint=True` progress is saved to self._checkpoint_store
+    every `checkpoint_every` pages, once the consumer has pulled the last
+    item of the page (so everything before the checkpoint has been
+    handled). A later call resumes from a recent checkpoint instead of
+    offset 0 and yields only the remaining items; the checkpoint is
+    cleared when the endpoint is exhausted. Consumers that buffer items
+    should pass a `checkpoint_every` that matches their buffer size.
+
+    With `stream_items=True` (opt-in, for endpoints with very large
+    pages) items are instead parsed out of each response while it
+    downloads and yielded before the page has fully arrived; pages are
+    then fetched one after the other without look-ahead or checkpoints
+    (see _stream_all_items()).
+
+    Args:
+        endpoint: API endpoint to call
+        key: JSON key containing items (default: "data")
+        prefetch: Number of pages to keep in flight ahead of the consumer
+        workers: Concurrent page requests in fan-out mode (opt-in)
+        checkpoint: Persist progress and resume interrupted syncs
+        checkpoint_every: Pages between checkpoint writes
+        stream_items: Yield items while each response is still arriving
+        typed: Decode pages into typed structs (see _get_pages_streaming())
+        **kwargs: Additional query parameters
+
+    Yields:
+        Individual items from the paginated response
+    """
+    if stream_items:
+        async for item in self._stream_all_items(endpoint, **kwargs):
+            yield item
+        return
+
+    total_items = 0
+    start_offset = 0
+    repair_offsets: list[int] = []
+    checkpoint_key = SyncCheckpointStore.make_key(endpoint, kwargs)
+
+    # Resume an interrupted sync from its last checkpoint
+    if checkpoint:
+        start_offset, total_items, repair_offsets = await self._load_sync_checkpoint(
+            checkpoint_key
+        )
+
+    report = PaginationReport(endpoint)
+    async for offset, result in self._get_pages_streaming(
+        endpoint, key, prefetch, workers, start_offset, report, repair_offsets,
+        typed=typed, **kwargs
+    ):
         items = result[key]
-        items_in_page = len(items)
+        page_num = offset // PAGE_LIMIT
 
         # Yield items one by one with Unicode safety
         for idx, item in enumerate(items):
@@ -254,252 +1315,709 @@ async def _get_all_items_streaming(
                 continue
 
         # Log progress every 5 pages (250 items)
-        if page_num % 5 == 0 or items_in_page > 0:
+        if page_num % 5 == 0 or items:
             self.logger.info(
                 "%s: page %d, %d items in page, %d total yielded",
-                endpoint.split('/')[-1], page_num, items_in_page, total_items
+                endpoint.split('/')[-1], page_num, len(items), total_items
             )
 
-        # Check if there are more pages
-        if not result.get("next"):
-            self.logger.info(
-                "Completed %s: %d total items across %d pages",
-                endpoint, total_items, page_num + 1
+        # The consumer has handled every item of this page by now
+        if (
+            checkpoint
+            and not report.repairing
+            and result.get("next")
+            and (page_num + 1) % checkpoint_every == 0
+        ):
+            await self._save_sync_checkpoint(
+                checkpoint_key, endpoint, offset + PAGE_LIMIT, result.get("next"),
+                total_items, report.failed_offsets
             )
-            break
-
-        # Move to next page
-        offset += limit
-        page_num += 1
 
-        # Safety check: prevent infinite loops
-        if page_num > 10000:  # 10000 pages × 50 = 500k items max
-            self.logger.error(
-                "Safety limit reached: %d pages fetched from %s. Stopping.",
-                page_num, endpoint
-            )
-            break
+    # Finished (not aborted): the next sync starts from offset 0 again
+    if checkpoint and report.completed:
+        await asyncio.to_thread(self._checkpoint_store.clear, checkpoint_key)
 
 
 # ============================================================================
-# UNICODE-SAFE PARSING METHODS
+# STAGED FETCH -> PARSE -> PERSIST PIPELINE
 # ============================================================================
 
-def _parse_artist(self, artist_obj: dict) -> Artist | None:
+class StageStats:
     """
-    Parse artist object with comprehensive Unicode support.
+    Busy/wait accounting for one pipeline stage.
 
-    Handles all Unicode characters in artist names, descriptions, URLs.
-    Returns None on parse failure to avoid stopping sync.
+    `busy` is time spent doing the stage's own work (awaiting the API for
+    fetch, parsing for parse, the consumer's DB writes for persist).
+    `waiting` is time spent blocked on a neighbouring queue: starved for
+    input or held back by backpressure. A stage with high utilization and
+    neighbours that mostly wait is the bottleneck.
     """
-    try:
-        relationships = artist_obj.get("relationships", {})
 
-        # Extract artist ID and attributes
-        if (
-            artist_obj.get("type") == "library-artists"
-            and relationships.get("catalog", {}).get("data", []) != []
-        ):
-            artist_id = safe_json_get(
-                relationships, "catalog", "data", 0, "id",
-                default=artist_obj.get("id", "unknown")
-            )
-            attributes = safe_json_get(
-                relationships, "catalog", "data", 0, "attributes",
-                default={}
-            )
-        elif "attributes" in artist_obj:
-            artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
-            attributes = artist_obj.get("attributes", {})
-        else:
-            artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
-            self.logger.debug(
-                "No attributes found for artist %s, returning basic mapping",
-                truncate_for_log(artist_id, 50)
-            )
-            # Return basic ItemMapping for artists without full details
-            from music_assistant_models.media_items import ItemMapping, MediaType
-            return ItemMapping(
-                media_type=MediaType.ARTIST,
-                provider=self.lookup_key,
-                item_id=artist_id,
-                name=artist_id,
-            )
+    def __init__(self, name: str, workers: int = 1) -> None:
+        self.name = name
+        self.workers = workers
+        self.busy = 0.0
+        self.waiting = 0.0
+        self.items = 0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the stage's time spent working rather than waiting."""
+        total = self.busy + self.waiting
+        return self.busy / total if total else 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot for logs/diagnostics."""
+        return {
+            "stage": self.name,
+            "workers": self.workers,
+            "items": self.items,
+            "busy_s": round(self.busy, 3),
+            "wait_s": round(self.waiting, 3),
+            "utilization": round(self.utilization, 3),
+        }
+
+    def __str__(self) -> str:
+        return f"{self.name} busy {self.utilization:.0%} ({self.items} items)"
+
+
+async def _run_sync_pipeline(
+    self,
+    endpoint: str,
+    parse_batch: Callable[[list[dict]], Awaitable[list]],
+    pages_per_batch: int = 1,
+    queue_depth: int = PIPELINE_QUEUE_DEPTH,
+    parse_workers: int = PIPELINE_PARSE_WORKERS,
+    checkpoint: bool = False,
+    yield_batches: bool = False,
+    typed: bool = False,
+    page_workers: int = 0,
+    **kwargs,
+) -> AsyncGenerator[Any, None]:
+    """
+    Run a library sync as fetch -> parse -> persist stages.
+
+    Stages are joined by bounded asyncio.Queues of page batches, so the
+    network (fetch), parsing (and any catalog lookups it needs) and the
+    consumer's DB writes (persist, i.e. the code iterating this generator)
+    overlap instead of taking turns. A full queue blocks the stage in front
+    of it, so at most about 2 * queue_depth + parse_workers batches are
+    held in memory regardless of library size.
+
+    Parsed batches are re-ordered before they are yielded, so output order
+    and checkpointing behave exactly as with _get_all_items_streaming():
+    a checkpoint is written only after the consumer has handled a whole
+    batch.
+
+    Per-stage StageStats are logged when the sync ends (and every
+    PIPELINE_STATS_EVERY batches at debug level) and kept in
+    self._sync_stats[endpoint]. The final log line also gives the bytes
+    the endpoint's pages took on the wire and decoded, which is how
+    request profiles (SYNC_REQUEST_PROFILES) compare in practice.
 
-        # Extract name with Unicode safety
-        artist_name = safe_unicode_str(
-            attributes.get("name"),
-            fallback=f"Artist {artist_id}"
-        )
-
-        # Extract URL with Unicode safety (URLs should be ASCII but handle just in case)
-        artist_url = safe_unicode_str(attributes.get("url"), fallback="")
-
-        # Create artist object
-        from music_assistant_models.media_items import Artist, ProviderMapping
-        from music_assistant_models.enums import ImageType
-        from music_assistant_models.media_items import MediaItemImage
-
-        artist = Artist(
-            item_id=artist_id,
-            name=artist_name,
-            provider=self.domain,
-            provider_mappings={
-                ProviderMapping(
-                    item_id=artist_id,
-                    provider_domain=self.domain,
-                    provider_instance=self.instance_id,
-                    url=artist_url if artist_url else None,
-                )
-            },
-        )
+    Args:
+        endpoint: Library endpoint to page through
+        parse_batch: Coroutine turning a list of raw items into parsed
+            media items (responsible for its own per-item error handling)
+        pages_per_batch: Pages grouped into one unit of work
+        queue_depth: Max batches waiting between two stages
+        parse_workers: Concurrent parse stage workers
+        checkpoint: Persist progress and resume interrupted syncs
+        yield_batches: Yield each parsed batch as one list (one DB
+            transaction for the consumer) instead of item by item
+        typed: Decode pages into typed structs (see _get_pages_streaming())
+        page_workers: Concurrent page requests in fan-out mode (default
+            0: no fan-out; see FANOUT_WORKERS)
+        **kwargs: Additional query parameters
 
-        # Extract artwork (handle Unicode in URLs)
-        if artwork := attributes.get("artwork"):
-            try:
-                artwork_url = safe_unicode_str(artwork.get("url", ""))
-                if artwork_url:
-                    # Format URL with dimensions
-                    width = artwork.get("width", 600)
-                    height = artwork.get("height", 600)
-                    formatted_url = artwork_url.format(w=width, h=height)
-
-                    artist.metadata.images = [
-                        MediaItemImage(
-                            type=ImageType.THUMB,
-                            path=formatted_url,
-                            provider=self.lookup_key,
-                            remotely_accessible=True,
-                        )
-                    ]
-            except Exception as exc:
-                # Log but don't fail on artwork issues
-                self.logger.debug(
-                    "Could not process artwork for artist %s: %s",
-                    truncate_for_log(artist_name, 40),
-                    safe_unicode_str(str(exc))
-                )
+    Yields:
+        Parsed media items, or lists of them with yield_batches=True
+    """
+    fetch_stats = StageStats("fetch")
+    parse_stats = StageStats("parse", parse_workers)
+    persist_stats = StageStats("persist")
+    stages = (fetch_stats, parse_stats, persist_stats)
+    raw_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_depth)
+    parsed_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_depth)
+    report = PaginationReport(endpoint)
+
+    checkpoint_key = SyncCheckpointStore.make_key(endpoint, kwargs)
+    start_offset, items_done, repair_offsets = 0, 0, []
+    if checkpoint:
+        start_offset, items_done, repair_offsets = await self._load_sync_checkpoint(
+            checkpoint_key
+        )
+    wire_before, body_before = self._transfer_stats.totals(endpoint)
 
-        # Extract genres (handle Unicode genre names)
-        if genres := attributes.get("genreNames"):
-            try:
-                artist.metadata.genres = {
-                    safe_unicode_str(genre) for genre in genres if genre
-                }
-            except Exception as exc:
-                self.logger.debug(
-                    "Could not process genres for artist %s: %s",
-                    truncate_for_log(artist_name, 40),
-                    safe_unicode_str(str(exc))
-                )
+    async def put_timed(queue: asyncio.Queue, work: Any, stats: StageStats) -> None:
+        started = time.monotonic()
+        await queue.put(work)
+        stats.waiting += time.monotonic() - started
 
-        # Extract editorial notes (handle Unicode descriptions)
-        if notes := attributes.get("editorialNotes"):
+    async def fetch_stage() -> None:
+        seq = 0
+        batch: list[dict] = []
+        pages_in_batch = 0
+        try:
+            started = time.monotonic()
+            async for offset, result in self._get_pages_streaming(
+                endpoint,
+                start_offset=start_offset,
+                report=report,
+                workers=page_workers,
+                typed=typed,
+                repair_offsets=repair_offsets,
+                **kwargs,
+            ):
+                fetch_stats.busy += time.monotonic() - started
+                batch.extend(item for item in result["data"] if item)
+                pages_in_batch += 1
+                if pages_in_batch >= pages_per_batch or not result.get("next"):
+                    fetch_stats.items += len(batch)
+                    # Repaired pages must not move the checkpoint backwards
+                    next_href = None if report.repairing else result.get("next")
+                    work = (seq, batch, offset + PAGE_LIMIT, next_href)
+                    await put_timed(raw_queue, work, fetch_stats)
+                    seq += 1
+                    batch, pages_in_batch = [], 0
+                started = time.monotonic()
+            if batch:
+                fetch_stats.items += len(batch)
+                await put_timed(raw_queue, (seq, batch, None, None), fetch_stats)
+        finally:
+            for _ in range(parse_workers):
+                await raw_queue.put(None)
+
+    async def parse_stage() -> None:
+        while True:
+            started = time.monotonic()
+            work = await raw_queue.get()
+            parse_stats.waiting += time.monotonic() - started
+            if work is None:
+                await parsed_queue.put(None)
+                return
+            seq, items, next_offset, next_href = work
+            started = time.monotonic()
             try:
-                description = (
-                    safe_unicode_str(notes.get("standard")) or
-                    safe_unicode_str(notes.get("short"))
-                )
-                if description:
-                    artist.metadata.description = description
+                parsed = await parse_batch(items)
             except Exception as exc:
-                self.logger.debug(
-                    "Could not process editorial notes for artist %s: %s",
-                    truncate_for_log(artist_name, 40),
-                    safe_unicode_str(str(exc))
+                self.logger.warning(
+                    "Error parsing batch %d from %s (%d items skipped): %s",
+                    seq, endpoint, len(items), truncate_for_log(safe_unicode_str(str(exc)), 80)
                 )
+                parsed = []
+            parse_stats.busy += time.monotonic() - started
+            parse_stats.items += len(items)
+            await put_timed(parsed_queue, (seq, parsed, next_offset, next_href, len(items)), parse_stats)
+
+    tasks = [asyncio.ensure_future(fetch_stage())]
+    tasks += [asyncio.ensure_future(parse_stage()) for _ in range(parse_workers)]
+    out_of_order: dict[int, tuple] = {}
+    next_seq = 0
+    finished_workers = 0
+    pages_since_checkpoint = 0
 
-        return artist
+    try:
+        while finished_workers < parse_workers:
+            started = time.monotonic()
+            work = await parsed_queue.get()
+            persist_stats.waiting += time.monotonic() - started
+            if work is None:
+                finished_workers += 1
+                continue
+            out_of_order[work[0]] = work
+
+            # Persist batches strictly in fetch order
+            while next_seq in out_of_order:
+                _seq, parsed, next_offset, next_href, raw_count = out_of_order.pop(next_seq)
+                next_seq += 1
+                if yield_batches:
+                    started = time.monotonic()
+                    yield parsed
+                    persist_stats.busy += time.monotonic() - started
+                    persist_stats.items += len(parsed)
+                else:
+                    for media_item in parsed:
+                        started = time.monotonic()
+                        yield media_item
+                        persist_stats.busy += time.monotonic() - started
+                        persist_stats.items += 1
+                items_done += raw_count
+
+                pages_since_checkpoint += pages_per_batch
+                if checkpoint and next_href and pages_since_checkpoint >= CHECKPOINT_EVERY_PAGES:
+                    await self._save_sync_checkpoint(
+                        checkpoint_key, endpoint, next_offset, next_href, items_done,
+                        report.failed_offsets
+                    )
+                    pages_since_checkpoint = 0
+                if next_seq % PIPELINE_STATS_EVERY == 0:
+                    self.logger.debug(
+                        "%s pipeline: %s", endpoint, " | ".join(str(s) for s in stages)
+                    )
 
-    except Exception as exc:
-        # Comprehensive error logging
-        artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
-        artist_name = safe_json_get(
-            artist_obj, "attributes", "name",
-            default=safe_json_get(
-                artist_obj, "relationships", "catalog", "data", 0, "attributes", "name",
-                default="Unknown"
-            )
+        # Surface unexpected stage failures (fetch errors are handled inside)
+        await asyncio.gather(*tasks)
+        if checkpoint and report.completed:
+            await asyncio.to_thread(self._checkpoint_store.clear, checkpoint_key)
+    finally:
+        for task in tasks:
+            task.cancel()
+        self._sync_stats[endpoint] = [s.stats() for s in stages]
+        wire_after, body_after = self._transfer_stats.totals(endpoint)
+        self.logger.info(
+            "%s pipeline finished: %s | %d KiB received, %d KiB decoded%s%s",
+            endpoint,
+            " | ".join(str(s) for s in stages),
+            (wire_after - wire_before) // 1024,
+            (body_after - body_before) // 1024,
+            f" | open gaps at offsets {report.gaps}" if report.gaps else "",
+            f" | never fetched from offset {report.unscanned_from} on"
+            if report.unscanned_from is not None else "",
         )
 
-        self.logger.error(
-            "Failed to parse artist (id=%s, name=%s): %s",
-            truncate_for_log(artist_id, 30),
-            truncate_for_log(safe_unicode_str(artist_name), 50),
-            truncate_for_log(safe_unicode_str(str(exc)), 100)
-        )
 
-        # Return None to skip this artist and continue sync
+# ============================================================================
+# PRECOMPILED PARSE PLANS
+# ============================================================================
+
+# Declarative field maps: output field -> key path. RESOURCE_SOURCE_PLAN
+# reads what decides which object a library item is parsed from (its
+# catalog resource when it has one); the per-type plans read the
+# attributes of that object. compile_field_reader() turns each map into
+# one function when the module loads.
+RESOURCE_SOURCE_PLAN: dict[str, tuple] = {
+    "type": ("type",),
+    "id": ("id",),
+    "attributes": ("attributes",),
+    "catalog_id": ("relationships", "catalog", "data", 0, "id"),
+    "catalog_attributes": ("relationships", "catalog", "data", 0, "attributes"),
+}
+ARTIST_PARSE_PLAN: dict[str, tuple] = {
+    "name": ("name",),
+    "url": ("url",),
+    "artwork_url": ("artwork", "url"),
+    "artwork_width": ("artwork", "width"),
+    "artwork_height": ("artwork", "height"),
+    "genres": ("genreNames",),
+    "notes_standard": ("editorialNotes", "standard"),
+    "notes_short": ("editorialNotes", "short"),
+}
+
+# Raised by a subscript chain that runs into a missing key, a short list,
+# None or a value of another shape
+_PLAN_MISSING = (KeyError, IndexError, TypeError)
+
+
+def compile_field_reader(plan: dict[str, tuple], name: str = "read_fields") -> Callable[[Any], tuple]:
+    """
+    Compile a field map into one function returning the fields as a tuple.
+
+    Every path becomes a plain subscript chain (obj["a"]["b"][0]) in
+    generated source, so reading a field costs a few subscripts instead of
+    a safe_json_get() call walking the path; a field that is missing, null
+    or of the wrong shape anywhere along its path reads as None. Works on
+    dicts and on the typed structs alike. Values come back in plan order.
+    """
+    lines = [f"def {name}(obj):"]
+    for idx, path in enumerate(plan.values()):
+        chain = "".join(f"[{key!r}]" for key in path)
+        lines += [
+            "    try:",
+            f"        v{idx} = obj{chain}",
+            "    except _PLAN_MISSING:",
+            f"        v{idx} = None",
+        ]
+    lines.append(f"    return ({''.join(f'v{idx}, ' for idx in range(len(plan)))})")
+    namespace: dict[str, Any] = {"_PLAN_MISSING": _PLAN_MISSING}
+    exec(compile("\n".join(lines), f"<parse plan {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_read_resource_source = compile_field_reader(RESOURCE_SOURCE_PLAN, "read_resource_source")
+_read_artist_fields = compile_field_reader(ARTIST_PARSE_PLAN, "read_artist_fields")
+
+
+def _artwork_path(url: Any, width: Any, height: Any) -> str | None:
+    """Artwork URL with its {w}x{h} template filled in (600 when unknown)."""
+    if not url:
+        return None
+    try:
+        path = safe_unicode_str(url).format(
+            w=600 if width is None else width, h=600 if height is None else height
+        )
+    except (AttributeError, KeyError, IndexError, ValueError):
+        # Template with other placeholders: no image rather than no artist
         return None
+    pool = _active_string_pool.get()
+    return path if pool is None else pool.intern(path)
 
 
 # ============================================================================
-# UNICODE-SAFE LIBRARY METHODS
+# BATCH PARSING
 # ============================================================================
 
-async def get_library_artists(self) -> AsyncGenerator[Artist, None]:
-    """
-    Retrieve library artists with Unicode-safe streaming pagination.
+@dataclass(frozen=True)
+class ParseContext:
+    """Provider values every parsed item needs, looked up once per batch."""
 
-    Handles artists with any Unicode characters in their names (diacritics,
-    CJK characters, emoji, etc.) without stopping the sync.
-    """
-    endpoint = "me/library/artists"
-    processed_count = 0
-    error_count = 0
+    domain: str
+    instance_id: str
+    lookup_key: str
+    artist_type: MediaType = MediaType.ARTIST
+    thumb_type: ImageType = ImageType.THUMB
+    # Whether per-item debug lines are worth formatting at all
+    debug: bool = False
 
-    try:
-        async for item in self._get_all_items_streaming(
-            endpoint, include="catalog", extend="editorialNotes"
-        ):
-            if not item or not item.get("id"):
-                continue
 
-            try:
-                # Parse artist with Unicode safety
-                artist = self._parse_artist(item)
-
-                if artist:
-                    processed_count += 1
-
-                    # Log progress for artists with non-ASCII names (useful for debugging)
-                    artist_name = getattr(artist, 'name', 'Unknown')
-                    if any(ord(char) > 127 for char in artist_name):
-                        self.logger.debug(
-                            "Processed artist with Unicode characters: %s (id=%s)",
-                            truncate_for_log(artist_name, 60),
-                            truncate_for_log(getattr(artist, 'item_id', 'unknown'), 30)
-                        )
+def _parse_context(self) -> ParseContext:
+    """Snapshot of the provider values the parsers read."""
+    return ParseContext(
+        domain=self.domain,
+        instance_id=self.instance_id,
+        lookup_key=self.lookup_key,
+        debug=self.logger.isEnabledFor(logging.DEBUG),
+    )
 
-                    yield artist
-                else:
-                    # _parse_artist returned None (parse failed)
-                    error_count += 1
 
-            except Exception as exc:
-                # Log parsing errors but continue with other artists
-                error_count += 1
-                item_id = safe_unicode_str(item.get("id", "unknown"))
-                item_name = safe_json_get(
-                    item, "attributes", "name",
-                    default=safe_json_get(
-                        item, "relationships", "catalog", "data", 0, "attributes", "name",
-                        default="Unknown"
-                    )
-                )
+@dataclass
+class ParseReport:
+    """
+    Outcome of parsing one or more pages with a _parse_*_batch() method.
 
-                self.logger.warning(
-                    "Error parsing artist %s (%s): %s. Continuing sync...",
-                    truncate_for_log(safe_unicode_str(item_name), 50),
-                    truncate_for_log(item_id, 30),
-                    truncate_for_log(safe_unicode_str(str(exc)), 80)
+    Failures are counted per exception type and only the first
+    PARSE_ERROR_SAMPLES are kept in full, so a page where every item
+    fails the same way logs one line instead of fifty.
+    """
+
+    kind: str
+    parsed: int = 0
+    # Items without an ID, or that the parser dropped (returned None)
+    skipped: int = 0
+    failed: int = 0
+    error_types: dict[str, int] = field(default_factory=dict)
+    samples: list[tuple[str, str, str]] = field(default_factory=list)
+
+    def record_failure(self, item: Any, exc: Exception) -> None:
+        self.failed += 1
+        exc_type = type(exc).__name__
+        self.error_types[exc_type] = self.error_types.get(exc_type, 0) + 1
+        if len(self.samples) < PARSE_ERROR_SAMPLES:
+            item_name = safe_json_get(
+                item, "attributes", "name",
+                default=safe_json_get(
+                    item, "relationships", "catalog", "data", 0, "attributes", "name",
+                    default="Unknown"
                 )
+            )
+            self.samples.append((
+                truncate_for_log(safe_unicode_str(safe_json_get(item, "id", default="unknown")), 30),
+                truncate_for_log(safe_unicode_str(item_name), 50),
+                truncate_for_log(safe_unicode_str(str(exc)), 80),
+            ))
+
+    def __str__(self) -> str:
+        text = f"{self.kind}: {self.parsed} parsed, {self.skipped} skipped, {self.failed} failed"
+        if self.failed:
+            text += " (" + ", ".join(f"{n}x {t}" for t, n in self.error_types.items()) + ")"
+            text += "; e.g. " + "; ".join(
+                f"{name} ({item_id}): {message}" for item_id, name, message in self.samples
+            )
+        return text
 
-        # Log final summary
+
+def _finish_parse_batch(self, report: ParseReport, failed_before: int) -> ParseReport:
+    """Log the failures a batch added to `report` (one line) and return it."""
+    if report.failed > failed_before:
+        self.logger.warning(
+            "Parse errors in %d %s, continuing sync. %s",
+            report.failed - failed_before, report.kind, report
+        )
+    return report
+
+
+def _parse_artists_batch(
+    self,
+    items: list[dict],
+    report: ParseReport | None = None,
+    strings: StringPool | None = None,
+) -> tuple[list[Artist | ItemMapping], ParseReport]:
+    """
+    Parse a whole page (or several) of artist objects.
+
+    Provider values are looked up once for the batch (ParseContext) and
+    each item goes straight to _build_artist(); a failing item is counted
+    in the returned report rather than logged on its own, and the batch
+    logs one warning line if anything failed. Pass `report` to keep
+    adding to the counts of earlier batches, and the sync's `strings`
+    pool to intern the strings of the parsed items (see StringPool).
+    `items` must come from the API (_get_data() and friends): with
+    PAYLOAD_NFC their strings are taken as already normalized.
+    """
+    if report is None:
+        report = ParseReport("artists")
+    failed_before = report.failed
+    ctx = self._parse_context()
+    build = self._build_artist
+    artists = []
+    append = artists.append
+    with interning(strings), normalized_strings(PAYLOAD_NFC):
+        for item in items:
+            if not item.get("id"):
+                report.skipped += 1
+                continue
+            try:
+                append(build(item, ctx))
+            except Exception as exc:
+                report.record_failure(item, exc)
+    report.parsed += len(artists)
+    return artists, self._finish_parse_batch(report, failed_before)
+
+
+def _parse_albums_batch(
+    self,
+    items: list[dict],
+    report: ParseReport | None = None,
+    strings: StringPool | None = None,
+) -> tuple[list[Album], ParseReport]:
+    """
+    Parse a whole page of album objects; as _parse_artists_batch().
+
+    Albums the parser returns None for (unavailable in the storefront)
+    count as skipped, not failed.
+    """
+    if report is None:
+        report = ParseReport("albums")
+    failed_before = report.failed
+    parse = self._parse_album
+    albums = []
+    with interning(strings), normalized_strings(PAYLOAD_NFC):
+        for item in items:
+            if not item.get("id"):
+                report.skipped += 1
+                continue
+            try:
+                album = parse(item)
+            except Exception as exc:
+                report.record_failure(item, exc)
+                continue
+            if album:
+                albums.append(album)
+            else:
+                report.skipped += 1
+    report.parsed += len(albums)
+    return albums, self._finish_parse_batch(report, failed_before)
+
+
+def _parse_tracks_batch(
+    self,
+    items: list[dict],
+    report: ParseReport | None = None,
+    strings: StringPool | None = None,
+) -> tuple[list[Track], ParseReport]:
+    """
+    Parse a whole page of library or catalog song objects; as
+    _parse_albums_batch().
+    """
+    if report is None:
+        report = ParseReport("tracks")
+    failed_before = report.failed
+    parse = self._parse_track
+    tracks = []
+    with interning(strings), normalized_strings(PAYLOAD_NFC):
+        for item in items:
+            try:
+                track = parse(item)
+            except Exception as exc:
+                report.record_failure(item, exc)
+                continue
+            if track:
+                tracks.append(track)
+            else:
+                report.skipped += 1
+    report.parsed += len(tracks)
+    return tracks, self._finish_parse_batch(report, failed_before)
+
+
+# ============================================================================
+# UNICODE-SAFE PARSING METHODS
+# ============================================================================
+
+def _build_artist(self, artist_obj: dict, ctx: ParseContext) -> Artist | ItemMapping:
+    """
+    Build the Artist (or a basic ItemMapping) for one artist object.
+
+    Fields are read by the precompiled ARTIST_PARSE_PLAN reader; provider
+    values come from `ctx`. Raises on a malformed object: the caller
+    decides how a failure is reported (_parse_artist() logs it,
+    _parse_artists_batch() counts it).
+    """
+    res_type, res_id, attributes, catalog_id, catalog_attributes = (
+        _read_resource_source(artist_obj)
+    )
+
+    # Library artist with a catalog match: parse the catalog resource
+    if res_type == "library-artists" and (catalog_id is not None or catalog_attributes is not None):
+        artist_id = res_id if catalog_id is None else catalog_id
+        if artist_id is None:
+            artist_id = "unknown"
+        attributes = catalog_attributes or {}
+    else:
+        artist_id = safe_unicode_str(res_id, fallback="unknown")
+        if attributes is None:
+            if ctx.debug:
+                self.logger.debug(
+                    "No attributes found for artist %s, returning basic mapping",
+                    truncate_for_log(artist_id, 50)
+                )
+            # Return basic ItemMapping for artists without full details
+            return ItemMapping(
+                media_type=ctx.artist_type,
+                provider=ctx.lookup_key,
+                item_id=artist_id,
+                name=artist_id,
+            )
+
+    name, url, artwork_url, width, height, genres, notes_standard, notes_short = (
+        _read_artist_fields(attributes)
+    )
+    artist_url = safe_unicode_str(url)
+    artist = Artist(
+        item_id=artist_id,
+        name=safe_unicode_str(name, fallback=f"Artist {artist_id}"),
+        provider=ctx.domain,
+        provider_mappings={
+            ProviderMapping(
+                item_id=artist_id,
+                provider_domain=ctx.domain,
+                provider_instance=ctx.instance_id,
+                url=artist_url if artist_url else None,
+            )
+        },
+    )
+    if image_path := _artwork_path(artwork_url, width, height):
+        artist.metadata.images = [
+            MediaItemImage(
+                type=ctx.thumb_type,
+                path=image_path,
+                provider=ctx.lookup_key,
+                remotely_accessible=True,
+            )
+        ]
+    if genres:
+        # A set of its own per item (metadata merges update it in place);
+        # the names in it are pooled by safe_unicode_str()
+        artist.metadata.genres = {safe_unicode_str(genre) for genre in genres if genre}
+    if description := safe_unicode_str(notes_standard) or safe_unicode_str(notes_short):
+        artist.metadata.description = description
+    return artist
+
+
+def _parse_artist(self, artist_obj: dict) -> Artist | ItemMapping | None:
+    """
+    Parse artist object with comprehensive Unicode support.
+
+    Handles all Unicode characters in artist names, descriptions, URLs.
+    Returns None on parse failure to avoid stopping sync. Whole pages go
+    through _parse_artists_batch() instead.
+    """
+    try:
+        return self._build_artist(artist_obj, self._parse_context())
+    except Exception as exc:
+        # Comprehensive error logging
+        artist_id = safe_unicode_str(safe_json_get(artist_obj, "id", default="unknown"))
+        artist_name = safe_json_get(
+            artist_obj, "attributes", "name",
+            default=safe_json_get(
+                artist_obj, "relationships", "catalog", "data", 0, "attributes", "name",
+                default="Unknown"
+            )
+        )
+
+        self.logger.error(
+            "Failed to parse artist (id=%s, name=%s): %s",
+            truncate_for_log(artist_id, 30),
+            truncate_for_log(safe_unicode_str(artist_name), 50),
+            truncate_for_log(safe_unicode_str(str(exc)), 100)
+        )
+
+        # Return None to skip this artist and continue sync
+        return None
+
+
+# ============================================================================
+# UNICODE-SAFE LIBRARY METHODS
+# ============================================================================
+
+def sync_request_params(phase: str, profile: str | None = None) -> dict[str, str]:
+    """
+    Query parameters for one library sync phase under a request profile.
+
+    `phase` is a key of the SYNC_REQUEST_PROFILES entries ("artists",
+    "albums", "songs", "catalog_songs", "playlists"); `profile` defaults
+    to SYNC_REQUEST_PROFILE. Returns a copy the caller may extend.
+    """
+    profile = profile or SYNC_REQUEST_PROFILE
+    if profile not in SYNC_REQUEST_PROFILES:
+        raise ValueError(f"Unknown sync request profile: {profile}")
+    return dict(SYNC_REQUEST_PROFILES[profile][phase])
+
+
+async def get_library_artists_batched(
+    self,
+    batch_size: int = DB_TRANSACTION_SIZE,
+    profile: str | None = None,
+    checkpoint: bool = False,
+    page_workers: int = 0,
+) -> AsyncGenerator[list[Artist], None]:
+    """
+    Retrieve library artists in lists sized for one DB transaction each.
+
+    Batch-native sync path: pages are grouped into batches of about
+    `batch_size` items (rounded up to whole pages), each batch is parsed
+    in one go by the pipeline's parse stage and yielded as a single list,
+    so the consumer can upsert it in one transaction. Handles artists with
+    any Unicode characters in their names without stopping the sync.
+
+    `profile` picks the SYNC_REQUEST_PROFILES entry the requests use
+    (default SYNC_REQUEST_PROFILE). `checkpoint=True` resumes an
+    interrupted sync from its saved checkpoint (see
+    _get_all_items_streaming()). A resumed sync yields only the items
+    after the checkpoint, so only a consumer that does not remove library
+    items missing from the sync may turn it on. `page_workers` (e.g.
+    FANOUT_WORKERS) requests pages side by side once meta.total is known;
+    off by default for the same reason, since pages fetched together can
+    miss items moved by library changes during the sync.
+    """
+    endpoint = "me/library/artists"
+    processed_count = 0
+    report = ParseReport("artists")
+    strings = StringPool() if SYNC_STRING_INTERNING else None
+
+    async def parse_page(items: list[dict]) -> list[Artist]:
+        return self._parse_artists_batch(items, report, strings)[0]
+
+    try:
+        async for batch in self._run_sync_pipeline(
+            endpoint,
+            parse_page,
+            pages_per_batch=-(-batch_size // PAGE_LIMIT),
+            checkpoint=checkpoint,
+            yield_batches=True,
+            typed=True,
+            page_workers=page_workers,
+            **sync_request_params("artists", profile),
+        ):
+            processed_count += len(batch)
+            yield batch
+
+        # Log final summary
         self.logger.info(
             "Library artists sync complete: %d artists processed, %d errors skipped",
-            processed_count, error_count
+            processed_count, report.failed
         )
+        if strings is not None:
+            self.logger.debug("Library artists sync string pool: %s", strings)
 
     except Exception as exc:
         # Log critical errors but don't crash
@@ -510,79 +2028,222 @@ async def get_library_artists(self) -> AsyncGenerator[Artist, None]:
         )
 
 
-async def get_library_albums(self) -> AsyncGenerator[Album, None]:
+async def get_library_artists(self) -> AsyncGenerator[Artist, None]:
     """
-    Retrieve library albums with Unicode-safe streaming pagination.
+    Retrieve library artists with Unicode-safe streaming pagination.
 
-    Handles albums/artists with Unicode characters without stopping sync.
+    Item-by-item view of get_library_artists_batched() for consumers that
+    still persist one artist at a time.
+    """
+    async for batch in self.get_library_artists_batched():
+        for artist in batch:
+            # Log progress for artists with non-ASCII names (useful for debugging)
+            artist_name = getattr(artist, 'name', 'Unknown')
+            if any(ord(char) > 127 for char in artist_name):
+                self.logger.debug(
+                    "Processed artist with Unicode characters: %s (id=%s)",
+                    truncate_for_log(artist_name, 60),
+                    truncate_for_log(getattr(artist, 'item_id', 'unknown'), 30)
+                )
+
+            yield artist
+
+
+async def get_library_albums_batched(
+    self,
+    batch_size: int = DB_TRANSACTION_SIZE,
+    profile: str | None = None,
+    checkpoint: bool = False,
+    page_workers: int = 0,
+) -> AsyncGenerator[list[Album], None]:
+    """
+    Retrieve library albums in lists sized for one DB transaction each.
+
+    Same batch-native path (and `profile`, `checkpoint` and `page_workers`
+    choices) as get_library_artists_batched(). Handles albums/artists with
+    Unicode characters without stopping sync.
     """
     endpoint = "me/library/albums"
     processed_count = 0
-    error_count = 0
+    report = ParseReport("albums")
+    strings = StringPool() if SYNC_STRING_INTERNING else None
+
+    async def parse_page(items: list[dict]) -> list[Album]:
+        return self._parse_albums_batch(items, report, strings)[0]
 
     try:
-        async for item in self._get_all_items_streaming(
-            endpoint, include="catalog,artists", extend="editorialNotes"
+        async for batch in self._run_sync_pipeline(
+            endpoint,
+            parse_page,
+            pages_per_batch=-(-batch_size // PAGE_LIMIT),
+            checkpoint=checkpoint,
+            yield_batches=True,
+            typed=True,
+            page_workers=page_workers,
+            **sync_request_params("albums", profile),
         ):
-            if not item or not item.get("id"):
-                continue
+            processed_count += len(batch)
+            yield batch
 
-            try:
-                album = self._parse_album(item)
+        self.logger.info(
+            "Library albums sync complete: %d albums processed, %d errors skipped",
+            processed_count, report.failed
+        )
+        if strings is not None:
+            self.logger.debug("Library albums sync string pool: %s", strings)
 
-                if album:  # _parse_album can return None for unavailable albums
-                    processed_count += 1
+    except Exception as exc:
+        self.logger.error(
+            "Critical error during library albums sync: %s. Processed %d albums before error.",
+            truncate_for_log(safe_unicode_str(str(exc)), 100),
+            processed_count
+        )
 
-                    # Log albums with Unicode characters for debugging
-                    album_name = getattr(album, 'name', 'Unknown')
-                    if any(ord(char) > 127 for char in album_name):
-                        self.logger.debug(
-                            "Processed album with Unicode characters: %s",
-                            truncate_for_log(album_name, 60)
-                        )
 
-                    yield album
+async def get_library_albums(self) -> AsyncGenerator[Album, None]:
+    """
+    Retrieve library albums with Unicode-safe streaming pagination.
 
-            except Exception as exc:
-                error_count += 1
-                item_id = safe_unicode_str(item.get("id", "unknown"))
-                item_name = safe_json_get(
-                    item, "attributes", "name",
-                    default="Unknown"
+    Item-by-item view of get_library_albums_batched().
+    """
+    async for batch in self.get_library_albums_batched():
+        for album in batch:
+            # Log albums with Unicode characters for debugging
+            album_name = getattr(album, 'name', 'Unknown')
+            if any(ord(char) > 127 for char in album_name):
+                self.logger.debug(
+                    "Processed album with Unicode characters: %s",
+                    truncate_for_log(album_name, 60)
                 )
 
+            yield album
+
+
+async def get_library_tracks_batched(
+    self,
+    batch_size: int = DB_TRANSACTION_SIZE,
+    stream_catalog: bool = False,
+    profile: str | None = None,
+    checkpoint: bool = False,
+    page_workers: int = 0,
+) -> AsyncGenerator[list[Track], None]:
+    """
+    Retrieve library tracks in lists sized for one DB transaction each.
+
+    The parse stage of the sync pipeline looks up each batch's catalog IDs
+    with ids= calls of at most CATALOG_BATCH_SIZE (200 is the
+    documented-safe catalog batch, 300 results in 504 timeouts) while the
+    next batch is already being fetched; library-only songs without a
+    catalog ID are parsed directly. With `stream_catalog=True`
+    catalog songs are parsed chunk by chunk as their bytes arrive instead
+    of after the whole (several hundred KB) batch response is in. Every
+    page and chunk goes through _parse_tracks_batch(). `profile` as for
+    get_library_artists_batched() (library and catalog requests alike),
+    and `checkpoint` and `page_workers` too.
+    """
+    endpoint = "me/library/songs"
+    catalog_endpoint = f"catalog/{self._storefront}/songs"
+    catalog_params = sync_request_params("catalog_songs", profile)
+    processed_count = 0
+    # Catalog songs lost to failed ids= lookups; parse failures are in `report`
+    error_count = 0
+    report = ParseReport("tracks")
+    strings = StringPool() if SYNC_STRING_INTERNING else None
+
+    async def parse_page(items: list[dict]) -> list[Track]:
+        nonlocal error_count
+        catalog_ids = []
+        library_only = []
+        for item in items:
+            if catalog_id := safe_json_get(item, "attributes", "playParams", "catalogId"):
+                catalog_ids.append(catalog_id)
+            else:
+                # Library-only song (uploaded/matched), not in the catalog
+                library_only.append(item)
+        tracks = self._parse_tracks_batch(library_only, report, strings)[0]
+
+        for start in range(0, len(catalog_ids), CATALOG_BATCH_SIZE):
+            chunk = catalog_ids[start:start + CATALOG_BATCH_SIZE]
+            received = 0
+            try:
+                if stream_catalog:
+                    async for catalog_songs in self._stream_catalog_batches(
+                        catalog_endpoint, chunk, **catalog_params
+                    ):
+                        received += len(catalog_songs)
+                        tracks += self._parse_tracks_batch(catalog_songs, report, strings)[0]
+                    continue
+                response = await self._get_catalog_data(
+                    catalog_endpoint, ids=",".join(chunk), typed=True, **catalog_params
+                )
+            except Exception as exc:
+                error_count += len(chunk) - received
                 self.logger.warning(
-                    "Error parsing album %s (%s): %s. Continuing sync...",
-                    truncate_for_log(safe_unicode_str(item_name), 50),
-                    truncate_for_log(item_id, 30),
-                    truncate_for_log(safe_unicode_str(str(exc)), 80)
+                    "Error fetching catalog batch of %d songs: %s",
+                    len(chunk), truncate_for_log(safe_unicode_str(str(exc)), 80)
                 )
+                continue
+            tracks += self._parse_tracks_batch(response.get("data", []), report, strings)[0]
+        return tracks
+
+    try:
+        async for batch in self._run_sync_pipeline(
+            endpoint,
+            parse_page,
+            pages_per_batch=-(-batch_size // PAGE_LIMIT),
+            checkpoint=checkpoint,
+            yield_batches=True,
+            typed=True,
+            page_workers=page_workers,
+            **sync_request_params("songs", profile),
+        ):
+            processed_count += len(batch)
+            yield batch
 
         self.logger.info(
-            "Library albums sync complete: %d albums processed, %d errors skipped",
-            processed_count, error_count
+            "Library tracks sync complete: %d tracks processed, %d errors skipped",
+            processed_count, report.failed + error_count
         )
+        if strings is not None:
+            self.logger.debug("Library tracks sync string pool: %s", strings)
 
     except Exception as exc:
         self.logger.error(
-            "Critical error during library albums sync: %s. Processed %d albums before error.",
+            "Critical error during library tracks sync: %s. Processed %d tracks before error.",
             truncate_for_log(safe_unicode_str(str(exc)), 100),
             processed_count
         )
 
 
-async def get_library_playlists(self) -> AsyncGenerator[Playlist, None]:
+async def get_library_tracks(self) -> AsyncGenerator[Track, None]:
+    """
+    Retrieve library tracks with Unicode-safe streaming pagination.
+
+    Item-by-item view of get_library_tracks_batched().
+    """
+    async for batch in self.get_library_tracks_batched():
+        for track in batch:
+            yield track
+
+
+async def get_library_playlists(
+    self, profile: str | None = None, checkpoint: bool = False
+) -> AsyncGenerator[Playlist, None]:
     """
     Retrieve playlists with Unicode-safe streaming pagination.
 
     Handles playlists with Unicode characters in names/descriptions.
+    `profile` and `checkpoint` as for get_library_artists_batched().
     """
     endpoint = "me/library/playlists"
     processed_count = 0
     error_count = 0
 
     try:
-        async for item in self._get_all_items_streaming(endpoint):
+        async for item in self._get_all_items_streaming(
+            endpoint, checkpoint=checkpoint, typed=True,
+            **sync_request_params("playlists", profile)
+        ):
             try:
                 # Prefer catalog information over library for public playlists
                 if item.get("attributes", {}).get("hasCatalog"):
@@ -591,7 +2252,12 @@ async def get_library_playlists(self) -> AsyncGenerator[Playlist, None]:
                         default=None
                     )
                     if global_id:
-                        playlist = await self.get_playlist(global_id)
+                        # Same lookup as get_playlist(), but through the
+                        # catalog cache and loader
+                        response = await self._get_catalog_data(
+                            f"catalog/{self._storefront}/playlists/{global_id}"
+                        )
+                        playlist = self._parse_playlist(response["data"][0])
                         if playlist:
                             processed_count += 1
                             yield playlist
@@ -636,6 +2302,31 @@ async def get_library_playlists(self) -> AsyncGenerator[Playlist, None]:
         )
 
 
+
+async def get_editorial_notes(self, res_type: str, catalog_id: str) -> str | None:
+    """
+    Editorial notes of a catalog artist/album/playlist, fetched on demand.
+
+    The "lean" sync profile leaves editorialNotes out of library pages;
+    metadata enrichment asks for them here instead. Lookups go through
+    _get_catalog_data(), so they are cached and concurrent ones are
+    batched into one ids= request per type.
+    """
+    try:
+        result = await self._get_catalog_data(
+            f"catalog/{self._storefront}/{res_type}/{catalog_id}",
+            extend="editorialNotes",
+            **{f"fields[{res_type}]": "editorialNotes"},
+        )
+    except Exception as exc:
+        self.logger.debug(
+            "No editorial notes for %s %s: %s",
+            res_type, catalog_id, truncate_for_log(safe_unicode_str(str(exc)), 80)
+        )
+        return None
+    notes = safe_json_get(result, "data", 0, "attributes", "editorialNotes", default={})
+    return safe_unicode_str(notes.get("standard")) or safe_unicode_str(notes.get("short")) or None
+
 # ============================================================================
 # ENHANCED JSON LOADING WITH UTF-8 VALIDATION
 # ============================================================================
@@ -683,77 +2374,1847 @@ def json_loads_safe(text: str) -> dict:
             raise
 
 
+def json_loads_fast(content: bytes | str) -> Any:
+    """
+    Parse a JSON response body straight from bytes.
+
+    Uses orjson when it is installed (Music Assistant ships it) and the
+    stdlib json module otherwise; both accept UTF-8 bytes directly, so no
+    intermediate str copy of the body is made.
+
+    Raises:
+        UnicodeDecodeError: The body is not valid UTF-8, so the caller
+            can recover from the bytes it already holds
+        ValueError: The body is not valid JSON
+    """
+    if orjson is None:
+        return json.loads(content)
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # orjson reports invalid UTF-8 as a JSON error; tell them apart
+        # (only on this rare path) so the caller can recover
+        if isinstance(content, bytes):
+            content.decode("utf-8")
+        raise
+
+
+# A \uXXXX escape of a non-ASCII character, or of an ASCII one followed
+# by a non-ASCII character (say a combining mark): text-level
+# normalization cannot see the character the escape stands for
+_NON_ASCII_ESCAPE = re.compile(r"\\u(?!00[0-7][0-9a-fA-F](?:[\x00-\x7f]|$))")
+
+
+def json_needs_nfc(content: bytes | str) -> bool:
+    """
+    Whether some string in a JSON document is not in NFC.
+
+    One pass over the text decides for the whole document: JSON syntax is
+    ASCII and composes with nothing, so the text is in NFC exactly when
+    every string in it is. An ASCII body needs no decoding to tell.
+    Otherwise is_normalized() checks NFC_CHECK_SLICE characters at a time
+    (each slice starting one character early, so a base character and
+    the combining mark after it are never checked apart) and the first
+    failing slice answers: on a decomposed string is_normalized() has to
+    compose its input, which for a whole catalog batch costs more than
+    normalizing its strings.
+    Characters written as \\u escapes only exist once parsed, so a body
+    with a non-ASCII escape always answers True. Invalid UTF-8 answers
+    False and is left to the caller's fallback.
+    """
+    escaped = (b"\\u" if isinstance(content, bytes) else "\\u") in content
+    if not escaped and content.isascii():
+        return False
+    try:
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+    except UnicodeDecodeError:
+        return False
+    if escaped and _NON_ASCII_ESCAPE.search(text):
+        return True
+    if text.isascii():
+        return False
+    for start in range(0, len(text), NFC_CHECK_SLICE):
+        if not unicodedata.is_normalized("NFC", text[max(start - 1, 0):start + NFC_CHECK_SLICE]):
+            return True
+    return False
+
+
+def nfc_strings(value: Any) -> Any:
+    """
+    `value` (parsed JSON) with every non-ASCII string in NFC.
+
+    Only run on documents json_needs_nfc() flagged: normalizing the
+    parsed strings touches just the non-ASCII ones, where normalizing the
+    whole text would also decompose and recompose all of its syntax,
+    IDs and URLs (several times slower on a catalog batch).
+    """
+    if isinstance(value, str):
+        return value if value.isascii() else unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {key: nfc_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [nfc_strings(item) for item in value]
+    return value
+
+
 # ============================================================================
-# HTTP REQUEST WITH EXPLICIT UTF-8 HANDLING
+# TYPED FIELD-SELECTIVE DECODING
 # ============================================================================
 
-async def _get_data_with_encoding(self, endpoint, **kwargs) -> dict[str, Any]:
+# The library sync decodes tens of thousands of resources, but the parsers
+# read only a handful of their fields: artwork colours, previews, lyrics
+# flags, hrefs etc. are parsed into dicts and thrown away. With msgspec
+# installed, bodies of the endpoints in RESOURCE_LIST_TYPES are decoded
+# straight into the compact structs below, which declare only the fields
+# _parse_artist/_parse_album/_parse_track/_parse_playlist read; every
+# other field is skipped by the decoder without being materialised.
+#
+# The structs answer the dict calls the parsers make (obj.get("x", d),
+# obj["x"], "x" in obj), so the parsers and safe_json_get() work on
+# them unchanged. Fields default to msgspec.UNSET, so the two cases stay
+# apart as they do in a dict: a field that is absent from the JSON reads
+# as missing (KeyError, the get() default, not `in`), a field that is
+# null reads as None. A body that does not fit the schema falls back to
+# dicts.
+
+if msgspec is not None:
+
+    class ApiStruct(msgspec.Struct, gc=False):
+        """Base for the typed resources: read-only dict-style field access."""
+
+        def get(self, key: str, default: Any = None) -> Any:
+            value = getattr(self, key, msgspec.UNSET)
+            return default if value is msgspec.UNSET else value
+
+        def __getitem__(self, key: str) -> Any:
+            value = getattr(self, key, msgspec.UNSET)
+            if value is msgspec.UNSET:
+                raise KeyError(key)
+            return value
+
+        def __contains__(self, key: object) -> bool:
+            return isinstance(key, str) and getattr(self, key, msgspec.UNSET) is not msgspec.UNSET
+
+    class Artwork(ApiStruct):
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        width: int | None | msgspec.UnsetType = msgspec.UNSET
+        height: int | None | msgspec.UnsetType = msgspec.UNSET
+
+    class EditorialNotes(ApiStruct):
+        standard: str | None | msgspec.UnsetType = msgspec.UNSET
+        short: str | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlayParams(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        kind: str | None | msgspec.UnsetType = msgspec.UNSET
+        catalogId: str | None | msgspec.UnsetType = msgspec.UNSET
+        globalId: str | None | msgspec.UnsetType = msgspec.UNSET
+        isLibrary: bool | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PageMeta(ApiStruct):
+        total: int | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        editorialNotes: EditorialNotes | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        artistName: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        releaseDate: str | None | msgspec.UnsetType = msgspec.UNSET
+        editorialNotes: EditorialNotes | None | msgspec.UnsetType = msgspec.UNSET
+        recordLabel: str | None | msgspec.UnsetType = msgspec.UNSET
+        copyright: str | None | msgspec.UnsetType = msgspec.UNSET
+        upc: str | None | msgspec.UnsetType = msgspec.UNSET
+        contentRating: str | None | msgspec.UnsetType = msgspec.UNSET
+        isSingle: bool | None | msgspec.UnsetType = msgspec.UNSET
+        isCompilation: bool | None | msgspec.UnsetType = msgspec.UNSET
+        trackCount: int | None | msgspec.UnsetType = msgspec.UNSET
+        audioTraits: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        playParams: PlayParams | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        artistName: str | None | msgspec.UnsetType = msgspec.UNSET
+        albumName: str | None | msgspec.UnsetType = msgspec.UNSET
+        composerName: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        releaseDate: str | None | msgspec.UnsetType = msgspec.UNSET
+        durationInMillis: int | None | msgspec.UnsetType = msgspec.UNSET
+        trackNumber: int | None | msgspec.UnsetType = msgspec.UNSET
+        discNumber: int | None | msgspec.UnsetType = msgspec.UNSET
+        isrc: str | None | msgspec.UnsetType = msgspec.UNSET
+        contentRating: str | None | msgspec.UnsetType = msgspec.UNSET
+        audioTraits: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        playParams: PlayParams | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlaylistAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        description: EditorialNotes | None | msgspec.UnsetType = msgspec.UNSET
+        curatorName: str | None | msgspec.UnsetType = msgspec.UNSET
+        canEdit: bool | None | msgspec.UnsetType = msgspec.UNSET
+        hasCatalog: bool | None | msgspec.UnsetType = msgspec.UNSET
+        lastModifiedDate: str | None | msgspec.UnsetType = msgspec.UNSET
+        playParams: PlayParams | None | msgspec.UnsetType = msgspec.UNSET
+
+    # A *List is both a relationship ({"data": [...]}) and a page
+    # ({"data": [...], "next": ..., "meta": {"total": ...}})
+
+    class ArtistList(ApiStruct):
+        data: "list[ArtistResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumList(ApiStruct):
+        data: "list[AlbumResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongList(ApiStruct):
+        data: "list[SongResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlaylistList(ApiStruct):
+        data: "list[PlaylistResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistRelationships(ApiStruct):
+        catalog: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumRelationships(ApiStruct):
+        catalog: AlbumList | None | msgspec.UnsetType = msgspec.UNSET
+        artists: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongRelationships(ApiStruct):
+        catalog: SongList | None | msgspec.UnsetType = msgspec.UNSET
+        artists: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+        albums: AlbumList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlaylistRelationships(ApiStruct):
+        catalog: PlaylistList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: ArtistAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: ArtistRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: AlbumAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: AlbumRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: SongAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: SongRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlaylistResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: PlaylistAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: PlaylistRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    # endpoint_key() -> page type. Used only for requests made with
+    # typed=True, which the library sync paths pass because their items go
+    # straight to the four parsers; every other caller, on these routes
+    # too, may read fields the structs leave out and gets dicts.
+    RESOURCE_LIST_TYPES: dict[str, type] = {
+        "me/library/artists": ArtistList,
+        "me/library/albums": AlbumList,
+        "me/library/songs": SongList,
+        "me/library/playlists": PlaylistList,
+        "catalog/{sf}/songs": SongList,
+    }
+    _RESOURCE_LIST_DECODERS = {
+        route: msgspec.json.Decoder(list_type) for route, list_type in RESOURCE_LIST_TYPES.items()
+    }
+    JSON_MAPPINGS: tuple[type, ...] = (dict, ApiStruct)
+else:
+    RESOURCE_LIST_TYPES = {}
+    _RESOURCE_LIST_DECODERS = {}
+    JSON_MAPPINGS = (dict,)
+
+
+def decode_resource_list(content: bytes | str, endpoint: str) -> dict[str, Any] | None:
     """
-    Get data from API with explicit UTF-8 encoding validation.
+    Decode a body of a RESOURCE_LIST_TYPES endpoint into typed resources.
+
+    Called by _decode_json_body() for typed=True requests only.
 
-    This is a drop-in replacement for _get_data() that adds explicit
-    charset handling to ensure proper Unicode decoding.
+    Returns the usual page dict ({"data": [...], "next": ..., "meta":
+    {"total": ...}}, keys only when present) with structs as data[]
+    items, or None when the endpoint is not typed, msgspec is missing or
+    the body does not match the schema; the caller then decodes dicts.
     """
-    url = f"https://api.music.apple.com/v1/{endpoint}"
-    headers = {
-        "Authorization": f"Bearer {self._music_app_token}",
-        "Music-User-Token": self._music_user_token,
-        "Accept-Charset": "utf-8",  # Request UTF-8 explicitly
-    }
+    decoder = _RESOURCE_LIST_DECODERS.get(endpoint_key(endpoint))
+    if decoder is None:
+        return None
+    try:
+        page = decoder.decode(content)
+    except (msgspec.DecodeError, UnicodeDecodeError):
+        return None
+    result: dict[str, Any] = {}
+    if page.data is not msgspec.UNSET:
+        result["data"] = page.data
+    if page.next is not msgspec.UNSET:
+        result["next"] = page.next
+    if page.meta is not msgspec.UNSET:
+        meta = page.meta
+        result["meta"] = meta if meta is None else (
+            {} if meta.total is msgspec.UNSET else {"total": meta.total}
+        )
+    return result
 
-    async with (
-        self.mass.http_session.get(
-            url, headers=headers, params=kwargs, ssl=True, timeout=120
-        ) as response,
-    ):
-        if response.status == 404 and "limit" in kwargs and "offset" in kwargs:
-            return {}
 
-        # Convert HTTP errors to exceptions
-        if response.status == 404:
-            from music_assistant_models.errors import MediaNotFoundError
-            raise MediaNotFoundError(f"{endpoint} not found")
+def json_encoded_size(value: Any) -> int:
+    """Length of `value` as compact JSON (dicts, lists and typed structs)."""
+    if msgspec is not None:
+        return len(msgspec.json.encode(value))
+    return len(json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+# ============================================================================
+# PROVIDER-WIDE ADAPTIVE RATE LIMITING
+# ============================================================================
+
+def parse_retry_after(headers: Any) -> float | None:
+    """
+    Extract a server-requested wait (in seconds) from response headers.
+
+    Understands Retry-After (delta-seconds or HTTP date) and the common
+    RateLimit-Reset / X-RateLimit-Reset variants (delta-seconds or a Unix
+    timestamp).
+
+    Args:
+        headers: Response headers (any mapping with .get())
 
-        if response.status == 504:
-            self.logger.debug(
-                "Apple Music API Timeout: url=%s, params=%s, response_headers=%s",
-                url, kwargs, response.headers
+    Returns:
+        Seconds to wait, or None if no usable header is present
+    """
+    if not headers:
+        return None
+
+    if value := headers.get("Retry-After"):
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+                return max(0.0, retry_at.timestamp() - time.time())
+            except (TypeError, ValueError):
+                pass
+
+    for header in ("RateLimit-Reset", "X-RateLimit-Reset", "X-Rate-Limit-Reset"):
+        if value := headers.get(header):
+            try:
+                reset = float(value)
+            except ValueError:
+                continue
+            # Large values are absolute Unix timestamps, small ones are deltas
+            if reset > 1_000_000_000:
+                reset -= time.time()
+            return max(0.0, reset)
+
+    return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Async token bucket shared by every Apple Music API call of the provider.
+
+    Replaces the fixed ThrottlerManager(rate_limit=1, period=2) setup. The
+    refill rate follows AIMD: every clean response adds `increase_step`
+    req/s (up to `max_rate`), every 429/504 multiplies it by
+    `decrease_factor` (down to `min_rate`) and empties the bucket. A
+    Retry-After style header additionally blocks all callers until the
+    server-requested time has passed.
+
+    Usage:
+        await limiter.acquire()          # before each request
+        limiter.record_response(status, headers)   # after each response
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = RATE_LIMIT_INITIAL,
+        min_rate: float = RATE_LIMIT_MIN,
+        max_rate: float = RATE_LIMIT_MAX,
+        burst: int = RATE_LIMIT_BURST,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+        logger: logging.Logger | None = None,
+    ) -> None:
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.logger = logger or logging.getLogger(__name__)
+        self._rate = initial_rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+        self.requests = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in requests per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent (FIFO across callers)."""
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill(now)
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+        self.requests += 1
+        self.total_wait += time.monotonic() - started
+
+    def record_response(self, status: int, headers: Any = None) -> None:
+        """Adapt the rate to the outcome of a request."""
+        retry_after = parse_retry_after(headers)
+
+        if status in (429, 504):
+            self.throttled += 1
+            if time.monotonic() < self._blocked_until:
+                # Same congestion event seen by another in-flight request
+                return
+            old_rate = self._rate
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+            wait = retry_after if retry_after is not None else 1 / self._rate
+            self._blocked_until = max(self._blocked_until, self._updated + wait)
+            self.logger.info(
+                "Apple Music API returned %d: rate %.2f -> %.2f req/s, pausing %.1fs",
+                status, old_rate, self._rate, wait
+            )
+            return
+
+        if retry_after is not None and status >= 400:
+            # Some other error that still tells us to back off
+            self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            return
+
+        if status < 400:
+            self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the limiter state for logging/diagnostics."""
+        return {
+            "rate": round(self._rate, 2),
+            "tokens": round(self._tokens, 2),
+            "requests": self.requests,
+            "throttled": self.throttled,
+            "avg_wait": round(self.total_wait / self.requests, 3) if self.requests else 0.0,
+            "blocked_for": round(max(0.0, self._blocked_until - time.monotonic()), 2),
+        }
+
+    def has_headroom(self) -> bool:
+        """True if a request could be sent right now without waiting."""
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return False
+        self._refill(now)
+        return self._tokens >= 1
+
+    async def __aenter__(self) -> "AdaptiveRateLimiter":
+        """Allow `async with self._rate_limiter:` around non-_get_data calls."""
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Nothing to release; feedback goes through record_response()."""
+
+
+# ============================================================================
+# HEDGED REQUESTS FOR TAIL-LATENCY PAGES
+# ============================================================================
+
+def endpoint_key(endpoint: str) -> str:
+    """
+    Collapse an endpoint to its route, for per-endpoint statistics.
+
+    The storefront and any resource IDs (catalog IDs are numeric, library
+    IDs look like "l.AbC123", playlists "p.xyz"/"pl.xyz") are replaced by
+    placeholders, e.g.:
+        catalog/us/songs              -> catalog/{sf}/songs
+        catalog/gb/albums/1440857781  -> catalog/{sf}/albums/{id}
+        me/library/playlists/p.Ab12/tracks -> me/library/playlists/{id}/tracks
+    `next` cursors ("/v1/me/library/songs?offset=50") map to their route.
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    if parts[0] == "v1":
+        parts = parts[1:]
+    if len(parts) > 1 and parts[0] == "catalog":
+        parts[1] = "{sf}"
+    return "/".join(
+        "{id}" if idx > 1 and ("." in part or any(c.isdigit() for c in part)) else part
+        for idx, part in enumerate(parts)
+    )
+
+
+class LatencyTracker:
+    """
+    Rolling per-endpoint latency samples plus hedging counters.
+
+    Keeps the last LATENCY_WINDOW successful request durations for each
+    endpoint_key() and answers percentile queries over them.
+    """
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.window = window
+        self._samples: dict[str, deque[float]] = {}
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add one successful request duration."""
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.window)
+        samples.append(seconds)
+
+    def percentile(self, key: str, pct: float) -> float | None:
+        """Latency at `pct` (0-1) for `key`, or None with too few samples."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(len(ordered) - 1, int(pct * len(ordered)))]
+
+    def stats(self) -> dict[str, Any]:
+        """p50/p95/p99 per endpoint plus hedge counters."""
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "endpoints": {
+                key: {
+                    "samples": len(samples),
+                    "p50": self.percentile(key, 0.50),
+                    "p95": self.percentile(key, 0.95),
+                    "p99": self.percentile(key, 0.99),
+                }
+                for key, samples in self._samples.items()
+            },
+        }
+
+
+async def _get_data_hedged(self, endpoint: str, **kwargs) -> dict[str, Any]:
+    """
+    _get_data() with an optional hedge for slow (tail-latency) requests.
+
+    If the request is still running after the endpoint's observed p95
+    latency (HEDGE_PERCENTILE), an identical duplicate is sent; whichever
+    answers first wins and the other is cancelled. A hedge is only sent
+    when the rate limiter has a token to spare right now and hedges stay
+    below HEDGE_MAX_FRACTION of all requests, so hedging never eats into
+    the budget of regular calls or piles on while Apple is throttling us.
+    """
+    tracker: LatencyTracker = self._latency
+    key = endpoint_key(endpoint)
+    tracker.requests += 1
+
+    async def timed_request(hedging: bool = False) -> dict[str, Any]:
+        started = time.monotonic()
+        # The hedge must not be coalesced into the request it races
+        fetch = self._request_data if hedging else self._get_data
+        result = await fetch(endpoint, **kwargs)
+        tracker.record(key, time.monotonic() - started)
+        return result
+
+    primary = asyncio.ensure_future(timed_request())
+    hedge: asyncio.Future | None = None
+    threshold = tracker.percentile(key, HEDGE_PERCENTILE) if HEDGING_ENABLED else None
+    if threshold is None:
+        return await primary
+
+    hedge_after = max(threshold, HEDGE_MIN_DELAY)
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done:
+            return primary.result()
+        if (
+            tracker.hedges >= tracker.requests * HEDGE_MAX_FRACTION
+            or not self._rate_limiter.has_headroom()
+        ):
+            return await primary
+
+        tracker.hedges += 1
+        self.logger.debug(
+            "Hedging %s after %.2fs (p%d for %s is %.2fs)",
+            endpoint, hedge_after, int(HEDGE_PERCENTILE * 100), key, threshold
+        )
+        hedge = asyncio.ensure_future(timed_request(hedging=True))
+        racing = {primary, hedge}
+        while True:
+            done, racing = await asyncio.wait(racing, return_when=asyncio.FIRST_COMPLETED)
+            for finished in done:
+                # A failed request only counts once the other one failed too
+                if finished.exception() is None or not racing:
+                    if finished is hedge:
+                        tracker.hedge_wins += 1
+                    return finished.result()
+    finally:
+        for task in (primary, hedge):
+            if task is not None and not task.done():
+                task.cancel()
+
+
+# ============================================================================
+# PERSISTENT CONDITIONAL-REQUEST CACHE
+# ============================================================================
+
+class ConditionalResponseCache:
+    """
+    On-disk (SQLite) cache of API response bodies plus their validators.
+
+    Entries are keyed by endpoint and normalized query parameters (a `next`
+    cursor and the equivalent endpoint + offset share one entry) and only
+    stored when Apple sent an ETag or Last-Modified. _get_data sends those
+    back as If-None-Match / If-Modified-Since and serves a 304 from the
+    stored body, so an unchanged page costs a round trip but no download.
+
+    The total body size is bounded by `max_bytes`; least recently used
+    entries are evicted first. All methods are blocking and meant to be
+    called through asyncio.to_thread().
+    """
+
+    def __init__(self, path: str, max_bytes: int = RESPONSE_CACHE_MAX_BYTES) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, etag TEXT, last_modified TEXT,"
+            " body BLOB NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_lru ON responses (last_used)")
+        self._db.commit()
+        self.size = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    @staticmethod
+    def make_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Stable key for an endpoint (or `next` href) + query parameters."""
+        parts = urlsplit(endpoint)
+        path = parts.path.strip("/")
+        if path.startswith("v1/"):
+            path = path[3:]
+        merged = {**{k: str(v) for k, v in params.items()}, **dict(parse_qsl(parts.query))}
+        return SyncCheckpointStore.make_key(path, merged)
+
+    def get(self, key: str) -> tuple[str | None, str | None, bytes] | None:
+        """(etag, last_modified, body) stored for `key`, or None."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT etag, last_modified, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+
+    def touch(self, key: str) -> None:
+        """Mark `key` as just used (a 304 was served from it)."""
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key)
+            )
+            self._db.commit()
+
+    def put(self, key: str, etag: str | None, last_modified: str | None, body: bytes) -> None:
+        """Store a 200 response body with its validators, evicting LRU entries."""
+        with self._lock:
+            old = self._db.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, etag, last_modified, body, len(body), time.time()),
+            )
+            self.size += len(body) - (old[0] if old else 0)
+            self.stores += 1
+            while self.size > self.max_bytes:
+                oldest = self._db.execute(
+                    "SELECT key, size FROM responses ORDER BY last_used LIMIT 1"
+                ).fetchone()
+                if oldest is None:
+                    break
+                self._db.execute("DELETE FROM responses WHERE key = ?", (oldest[0],))
+                self.size -= oldest[1]
+                self.evictions += 1
+            self._db.commit()
+
+    def close(self) -> None:
+        """Close the database (provider unload)."""
+        with self._lock:
+            self._db.close()
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and current size."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+# ============================================================================
+# IN-MEMORY CATALOG CACHE
+# ============================================================================
+
+class CatalogCache:
+    """
+    In-process TTL + LRU cache of catalog resources.
+
+    Level one in front of _get_data for catalog/{storefront}/... calls;
+    misses still go through the on-disk ConditionalResponseCache (level
+    two). Entries are keyed by (storefront, type, id) and remember the
+    request's shape (include/extend/...), since a song fetched with
+    include=albums carries other relationships than a plain one: a lookup
+    with a different shape is a miss. Every type expires after its
+    CATALOG_CACHE_TTLS entry, sizes are estimated from the JSON length and
+    the least recently used entries are evicted beyond `max_bytes`.
+
+    Cached dicts are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self, max_bytes: int = CATALOG_CACHE_MAX_BYTES, ttls: dict[str, float] | None = None
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.ttls = {**CATALOG_CACHE_TTLS, **(ttls or {})}
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        # (storefront, type, id) -> (expires_at, size, shape, value)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, int, str, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, storefront: str, res_type: str, res_id: str, shape: str = "") -> Any | None:
+        """Cached value, or None when missing, expired or of another shape."""
+        key = (storefront, res_type, res_id)
+        entry = self._entries.get(key)
+        if entry is None or entry[2] != shape:
+            self.misses += 1
+            return None
+        if entry[0] < time.monotonic():
+            self._drop(key)
+            self.expired += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[3]
+
+    def put(self, storefront: str, res_type: str, res_id: str, value: Any, shape: str = "") -> None:
+        """Store `value`, evicting least recently used entries over the cap."""
+        size = json_encoded_size(value)
+        if size > self.max_bytes:
+            return
+        key = (storefront, res_type, res_id)
+        self._drop(key)
+        ttl = self.ttls.get(res_type.split("/")[0], CATALOG_CACHE_DEFAULT_TTL)
+        self._entries[key] = (time.monotonic() + ttl, size, shape, value)
+        self.size += size
+        while self.size > self.max_bytes:
+            _key, (_expires, old_size, _shape, _value) = self._entries.popitem(last=False)
+            self.size -= old_size
+            self.evictions += 1
+
+    def fill(self, storefront: str, resources: list, shape: str = "") -> int:
+        """Cache every resource of a data[] list; returns how many were stored."""
+        stored = 0
+        for resource in resources:
+            if isinstance(resource, JSON_MAPPINGS) and resource.get("id") and resource.get("type"):
+                self.put(storefront, resource["type"], str(resource["id"]), resource, shape)
+                stored += 1
+        return stored
+
+    def _drop(self, key: tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def stats(self) -> dict[str, Any]:
+        """Hit/miss counters and memory use."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+async def _get_catalog_data(self, endpoint: str, **kwargs) -> dict[str, Any]:
+    """
+    _get_data() for catalog/{storefront}/... endpoints, via self._catalog_cache.
+
+    - catalog/{sf}/{type}/{id}: served from the cache when present,
+      otherwise gathered with concurrent single lookups into one ids=
+      request by self._catalog_loader
+    - catalog/{sf}/{type}?ids=a,b,c: only the IDs not cached are
+      requested; one ids= call warms the cache for all of them
+    - relationship views (catalog/{sf}/artists/{id}/albums, ...): the
+      whole page is cached under its route and query, so browsing back to
+      an artist's albums does not hit the API again, and the albums it
+      lists answer the album lookups that follow
+    Anything else, and every miss, goes through _get_data_hedged().
+    `typed=True` (the track sync's ids= batches) counts as a query
+    parameter for the cache key, so typed structs only ever answer typed
+    requests and every other caller gets dicts.
+    """
+    cache: CatalogCache | None = self._catalog_cache
+    parts = endpoint.strip("/").split("/")
+    if cache is None or len(parts) < 3 or parts[0] != "catalog":
+        return await self._get_data_hedged(endpoint, **kwargs)
+
+    storefront, res_type = parts[1], parts[2]
+    ids = kwargs.pop("ids", None)
+    shape = SyncCheckpointStore.make_key("", kwargs)
+
+    # Single resource, batched with other single lookups on a miss
+    if len(parts) == 4 and ids is None:
+        resource = cache.get(storefront, res_type, parts[3], shape)
+        if resource is None and self._catalog_loader is not None:
+            resource = await self._catalog_loader.load(storefront, res_type, parts[3], kwargs)
+            if resource is None:
+                # Same error as the single-ID request gives today
+                from music_assistant_models.errors import MediaNotFoundError
+                raise MediaNotFoundError(f"{endpoint} not found")
+        if resource is not None:
+            return {"data": [resource]}
+        result = await self._get_data_hedged(endpoint, **kwargs)
+        cache.fill(storefront, result.get("data", []), shape)
+        return result
+
+    # Batch lookup: request only what is missing, answer in request order
+    if len(parts) == 3 and ids is not None:
+        wanted = [res_id for res_id in str(ids).split(",") if res_id]
+        found: dict[str, Any] = {}
+        missing = []
+        for res_id in wanted:
+            resource = cache.get(storefront, res_type, res_id, shape)
+            if resource is None:
+                missing.append(res_id)
+            else:
+                found[res_id] = resource
+        extra = []
+        if missing:
+            result = await self._get_data_hedged(endpoint, ids=",".join(missing), **kwargs)
+            fetched = result.get("data", [])
+            cache.fill(storefront, fetched, shape)
+            missing_ids = set(missing)
+            for resource in fetched:
+                res_id = str(resource.get("id"))
+                if res_id in missing_ids:
+                    found[res_id] = resource
+                else:
+                    # Apple answered with an equivalent ID; keep it
+                    extra.append(resource)
+        return {"data": [found[res_id] for res_id in wanted if res_id in found] + extra}
+
+    # Relationship view page (artists/{id}/albums, playlists/{id}/tracks, ...)
+    if len(parts) >= 5 and ids is None:
+        view = f"{res_type}/{'/'.join(parts[4:])}"
+        page_key = SyncCheckpointStore.make_key(parts[3], kwargs)
+        page = cache.get(storefront, view, page_key)
+        if page is not None:
+            return page
+        result = await self._get_data_hedged(endpoint, **kwargs)
+        if result:
+            cache.put(storefront, view, page_key, result)
+            # The listed resources answer later single lookups too
+            cache.fill(
+                storefront,
+                result.get("data", []),
+                SyncCheckpointStore.make_key(
+                    "", {k: v for k, v in kwargs.items() if k not in ("limit", "offset")}
+                ),
             )
-            from music_assistant_models.errors import ResourceTemporarilyUnavailable
-            raise ResourceTemporarilyUnavailable("Apple Music API Timeout")
+        return result
 
-        if response.status == 429:
-            self.logger.debug("Apple Music Rate Limiter. Headers: %s", response.headers)
-            from music_assistant_models.errors import ResourceTemporarilyUnavailable
-            raise ResourceTemporarilyUnavailable("Apple Music Rate Limiter")
+    if ids is not None:
+        kwargs["ids"] = ids
+    return await self._get_data_hedged(endpoint, **kwargs)
 
-        if response.status == 500:
-            from music_assistant_models.errors import MusicAssistantError
-            raise MusicAssistantError("Unexpected server error when calling Apple Music")
 
-        response.raise_for_status()
+# ============================================================================
+# MICRO-BATCHED CATALOG LOOKUPS
+# ============================================================================
 
-        # Read response with explicit UTF-8 handling
+class CatalogBatchLoader:
+    """
+    DataLoader-style batching of single catalog ID lookups.
+
+    load() queues one (storefront, type, id) lookup and returns a future.
+    Lookups with the same storefront, type and query parameters that
+    arrive within `window` seconds are sent as one ids= request (as soon
+    as the per-type cap in CATALOG_LOADER_MAX_IDS is reached, without
+    waiting for the window), and every caller's future is resolved from
+    that response: with the resource, or None when Apple did not return
+    it. If the batched request fails, each ID is retried on its own so an
+    error only reaches the callers it belongs to.
+
+    `fetch(storefront, res_type, ids, params)` performs the ids= request
+    and returns the data[] list.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, list[str], dict[str, Any]], Awaitable[list[dict]]],
+        window: float = CATALOG_LOADER_WINDOW,
+    ) -> None:
+        self._fetch = fetch
+        self.window = window
+        # (storefront, type, params key) -> (params, {id: [futures]})
+        self._pending: dict[tuple[str, str, str], tuple[dict, dict[str, list[asyncio.Future]]]] = {}
+        self._timers: dict[tuple[str, str, str], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self.loads = 0
+        self.batches = 0
+        self.fallbacks = 0
+
+    def load(
+        self, storefront: str, res_type: str, res_id: str, params: dict[str, Any]
+    ) -> asyncio.Future:
+        """Queue one lookup; the future resolves to the resource or None."""
+        self.loads += 1
+        key = (storefront, res_type, SyncCheckpointStore.make_key("", params))
+        future = asyncio.get_running_loop().create_future()
+        _params, waiting = self._pending.setdefault(key, (params, {}))
+        waiting.setdefault(res_id, []).append(future)
+        if len(waiting) >= CATALOG_LOADER_MAX_IDS.get(res_type, CATALOG_LOADER_DEFAULT_MAX_IDS):
+            self._dispatch(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(
+                self.window, self._dispatch, key
+            )
+        return future
+
+    def _dispatch(self, key: tuple[str, str, str]) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        params, waiting = self._pending.pop(key)
+        self.batches += 1
+        task = asyncio.ensure_future(self._resolve(key[0], key[1], params, waiting))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(
+        self,
+        storefront: str,
+        res_type: str,
+        params: dict[str, Any],
+        waiting: dict[str, list[asyncio.Future]],
+    ) -> None:
         try:
-            # Get text with explicit UTF-8 encoding
-            text = await response.text(encoding='utf-8')
+            resources = await self._fetch(storefront, res_type, list(waiting), params)
+        except Exception as exc:
+            if len(waiting) == 1:
+                self._settle(waiting, exception=exc)
+                return
+            # Keep errors per caller: one bad ID must not fail the others
+            self.fallbacks += 1
+            await asyncio.gather(
+                *(
+                    self._resolve(storefront, res_type, params, {res_id: futures})
+                    for res_id, futures in waiting.items()
+                )
+            )
+            return
+        by_id = {str(resource.get("id")): resource for resource in resources}
+        self._settle(waiting, by_id)
+
+    @staticmethod
+    def _settle(
+        waiting: dict[str, list[asyncio.Future]],
+        by_id: dict[str, dict] | None = None,
+        exception: BaseException | None = None,
+    ) -> None:
+        for res_id, futures in waiting.items():
+            for future in futures:
+                if future.done():
+                    continue  # Caller gave up (cancelled)
+                if exception is not None:
+                    future.set_exception(exception)
+                else:
+                    future.set_result(by_id.get(res_id))
+
+    def stats(self) -> dict[str, Any]:
+        """Lookups, ids= requests they became and the average batch size."""
+        return {
+            "loads": self.loads,
+            "batches": self.batches,
+            "avg_batch": round(self.loads / self.batches, 1) if self.batches else 0.0,
+            "fallbacks": self.fallbacks,
+        }
+
+
+async def _fetch_catalog_ids(
+    self, storefront: str, res_type: str, ids: list[str], params: dict[str, Any]
+) -> list[dict]:
+    """
+    ids= request behind self._catalog_loader; the results fill the catalog cache.
+
+    Every ID here already missed the cache in _get_catalog_data(), so it
+    is not looked up (and counted as a miss) a second time.
+    """
+    response = await self._get_data_hedged(
+        f"catalog/{storefront}/{res_type}", ids=",".join(ids), **params
+    )
+    resources = response.get("data", [])
+    if self._catalog_cache is not None:
+        self._catalog_cache.fill(
+            storefront, resources, SyncCheckpointStore.make_key("", params)
+        )
+    return resources
+
+
+# ============================================================================
+# DEDICATED CONNECTION POOL FOR api.music.apple.com
+# ============================================================================
+
+class ApiConnectionPool:
+    """
+    Provider-owned aiohttp session tuned for bursts of Apple Music calls.
+
+    The shared mass.http_session uses default connector settings (short
+    keep-alive, no per-host budget for Apple). This pool keeps up to
+    `limit_per_host` connections to api.music.apple.com alive for
+    `keepalive_timeout` seconds and caches DNS for `dns_ttl` seconds, so
+    after warm_up() pages reuse open TLS connections instead of paying a
+    handshake each. Connection events are traced for stats().
+    """
+
+    def __init__(
+        self,
+        limit_per_host: int = API_POOL_LIMIT_PER_HOST,
+        keepalive_timeout: float = API_POOL_KEEPALIVE,
+        dns_ttl: int = API_POOL_DNS_TTL,
+    ) -> None:
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_ttl = dns_ttl
+        self._session = None
+        self._connector = None
+        self.requests = 0
+        self.created = 0
+        self.reused = 0
+        self.dns_lookups = 0
+        self.dns_cache_hits = 0
+        self._handshakes: deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    @property
+    def session(self):
+        """The pool's ClientSession, created on first use (inside the loop)."""
+        if self._session is None or self._session.closed:
+            import aiohttp
+
+            trace = aiohttp.TraceConfig()
+            trace.on_request_start.append(self._on_request_start)
+            trace.on_connection_create_start.append(self._on_create_start)
+            trace.on_connection_create_end.append(self._on_create_end)
+            trace.on_connection_reuseconn.append(self._on_reuse)
+            trace.on_dns_resolvehost_start.append(self._on_dns_lookup)
+            trace.on_dns_cache_hit.append(self._on_dns_cache_hit)
+            self._connector = aiohttp.TCPConnector(
+                limit=0,
+                limit_per_host=self.limit_per_host,
+                keepalive_timeout=self.keepalive_timeout,
+                ttl_dns_cache=self.dns_ttl,
+                use_dns_cache=True,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=self._connector, trace_configs=[trace]
+            )
+        return self._session
+
+    async def warm_up(self, connections: int = API_POOL_WARMUP_CONNECTIONS) -> int:
+        """
+        Open `connections` keep-alive connections ahead of the first sync.
+
+        Sends that many concurrent GETs to the bare API origin (no
+        credentials, not rate limited, a tiny 404 body that is read to
+        the end so the connection goes back to the pool) so DNS, TCP and
+        TLS are done before the first page. Returns how many succeeded;
+        a failed warm-up only means the first pages pay the handshake.
+        """
+        session = self.session
+
+        async def open_one() -> bool:
+            try:
+                async with session.get(APPLE_MUSIC_API_ORIGIN, ssl=True, timeout=30) as response:
+                    await response.read()
+                    return True
+            except Exception:
+                return False
+
+        results = await asyncio.gather(*(open_one() for _ in range(connections)))
+        return sum(results)
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._connector = None
+
+    async def _on_request_start(self, _session, _ctx, _params) -> None:
+        self.requests += 1
+
+    async def _on_create_start(self, _session, ctx, _params) -> None:
+        ctx.connect_started = time.monotonic()
+
+    async def _on_create_end(self, _session, ctx, _params) -> None:
+        self.created += 1
+        started = getattr(ctx, "connect_started", None)
+        if started is not None:
+            self._handshakes.append(time.monotonic() - started)
+
+    async def _on_reuse(self, _session, _ctx, _params) -> None:
+        self.reused += 1
+
+    async def _on_dns_lookup(self, _session, _ctx, _params) -> None:
+        self.dns_lookups += 1
+
+    async def _on_dns_cache_hit(self, _session, _ctx, _params) -> None:
+        self.dns_cache_hits += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Open/idle connections, reuse rate and handshake times."""
+        # The connector keeps idle connections in _conns and checked-out
+        # ones in _acquired (no public API for either)
+        connector = self._connector
+        idle = sum(len(conns) for conns in getattr(connector, "_conns", {}).values())
+        in_use = len(getattr(connector, "_acquired", ()))
+        connects = self.created + self.reused
+        handshakes = sorted(self._handshakes)
+        return {
+            "open": idle + in_use,
+            "idle": idle,
+            "in_use": in_use,
+            "requests": self.requests,
+            "connections_created": self.created,
+            "connections_reused": self.reused,
+            "reuse_rate": round(self.reused / connects, 3) if connects else 0.0,
+            "handshake_avg_ms": (
+                round(sum(handshakes) / len(handshakes) * 1000, 1) if handshakes else None
+            ),
+            "handshake_p95_ms": (
+                round(handshakes[min(len(handshakes) - 1, int(0.95 * len(handshakes)))] * 1000, 1)
+                if handshakes else None
+            ),
+            "dns_lookups": self.dns_lookups,
+            "dns_cache_hits": self.dns_cache_hits,
+            "limit_per_host": self.limit_per_host,
+        }
+
+
+def _api_session(self):
+    """Session for Apple Music API calls: the provider's pool if set up."""
+    pool: ApiConnectionPool | None = self._api_pool
+    return pool.session if pool is not None else self.mass.http_session
+
+
+# ============================================================================
+# COMPRESSED TRANSFER WITH STREAMING DECOMPRESSION
+# ============================================================================
+
+class StreamDecoder:
+    """
+    Incremental Content-Encoding decoder, fed one network chunk at a time.
+
+    Handles what ACCEPT_ENCODING offers (gzip, br) plus identity; stacked
+    encodings ("gzip, br") are undone in reverse order.
+    """
+
+    def __init__(self, content_encoding: str = "") -> None:
+        self.encodings = [
+            name for name in (part.strip().lower() for part in content_encoding.split(","))
+            if name and name != "identity"
+        ]
+        self._steps: list[tuple[Callable[[bytes], bytes], Callable[[], bytes]]] = []
+        for name in reversed(self.encodings):
+            if name in ("gzip", "x-gzip"):
+                gz = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                self._steps.append((gz.decompress, gz.flush))
+            elif name == "br" and brotli is not None:
+                br = brotli.Decompressor()
+                self._steps.append((br.process, lambda: b""))
+            else:
+                raise ValueError(f"Unsupported Content-Encoding: {content_encoding}")
 
-            # Parse JSON
-            from music_assistant.helpers.json import json_loads
-            return json_loads(text)
+    def feed(self, chunk: bytes) -> bytes:
+        """Decoded bytes for the next chunk of the body (may be empty)."""
+        for decode, _flush in self._steps:
+            chunk = decode(chunk)
+        return chunk
 
-        except UnicodeDecodeError as exc:
-            self.logger.error(
-                "UTF-8 decode error for %s: %s. Trying fallback encoding.",
-                endpoint, str(exc)
+    def flush(self) -> bytes:
+        """Whatever the decoders still buffer once the body has ended."""
+        tail = b""
+        for decode, flush in self._steps:
+            tail = decode(tail) + flush() if tail else flush()
+        return tail
+
+
+class TransferStats:
+    """
+    Bytes on the wire vs. decoded body bytes, per endpoint_key().
+
+    Shows how much negotiation saves on each route (catalog ids= batches
+    compress best) and which encodings Apple actually answered with.
+    """
+
+    def __init__(self) -> None:
+        # endpoint_key -> [responses, wire bytes, body bytes, {encoding: count}]
+        self._endpoints: dict[str, list] = {}
+
+    def record(self, endpoint: str, encoding: str, wire_bytes: int, body_bytes: int) -> None:
+        entry = self._endpoints.setdefault(endpoint_key(endpoint), [0, 0, 0, {}])
+        entry[0] += 1
+        entry[1] += wire_bytes
+        entry[2] += body_bytes
+        encoding = encoding or "identity"
+        entry[3][encoding] = entry[3].get(encoding, 0) + 1
+
+    def totals(self, endpoint: str) -> tuple[int, int]:
+        """(wire bytes, body bytes) received so far for endpoint's route."""
+        entry = self._endpoints.get(endpoint_key(endpoint))
+        return (entry[1], entry[2]) if entry else (0, 0)
+
+    def stats(self) -> dict[str, Any]:
+        """Per-endpoint and total byte counts with compression ratios."""
+        endpoints = {}
+        wire_total = body_total = 0
+        for route, (responses, wire, body, encodings) in sorted(self._endpoints.items()):
+            wire_total += wire
+            body_total += body
+            endpoints[route] = {
+                "responses": responses,
+                "compressed_bytes": wire,
+                "decompressed_bytes": body,
+                "ratio": round(body / wire, 2) if wire else 0.0,
+                "encodings": dict(encodings),
+            }
+        return {
+            "compressed_bytes": wire_total,
+            "decompressed_bytes": body_total,
+            "ratio": round(body_total / wire_total, 2) if wire_total else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+async def _iter_body(self, endpoint: str, response) -> AsyncGenerator[bytes, None]:
+    """
+    Yield a response body in decompressed chunks as it streams in.
+
+    _request_data() asks aiohttp for the raw (still encoded) body so the
+    bytes on the wire can be counted; each chunk is decoded as soon as it
+    arrives and the compressed chunks are not kept. Both byte counts go
+    to self._transfer_stats, also for a body abandoned half way.
+    """
+    encoding = response.headers.get("Content-Encoding", "")
+    decoder = StreamDecoder(encoding)
+    wire_bytes = 0
+    body_bytes = 0
+    try:
+        async for chunk in response.content.iter_chunked(TRANSFER_CHUNK_SIZE):
+            wire_bytes += len(chunk)
+            if decoded := decoder.feed(chunk):
+                body_bytes += len(decoded)
+                yield decoded
+        if tail := decoder.flush():
+            body_bytes += len(tail)
+            yield tail
+    finally:
+        self._transfer_stats.record(endpoint, encoding, wire_bytes, body_bytes)
+
+
+async def _read_body(self, endpoint: str, response) -> bytes:
+    """The whole decompressed body of `response` (see _iter_body())."""
+    return b"".join([chunk async for chunk in self._iter_body(endpoint, response)])
+
+
+# ============================================================================
+# STREAMING JSON ITEM PARSING
+# ============================================================================
+
+class DataItemStream:
+    """
+    Incremental parser that cuts the top-level data[] items out of a body.
+
+    Fed the body chunk by chunk, feed() returns every data[] item that is
+    complete so far, so the first item is available long before the last
+    byte arrives. Only the item being read is buffered; the rest of the
+    document ("next", "meta", ...) is kept with an empty data array and
+    parsed by finish().
+
+    Bytes are decoded incrementally (a multibyte character may straddle
+    two chunks; invalid UTF-8 is replaced, as _decode_json_body() does).
+    Until the data array opens a regex scanner tracks nesting; items are
+    then parsed by the C scanner of json.JSONDecoder.raw_decode(), which
+    also tells where each one ends. An item cut off by the end of a chunk
+    fails to parse and is retried once the next chunk is in.
+
+    With PAYLOAD_NFC the buffered text gets the json_needs_nfc() check
+    whole bodies get (the unparsed tail of the previous chunk included,
+    so a combining mark at the start of a chunk is seen with its base
+    character), and the items of a buffer that fails it go through
+    nfc_strings().
+    """
+
+    # A string (group 1 is its closing quote; None while it is cut off by
+    # the end of the chunk) or a bracket
+    _TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*(")?|[\[\]{}]')
+    _SEPARATORS = re.compile(r"[\s,]*")
+    _DECODER = json.JSONDecoder()
+
+    # Where feed() is in the document
+    BEFORE_ITEMS, IN_ITEMS, AFTER_ITEMS = range(3)
+
+    def __init__(self, key: str = "data") -> None:
+        self._key = f'"{key}"'
+        self._text = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""
+        self._depth = 0
+        self._last_key = ""          # last string seen at depth 1
+        self._state = self.BEFORE_ITEMS
+        self._envelope: list[str] = []
+        self.items = 0
+        self.peak_buffer = 0
+
+    def feed(self, chunk: bytes) -> list[dict]:
+        """Items completed by this chunk, in document order."""
+        buf = self._buf + self._text.decode(chunk)
+        self.peak_buffer = max(self.peak_buffer, len(buf))
+        needs_nfc = PAYLOAD_NFC and json_needs_nfc(buf)
+        pos = 0
+        if self._state == self.BEFORE_ITEMS:
+            pos = self._find_items(buf)
+            self._envelope.append(buf[:pos])
+
+        items = []
+        if self._state == self.IN_ITEMS:
+            while True:
+                pos = self._SEPARATORS.match(buf, pos).end()
+                if pos == len(buf):
+                    break
+                if buf[pos] == "]":
+                    self._state = self.AFTER_ITEMS
+                    break
+                try:
+                    item, end = self._DECODER.raw_decode(buf, pos)
+                except json.JSONDecodeError:
+                    break  # cut off: wait for the next chunk
+                if end == len(buf) and not isinstance(item, (dict, list, str)):
+                    break  # a number may go on in the next chunk
+                items.append(nfc_strings(item) if needs_nfc else item)
+                pos = end
+
+        if self._state == self.AFTER_ITEMS:
+            self._envelope.append(buf[pos:])
+            pos = len(buf)
+        self._buf = buf[pos:]
+        self.items += len(items)
+        return items
+
+    def _find_items(self, buf: str) -> int:
+        """Scan for the top-level data array; returns where scanning stopped."""
+        for match in self._TOKEN.finditer(buf):
+            token = match.group()
+            if token[0] == '"':
+                if match.group(1) is None:
+                    return match.start()  # rescanned with the next chunk
+                if self._depth == 1:
+                    self._last_key = token
+            elif token in "{[":
+                self._depth += 1
+                if self._depth == 2 and token == "[" and self._last_key == self._key:
+                    self._state = self.IN_ITEMS
+                    return match.end()
+            else:
+                self._depth -= 1
+        return len(buf)
+
+    def finish(self) -> dict[str, Any]:
+        """The document without its items ({"data": [], "next": ...})."""
+        if self._state == self.IN_ITEMS:
+            raise ValueError(f"Truncated JSON body after {self.items} items")
+        envelope = "".join(self._envelope) + self._buf + self._text.decode(b"", True)
+        if not envelope.strip():
+            return {}
+        rest = json_loads_fast(envelope)
+        return nfc_strings(rest) if PAYLOAD_NFC and json_needs_nfc(envelope) else rest
+
+
+async def _stream_data_batches(
+    self, endpoint: str, envelope: dict[str, Any] | None = None, **kwargs
+) -> AsyncGenerator[list[Any], None]:
+    """
+    Opt-in streaming variant of _get_data() for large data[] responses.
+
+    Yields the data[] items (dicts) each network chunk completes, as a
+    list, as soon as their bytes have arrived instead of after the whole
+    body is buffered and parsed; peak memory is one network chunk plus
+    its items. Consumers can hand every list to a _parse_*_batch()
+    method. When given, `envelope` is filled with the rest of the
+    response ("next", "meta") once the body has ended.
+
+    Uses the same rate limiter, 429/504 retries, connection pool and
+    compressed transfer as _request_data(), but bypasses single-flight
+    coalescing and the conditional-request cache, which both need the
+    whole body.
+    """
+    headers = self._api_headers()
+    url, params, endpoint, is_cursor = _api_target(endpoint, kwargs)
+
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+        await self._rate_limiter.acquire()
+
+        async with (
+            self._api_session().get(
+                url, headers=headers, params=params, ssl=True, timeout=120,
+                auto_decompress=False,
+            ) as response,
+        ):
+            self._rate_limiter.record_response(response.status, response.headers)
+
+            if response.status in (429, 504) and attempt < MAX_REQUEST_RETRIES:
+                continue
+
+            if response.status == 404 and (is_cursor or ("limit" in kwargs and "offset" in kwargs)):
+                return
+
+            self._raise_for_api_status(endpoint, url, kwargs, response)
+
+            stream = DataItemStream()
+            async for chunk in self._iter_body(endpoint, response):
+                if items := stream.feed(chunk):
+                    yield items
+            rest = stream.finish()
+            if envelope is not None:
+                envelope.update(rest)
+            return
+
+
+async def _stream_data_items(
+    self, endpoint: str, envelope: dict[str, Any] | None = None, **kwargs
+) -> AsyncGenerator[Any, None]:
+    """Item-by-item view of _stream_data_batches()."""
+    async for items in self._stream_data_batches(endpoint, envelope=envelope, **kwargs):
+        for item in items:
+            yield item
+
+
+async def _stream_all_items(self, endpoint: str, **kwargs) -> AsyncGenerator[Any, None]:
+    """
+    Serial, item-streamed pagination behind _get_all_items_streaming().
+
+    Pages are chained through their `next` cursor and every item is
+    yielded while its page is still downloading. A page that fails half
+    way is requested again (up to MAX_CONSECUTIVE_PAGE_ERRORS times);
+    the seen-ID set drops the items it had already yielded.
+    """
+    seen = SeenIdSet()
+    report = PaginationReport(endpoint)
+    href: str | None = None
+    offset = 0
+    errors = 0
+    while offset // PAGE_LIMIT <= MAX_PAGES:
+        envelope: dict[str, Any] = {}
+        page_items = 0
+        try:
+            if href is None:
+                items = self._stream_data_items(
+                    endpoint, envelope=envelope, **{**kwargs, "limit": PAGE_LIMIT, "offset": offset}
+                )
+            else:
+                items = self._stream_data_items(
+                    href, envelope=envelope, **{**kwargs, "limit": PAGE_LIMIT}
+                )
+            async for item in items:
+                page_items += 1
+                if _drop_seen_items([item], seen, report):
+                    yield item
+        except Exception as exc:
+            errors += 1
+            self.logger.warning(
+                "Error streaming %s at offset %d (%d/%d): %s",
+                endpoint, offset, errors, MAX_CONSECUTIVE_PAGE_ERRORS,
+                truncate_for_log(safe_unicode_str(str(exc)), 80)
             )
+            if errors >= MAX_CONSECUTIVE_PAGE_ERRORS:
+                self.logger.error("Too many consecutive errors streaming %s, stopping", endpoint)
+                return
+            continue
+        errors = 0
+        href = envelope.get("next")
+        if not href or not page_items:
+            break
+        offset += page_items
+
+    if report.duplicates:
+        self.logger.debug(
+            "%s: dropped %d items already seen while streaming", endpoint, report.duplicates
+        )
 
-            # Fallback: read as bytes and decode with error handling
-            content = await response.read()
-            text = content.decode('utf-8', errors='replace')  # Replace bad bytes with �
 
-            from music_assistant.helpers.json import json_loads
-            return json_loads(text)
+async def _stream_catalog_batches(
+    self, endpoint: str, ids: list[str], **kwargs
+) -> AsyncGenerator[list[Any], None]:
+    """
+    Streamed catalog/{sf}/{type}?ids= lookup, through self._catalog_cache.
+
+    Cached resources are yielded first, as one list; the missing IDs are
+    requested in one ids= call whose resources are yielded (and cached)
+    chunk by chunk as they arrive (see _stream_data_batches()). Order
+    follows the response, not `ids`.
+    """
+    cache: CatalogCache | None = self._catalog_cache
+    parts = endpoint.strip("/").split("/")
+    storefront, res_type = parts[1], parts[2]
+    shape = SyncCheckpointStore.make_key("", kwargs)
+    cached = []
+    missing = []
+    for res_id in ids:
+        resource = cache.get(storefront, res_type, res_id, shape) if cache is not None else None
+        if resource is None:
+            missing.append(res_id)
+        else:
+            cached.append(resource)
+    if cached:
+        yield cached
+    if not missing:
+        return
+    async for resources in self._stream_data_batches(endpoint, ids=",".join(missing), **kwargs):
+        if cache is not None:
+            cache.fill(storefront, resources, shape)
+        yield resources
+
+
+# ============================================================================
+# HTTP REQUEST WITH EXPLICIT UTF-8 HANDLING
+# ============================================================================
+
+def _api_headers(self) -> dict[str, str]:
+    """Request headers, built once and rebuilt only when a token changes."""
+    tokens = (self._music_app_token, self._music_user_token)
+    cached = getattr(self, "_api_headers_cache", None)
+    if cached is None or cached[0] != tokens:
+        cached = self._api_headers_cache = (
+            tokens,
+            {
+                "Authorization": f"Bearer {self._music_app_token}",
+                "Music-User-Token": self._music_user_token,
+                "Accept-Charset": "utf-8",  # Request UTF-8 explicitly
+                "Accept-Encoding": ACCEPT_ENCODING,
+            },
+        )
+    return cached[1]
+
+
+def _decode_json_body(self, endpoint: str, content: bytes, typed: bool = False) -> dict[str, Any]:
+    """
+    Parse a response body from bytes, replacing invalid UTF-8.
+
+    With `typed` (set per call by the library sync paths) library and
+    catalog song lists are decoded into typed structs by
+    decode_resource_list() when msgspec is installed; everything else
+    (and any body the structs do not fit) is parsed directly by
+    json_loads_fast(). Only a body with invalid UTF-8 is decoded to str
+    (with replacement characters) first, from the bytes already read
+    instead of a second download.
+
+    With PAYLOAD_NFC every string in the result is in NFC: one
+    json_needs_nfc() pass over the body, and only a body that fails it
+    (decomposed names, as uploaded songs carry) is parsed into dicts and
+    normalized string by string. Parsers need not normalize field by
+    field.
+    """
+    needs_nfc = PAYLOAD_NFC and json_needs_nfc(content)
+    if typed and not needs_nfc:
+        resources = decode_resource_list(content, endpoint)
+        if resources is not None:
+            return resources
+    try:
+        data = json_loads_fast(content)
+    except UnicodeDecodeError as exc:
+        self.logger.error(
+            "UTF-8 decode error for %s: %s. Trying fallback encoding.",
+            endpoint, str(exc)
+        )
+        content = content.decode('utf-8', errors='replace')  # Replace bad bytes with �
+        needs_nfc = PAYLOAD_NFC and json_needs_nfc(content)
+        data = json_loads_fast(content)
+    return nfc_strings(data) if needs_nfc else data
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key starts the call; callers arriving while it
+    runs await the same task instead of sending their own request, and
+    its result or exception reaches every one of them. A caller that gets
+    cancelled does not cancel the shared call for the others, but once
+    every caller has been cancelled the call is cancelled too and
+    forgotten: a request nobody waits for any more (such as the loser of
+    a hedge race) neither keeps running nor picks up new callers.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._waiters: dict[str, int] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the in-flight call for `key`, starting `call()` if there is none."""
+        self.calls += 1
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            self._waiters[key] = 0
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.coalesced += 1
+        self._waiters[key] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            # Still registered: this caller was cancelled before the call
+            # finished (a finished call is unregistered by _finished first)
+            if self._inflight.get(key) is task:
+                self._waiters[key] -= 1
+                if not self._waiters[key]:
+                    del self._inflight[key]
+                    del self._waiters[key]
+                    task.cancel()
+
+    def _finished(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+            del self._waiters[key]
+        # Every waiter may have been cancelled: retrieve the exception so
+        # asyncio does not log it as never retrieved
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> dict[str, Any]:
+        """Calls, how many were coalesced and the coalescing rate."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "rate": round(self.coalesced / self.calls, 3) if self.calls else 0.0,
+            "in_flight": len(self._inflight),
+        }
+
+
+async def _get_data_with_encoding(self, endpoint, typed: bool = False, **kwargs) -> dict[str, Any]:
+    """
+    Get data from API, coalescing identical concurrent calls.
+
+    Callers asking for the same endpoint and (normalized) parameters while
+    a request for it is in flight share that request through
+    self._single_flight, so a burst from the UI, an automation and a sync
+    costs one API call. The shared response dict must not be mutated.
+    The request itself is _request_data(); `typed` (library sync paths
+    only) asks it for typed structs and is part of the coalescing key, so
+    other callers never receive them.
+    """
+    key = ConditionalResponseCache.make_key(endpoint, kwargs)
+    return await self._single_flight.run(
+        f"{key}#typed" if typed else key,
+        lambda: self._request_data(endpoint, typed=typed, **kwargs),
+    )
+
+
+def _api_target(endpoint: str, kwargs: dict[str, Any]) -> tuple[Any, dict | None, str, bool]:
+    """
+    URL, query params, effective endpoint and cursor flag for a request.
+
+    `endpoint` may be a `next` cursor exactly as Apple returned it
+    ("/v1/me/library/songs?offset=50"): its query string is kept byte for
+    byte and only parameters it does not carry are appended from kwargs.
+    """
+    if not endpoint.startswith("/"):
+        return f"{APPLE_MUSIC_API_URL}{endpoint}", kwargs, endpoint, False
+
+    from yarl import URL
+
+    parts = urlsplit(endpoint)
+    cursor_params = {name for name, _value in parse_qsl(parts.query)}
+    extra = urlencode(
+        {name: value for name, value in kwargs.items() if name not in cursor_params},
+        safe=",",
+    )
+    if extra:
+        endpoint = f"{endpoint}{'&' if parts.query else '?'}{extra}"
+    # encoded=True: send the cursor byte for byte, no re-quoting
+    return URL(f"{APPLE_MUSIC_API_ORIGIN}{endpoint}", encoded=True), None, endpoint, True
+
+
+def _raise_for_api_status(self, endpoint: str, url: Any, kwargs: dict[str, Any], response) -> None:
+    """Convert an Apple Music error response into the provider's exceptions."""
+    if response.status == 404:
+        from music_assistant_models.errors import MediaNotFoundError
+        raise MediaNotFoundError(f"{endpoint} not found")
+
+    if response.status == 504:
+        self.logger.debug(
+            "Apple Music API Timeout: url=%s, params=%s, response_headers=%s",
+            url, kwargs, response.headers
+        )
+        from music_assistant_models.errors import ResourceTemporarilyUnavailable
+        raise ResourceTemporarilyUnavailable("Apple Music API Timeout")
+
+    if response.status == 429:
+        self.logger.debug("Apple Music Rate Limiter. Headers: %s", response.headers)
+        from music_assistant_models.errors import ResourceTemporarilyUnavailable
+        raise ResourceTemporarilyUnavailable("Apple Music Rate Limiter")
+
+    if response.status == 500:
+        from music_assistant_models.errors import MusicAssistantError
+        raise MusicAssistantError("Unexpected server error when calling Apple Music")
+
+    response.raise_for_status()
+
+
+async def _request_data(self, endpoint, typed: bool = False, **kwargs) -> dict[str, Any]:
+    """
+    Get data from API with explicit UTF-8 encoding validation.
+
+    This is the request behind _get_data_with_encoding() (the drop-in
+    replacement for _get_data()) and adds explicit charset handling to
+    ensure proper Unicode decoding.
+
+    `endpoint` may also be a `next` cursor exactly as Apple returned it
+    ("/v1/me/library/songs?offset=50"). Its query string is sent
+    unchanged; only parameters it does not carry (limit, include, ...)
+    are appended from kwargs.
+
+    Every attempt draws a token from the provider-wide
+    self._rate_limiter and reports the response back to it, so 429/504
+    responses slow the whole provider down instead of failing the caller.
+    Those responses are retried up to MAX_REQUEST_RETRIES times (this
+    replaces the @throttle_with_retries decorator) before surfacing as
+    ResourceTemporarilyUnavailable.
+
+    With self._response_cache set, stored validators are sent as
+    If-None-Match / If-Modified-Since and a 304 is answered from the
+    cached body; 200 responses carrying an ETag or Last-Modified are
+    stored for the next sync.
+
+    Bodies are requested gzip/brotli-compressed and decompressed while
+    they stream in by _read_body(); the cache stores them decompressed.
+    `typed` is passed on to _decode_json_body().
+    Requests go through the provider's ApiConnectionPool when one is set
+    up (self._api_pool), so they reuse warm keep-alive connections.
+    """
+    headers = self._api_headers()
+    url, params, endpoint, is_cursor = _api_target(endpoint, kwargs)
+
+    cache: ConditionalResponseCache | None = self._response_cache
+    cached = None
+    if cache is not None:
+        cache_key = cache.make_key(endpoint, params or {})
+        cached = await asyncio.to_thread(cache.get, cache_key)
+        if cached is not None:
+            etag, last_modified, _body = cached
+            headers = dict(headers)
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+    for attempt in range(MAX_REQUEST_RETRIES + 1):
+        await self._rate_limiter.acquire()
+
+        async with (
+            self._api_session().get(
+                url, headers=headers, params=params, ssl=True, timeout=120,
+                auto_decompress=False,
+            ) as response,
+        ):
+            self._rate_limiter.record_response(response.status, response.headers)
+
+            if response.status in (429, 504) and attempt < MAX_REQUEST_RETRIES:
+                self.logger.debug(
+                    "Retrying %s after HTTP %d (attempt %d/%d, rate now %.2f req/s)",
+                    endpoint, response.status, attempt + 1, MAX_REQUEST_RETRIES,
+                    self._rate_limiter.rate
+                )
+                continue
+
+            # Unchanged since the last sync: serve the stored body
+            if response.status == 304 and cached is not None:
+                cache.hits += 1
+                await asyncio.to_thread(cache.touch, cache_key)
+                return self._decode_json_body(endpoint, cached[2], typed)
+
+            if response.status == 404 and (is_cursor or ("limit" in kwargs and "offset" in kwargs)):
+                return {}
+
+            self._raise_for_api_status(endpoint, url, kwargs, response)
+
+            # Read the body once as bytes: it is cached as-is and decoded
+            # with explicit UTF-8 handling (no second read on bad bytes)
+            content = await self._read_body(endpoint, response)
+            if cache is not None:
+                cache.misses += 1
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if etag or last_modified:
+                    await asyncio.to_thread(cache.put, cache_key, etag, last_modified, content)
+            return self._decode_json_body(endpoint, content, typed)
 
 
 # ============================================================================
@@ -783,16 +4244,156 @@ TO APPLY THIS FIX:
 6. REPLACE get_library_playlists (lines 373-381) WITH:
    - get_library_playlists() from this file
 
+   REPLACE get_library_tracks (lines 348-371) WITH:
+   - get_library_tracks() from this file
+
+   ADD sync_request_params() and the SYNC_REQUEST_PROFILES constants. Every
+   library method takes a `profile` ("full" by default, see
+   SYNC_REQUEST_PROFILE); with "lean", ADD get_editorial_notes() and call
+   it from metadata enrichment for the notes the sync no longer fetches.
+
+   ADD the batch-native variants used by the item-by-item methods above:
+   - get_library_artists_batched()
+   - get_library_albums_batched()
+   - get_library_tracks_batched()
+   The library sync can consume these directly and upsert each yielded
+   list in one DB transaction instead of committing row by row. Page
+   fan-out (concurrent page requests once meta.total is known) stays off
+   unless a caller passes page_workers=FANOUT_WORKERS: only a consumer
+   that does not remove library items missing from a sync should, as
+   pages fetched together can miss items moved by mid-sync changes.
+
 7. REPLACE _parse_artist (lines 527-575) WITH:
-   - _parse_artist() from this file
+   - _build_artist() and _parse_artist() from this file
+   - ADD the BATCH PARSING section (ParseContext, ParseReport,
+     _parse_context(), _parse_artists_batch(), _parse_albums_batch(),
+     _parse_tracks_batch()); the sync paths parse whole pages through it
+   - ADD the SYNC-SCOPED STRING INTERNING section (StringPool, interning());
+     with SYNC_STRING_INTERNING on, each get_library_*_batched() sync
+     interns the strings of the items it parses into its own pool (less
+     memory per synced item, slower parsing; off by default)
+   - ADD the PRECOMPILED PARSE PLANS section (field maps, compile_field_reader()
+     and the readers compiled from them at import time)
+   _parse_artist relies on the module-level music_assistant_models imports
+   the provider already has (Artist, ItemMapping, MediaItemImage,
+   ProviderMapping, ImageType, MediaType); it no longer imports per call.
 
 8. ADD UTILITY FUNCTIONS at the top of the class (after line 264):
+   - _nfc() (the ASCII fast path)
    - safe_unicode_str()
    - safe_json_get()
    - truncate_for_log()
 
-9. OPTIONAL: Replace _get_data (lines 788-821) WITH:
+9. Replace _get_data (lines 788-821) WITH:
    - _get_data_with_encoding() from this file (rename to _get_data)
+   - Drop its @throttle_with_retries decorator (retries now live inside)
+   - ADD _request_data() (the HTTP request itself; _get_data coalesces
+     identical concurrent calls into one _request_data call)
+   - ADD _api_headers() (request headers built once per token pair)
+   - ADD _read_body() (streaming gzip/brotli decompression; needs the
+     StreamDecoder and TransferStats classes and the optional brotli
+     import)
+   - ADD _api_target() and _raise_for_api_status() (shared with the
+     streamed requests below)
+   - ADD _decode_json_body() (shared by fresh and cached responses) and
+     the module-level json_loads_fast() plus its optional orjson import
+   - ADD json_needs_nfc(), nfc_strings() and normalized_strings(): with
+     PAYLOAD_NFC every response is NFC-normalized once as it is decoded
+     and the batch parsers stop normalizing field by field
+   - ADD the TYPED FIELD-SELECTIVE DECODING section (optional msgspec
+     import, the *Resource/*List structs, decode_resource_list() and
+     json_encoded_size()). Library pages and catalog song batches
+     requested by the sync paths (typed=True) then reach the parsers as
+     compact structs; the parsers' .get()/[]/in
+     calls work on them as on dicts. Without msgspec nothing changes.
+   _get_data now also accepts a `next` href as returned by Apple and
+   sends it unchanged; pagination follows those cursors whenever they
+   stop matching plain offset math.
+
+   ADD module-level helpers next to the utility functions:
+   - parse_retry_after()
+   - AdaptiveRateLimiter
+   - ConditionalResponseCache
+   - ApiConnectionPool
+   - CatalogCache
+   - SingleFlight
+   - CatalogBatchLoader
+
+   In handle_async_init, REPLACE the fixed throttler:
+       self.throttler = ThrottlerManager(rate_limit=1, period=2)
+   WITH the shared limiter:
+       self._rate_limiter = AdaptiveRateLimiter(logger=self.logger)
+   and wrap other direct API calls (e.g. the stream metadata POST in
+   _fetch_song_stream_metadata) in `async with self._rate_limiter:`,
+   calling self._rate_limiter.record_response(status, headers) after.
+   Current rate: self._rate_limiter.rate / self._rate_limiter.stats()
+
+   Also in handle_async_init, set up the sync checkpoint store:
+       self._checkpoint_store = SyncCheckpointStore(
+           os.path.join(self.mass.storage_path, f"{self.instance_id}_sync.json")
+       )
+   Resuming is off by default: a resumed sync yields only the items after
+   the checkpoint, and sync_library() removes library items a sync did
+   not yield. Pass checkpoint=True to get_library_*_batched() /
+   get_library_playlists() only from a caller that keeps the skipped
+   head (e.g. one that skips removals after a resumed sync).
+
+   And the per-endpoint pipeline stage stats:
+       self._sync_stats: dict[str, list[dict]] = {}
+
+   And the conditional-request cache (None disables it):
+       self._response_cache = ConditionalResponseCache(
+           os.path.join(self.mass.storage_path, f"{self.instance_id}_http_cache.db")
+       )
+   closed in unload() with self._response_cache.close(). Hit/miss
+   counters: self._response_cache.stats()
+
+   And the dedicated connection pool (None falls back to
+   mass.http_session), warmed up before the first sync:
+       self._api_pool = ApiConnectionPool()
+       await self._api_pool.warm_up()
+   ADD _api_session(). Close the pool in unload() with
+   await self._api_pool.close(). Open/idle connections, reuse rate and
+   handshake times: self._api_pool.stats()
+
+   Opt-in streaming of very large responses: ADD the STREAMING JSON
+   ITEM PARSING section (DataItemStream, _stream_data_batches(),
+   _stream_data_items(), _stream_all_items(), _stream_catalog_batches())
+   and _iter_body(). Then
+   _get_all_items_streaming(endpoint, stream_items=True) (e.g. for
+   playlists with thousands of tracks) and
+   get_library_tracks_batched(stream_catalog=True) yield items while
+   the response is still arriving.
+
+   And the per-endpoint transfer byte counters used by _read_body:
+       self._transfer_stats = TransferStats()
+   Compressed vs. decompressed bytes: self._transfer_stats.stats()
+
+   And the single-flight registry used by _get_data:
+       self._single_flight = SingleFlight()
+   Coalescing rate: self._single_flight.stats()
+
+   And the in-memory catalog cache (None disables it):
+       self._catalog_cache = CatalogCache()
+   ADD _get_catalog_data() and call it instead of self._get_data() for
+   catalog/{storefront}/... lookups (get_artist, get_album, get_playlist,
+   get_artist_albums, get_album_tracks, ...). Hit rate and memory use:
+   self._catalog_cache.stats()
+
+   And the micro-batching loader for single catalog lookups (None
+   disables it; needs the catalog cache):
+       self._catalog_loader = CatalogBatchLoader(self._fetch_catalog_ids)
+   ADD _fetch_catalog_ids(). Single-ID lookups through _get_catalog_data()
+   that run concurrently (resolving playlist tracks, album artists, ...)
+   then become one ids= call per type. Batching stats:
+   self._catalog_loader.stats()
+
+   And the per-endpoint latency tracker used for hedging:
+       self._latency = LatencyTracker()
+   Browse paths that should benefit from hedging (get_artist_albums,
+   get_album_tracks, get_playlist, ...) call self._get_data_hedged()
+   instead of self._get_data(). Latency percentiles and hedge counters:
+   self._latency.stats()
 
 10. RESTART MUSIC ASSISTANT
 
@@ -862,6 +4463,9 @@ If a single artist fails to parse:
 If a page fetch fails:
 → Logs warning with page number
 → Continues to next page (up to 3 consecutive errors)
+→ Retries the page concurrently, with backoff, after the main scan
+→ After 3 errors in a row, resumes the scan once those retries succeed
+→ Logs any pages still missing (and an unscanned tail) in the sync summary
 
 If a critical error occurs:
 → Logs error with progress summary
@@ -870,8 +4474,11 @@ If a critical error occurs:
 PERFORMANCE:
 ============
 
-- Memory: Constant (streams items, no accumulation)
-- Speed: Same as original (1 req/2sec rate limit)
+- Memory: Constant (streams items, at most PREFETCH_PAGES + 1 pages held)
+- Speed: Page round trips overlap with parsing/DB writes (PREFETCH_PAGES
+  requests in flight); pass prefetch=0 for the old serial behaviour
+- Rate: Adaptive, starts at RATE_LIMIT_INITIAL req/s and grows while
+  Apple answers cleanly; never drops below the old 1 req/2 s
 - Error resilience: High (continues on errors)
 - Logging: Moderate (debug logs for Unicode, info for progress)
 """
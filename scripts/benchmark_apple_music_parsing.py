@@ -0,0 +1,1426 @@
+#!/usr/bin/env python3
+"""
+Benchmark the hot paths of the Apple Music library sync.
+
+Measures the response-decoding code from apple_music_unicode_fix.py on
+realistic Apple Music payloads, so changes to it can be compared before
+they are applied to the Music Assistant provider: JSON decoding from bytes,
+the typed (msgspec) structs against plain dicts, and the payload saved by
+the "lean" sync request profile, _parse_artist before and after it
+moved to precompiled parse plans (needs music_assistant_models), and the
+memory parsed tracks hold with and without the sync's string pool, and
+safe_unicode_str() on the test_unicode_handling.py names with its ASCII
+fast path and the alternatives measured against it, and a library sync
+normalizing field by field against normalizing each body once at decode
+time.
+
+Payloads are synthetic but shaped like real responses:
+- a 50-item me/library/artists page (include=catalog, extend=editorialNotes)
+- a 300-item catalog/{sf}/songs?ids= batch (include=artists,albums)
+with a mix of ASCII, diacritic, CJK, RTL and emoji names.
+
+Usage:
+    python3 benchmark_apple_music_parsing.py
+"""
+
+import gzip
+import json
+import logging
+import random
+import re
+import time
+import tracemalloc
+import unicodedata
+from contextlib import contextmanager
+from contextvars import ContextVar
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    from music_assistant_models.enums import ImageType, MediaType
+    from music_assistant_models.media_items import (
+        Artist,
+        ItemMapping,
+        MediaItemImage,
+        ProviderMapping,
+    )
+except ImportError:  # The parser benchmark needs the real models
+    Artist = None
+
+
+# ============================================================================
+# FUNCTIONS UNDER TEST (copied from fix)
+# ============================================================================
+
+def json_loads_fast(content: bytes | str) -> Any:
+    """Parse a JSON response body straight from bytes (orjson or stdlib)."""
+    if orjson is None:
+        return json.loads(content)
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        if isinstance(content, bytes):
+            content.decode("utf-8")
+        raise
+
+
+def json_loads_via_text(content: bytes) -> Any:
+    """Previous path: response.text(encoding='utf-8'), then json_loads(str)."""
+    text = content.decode("utf-8")
+    if orjson is None:
+        return json.loads(text)
+    return orjson.loads(text)
+
+
+NFC_CHECK_SLICE = 8192
+
+# A \uXXXX escape of a non-ASCII character, or of an ASCII one followed
+# by a non-ASCII character (say a combining mark): text-level
+# normalization cannot see the character the escape stands for
+_NON_ASCII_ESCAPE = re.compile(r"\\u(?!00[0-7][0-9a-fA-F](?:[\x00-\x7f]|$))")
+
+
+def json_needs_nfc(content: bytes | str) -> bool:
+    """
+    Whether some string in a JSON document is not in NFC.
+
+    One pass over the text decides for the whole document: JSON syntax is
+    ASCII and composes with nothing, so the text is in NFC exactly when
+    every string in it is. An ASCII body needs no decoding to tell.
+    Otherwise is_normalized() checks NFC_CHECK_SLICE characters at a time
+    (each slice starting one character early, so a base character and
+    the combining mark after it are never checked apart) and the first
+    failing slice answers: on a decomposed string is_normalized() has to
+    compose its input, which for a whole catalog batch costs more than
+    normalizing its strings.
+    Characters written as \\u escapes only exist once parsed, so a body
+    with a non-ASCII escape always answers True. Invalid UTF-8 answers
+    False and is left to the caller's fallback.
+    """
+    escaped = (b"\\u" if isinstance(content, bytes) else "\\u") in content
+    if not escaped and content.isascii():
+        return False
+    try:
+        text = content.decode("utf-8") if isinstance(content, bytes) else content
+    except UnicodeDecodeError:
+        return False
+    if escaped and _NON_ASCII_ESCAPE.search(text):
+        return True
+    if text.isascii():
+        return False
+    for start in range(0, len(text), NFC_CHECK_SLICE):
+        if not unicodedata.is_normalized("NFC", text[max(start - 1, 0):start + NFC_CHECK_SLICE]):
+            return True
+    return False
+
+
+def nfc_strings(value: Any) -> Any:
+    """
+    `value` (parsed JSON) with every non-ASCII string in NFC.
+
+    Only run on documents json_needs_nfc() flagged: normalizing the
+    parsed strings touches just the non-ASCII ones, where normalizing the
+    whole text would also decompose and recompose all of its syntax,
+    IDs and URLs (several times slower on a catalog batch).
+    """
+    if isinstance(value, str):
+        return value if value.isascii() else unicodedata.normalize("NFC", value)
+    if isinstance(value, dict):
+        return {key: nfc_strings(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [nfc_strings(item) for item in value]
+    return value
+
+
+if msgspec is not None:
+
+    class ApiStruct(msgspec.Struct, gc=False):
+        """Base for the typed resources: read-only dict-style field access."""
+
+        def get(self, key: str, default: Any = None) -> Any:
+            value = getattr(self, key, msgspec.UNSET)
+            return default if value is msgspec.UNSET else value
+
+        def __getitem__(self, key: str) -> Any:
+            value = getattr(self, key, msgspec.UNSET)
+            if value is msgspec.UNSET:
+                raise KeyError(key)
+            return value
+
+        def __contains__(self, key: object) -> bool:
+            return isinstance(key, str) and getattr(self, key, msgspec.UNSET) is not msgspec.UNSET
+
+    class Artwork(ApiStruct):
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        width: int | None | msgspec.UnsetType = msgspec.UNSET
+        height: int | None | msgspec.UnsetType = msgspec.UNSET
+
+    class EditorialNotes(ApiStruct):
+        standard: str | None | msgspec.UnsetType = msgspec.UNSET
+        short: str | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PlayParams(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        kind: str | None | msgspec.UnsetType = msgspec.UNSET
+        catalogId: str | None | msgspec.UnsetType = msgspec.UNSET
+        globalId: str | None | msgspec.UnsetType = msgspec.UNSET
+        isLibrary: bool | None | msgspec.UnsetType = msgspec.UNSET
+
+    class PageMeta(ApiStruct):
+        total: int | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        editorialNotes: EditorialNotes | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        artistName: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        releaseDate: str | None | msgspec.UnsetType = msgspec.UNSET
+        editorialNotes: EditorialNotes | None | msgspec.UnsetType = msgspec.UNSET
+        recordLabel: str | None | msgspec.UnsetType = msgspec.UNSET
+        copyright: str | None | msgspec.UnsetType = msgspec.UNSET
+        upc: str | None | msgspec.UnsetType = msgspec.UNSET
+        contentRating: str | None | msgspec.UnsetType = msgspec.UNSET
+        isSingle: bool | None | msgspec.UnsetType = msgspec.UNSET
+        isCompilation: bool | None | msgspec.UnsetType = msgspec.UNSET
+        trackCount: int | None | msgspec.UnsetType = msgspec.UNSET
+        audioTraits: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        playParams: PlayParams | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongAttributes(ApiStruct):
+        name: str | None | msgspec.UnsetType = msgspec.UNSET
+        artistName: str | None | msgspec.UnsetType = msgspec.UNSET
+        albumName: str | None | msgspec.UnsetType = msgspec.UNSET
+        composerName: str | None | msgspec.UnsetType = msgspec.UNSET
+        url: str | None | msgspec.UnsetType = msgspec.UNSET
+        artwork: Artwork | None | msgspec.UnsetType = msgspec.UNSET
+        genreNames: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        releaseDate: str | None | msgspec.UnsetType = msgspec.UNSET
+        durationInMillis: int | None | msgspec.UnsetType = msgspec.UNSET
+        trackNumber: int | None | msgspec.UnsetType = msgspec.UNSET
+        discNumber: int | None | msgspec.UnsetType = msgspec.UNSET
+        isrc: str | None | msgspec.UnsetType = msgspec.UNSET
+        contentRating: str | None | msgspec.UnsetType = msgspec.UNSET
+        audioTraits: list[str] | None | msgspec.UnsetType = msgspec.UNSET
+        playParams: PlayParams | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistList(ApiStruct):
+        data: "list[ArtistResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumList(ApiStruct):
+        data: "list[AlbumResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongList(ApiStruct):
+        data: "list[SongResource] | None | msgspec.UnsetType" = msgspec.UNSET
+        next: str | None | msgspec.UnsetType = msgspec.UNSET
+        meta: PageMeta | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistRelationships(ApiStruct):
+        catalog: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumRelationships(ApiStruct):
+        catalog: AlbumList | None | msgspec.UnsetType = msgspec.UNSET
+        artists: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongRelationships(ApiStruct):
+        catalog: SongList | None | msgspec.UnsetType = msgspec.UNSET
+        artists: ArtistList | None | msgspec.UnsetType = msgspec.UNSET
+        albums: AlbumList | None | msgspec.UnsetType = msgspec.UNSET
+
+    class ArtistResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: ArtistAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: ArtistRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    class AlbumResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: AlbumAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: AlbumRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    class SongResource(ApiStruct):
+        id: str | None | msgspec.UnsetType = msgspec.UNSET
+        type: str | None | msgspec.UnsetType = msgspec.UNSET
+        attributes: SongAttributes | None | msgspec.UnsetType = msgspec.UNSET
+        relationships: SongRelationships | None | msgspec.UnsetType = msgspec.UNSET
+
+    JSON_MAPPINGS: tuple[type, ...] = (dict, ApiStruct)
+else:
+    JSON_MAPPINGS = (dict,)
+
+
+# Lean request profile for the phases benchmarked below
+_ARTIST_FIELDS = "name,url,artwork,genreNames"
+_SONG_FIELDS = (
+    "name,artistName,albumName,composerName,url,artwork,genreNames,releaseDate,"
+    "durationInMillis,trackNumber,discNumber,isrc,contentRating,audioTraits,playParams"
+)
+LEAN_PROFILE = {
+    "artists": {
+        "include": "catalog",
+        "fields[library-artists]": "name,catalog",
+        "fields[artists]": _ARTIST_FIELDS,
+    },
+    "catalog_songs": {
+        "include": "artists,albums",
+        "fields[songs]": f"{_SONG_FIELDS},artists,albums",
+        "fields[artists]": "name,url",
+        "fields[albums]": "name,artistName,url,releaseDate,upc,contentRating,isSingle,isCompilation",
+    },
+}
+
+
+# ============================================================================
+# STRING INTERNING UNDER TEST (copied from fix)
+# ============================================================================
+
+INTERN_POOL_MAX = 50_000
+INTERN_MAX_LENGTH = 200
+
+
+class StringPool:
+    """
+    Bounded interning table for the strings one library sync repeats.
+
+    Every decoded page carries its own copy of each artist name, album
+    name, genre and artwork URL, and every parsed item would keep that
+    copy alive. Routed through the pool (see interning()), equal strings
+    resolve to the first copy seen, and equal genre collections to one
+    shared frozenset. Strings longer than `max_length` are passed
+    through; once `max_size` strings are held new ones are passed through
+    too (no eviction: the table lives only as long as the sync).
+    """
+
+    def __init__(self, max_size: int = INTERN_POOL_MAX, max_length: int = INTERN_MAX_LENGTH) -> None:
+        self.max_size = max_size
+        self.max_length = max_length
+        self._strings: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self.passed = 0
+
+    def intern(self, text: str) -> str:
+        """The pooled copy of `text` (added on first sight while there is room)."""
+        if len(text) > self.max_length:
+            self.passed += 1
+            return text
+        pooled = self._strings.get(text)
+        if pooled is not None:
+            self.hits += 1
+            return pooled
+        if len(self._strings) >= self.max_size:
+            self.passed += 1
+            return text
+        self.misses += 1
+        self._strings[text] = text
+        return text
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "strings": len(self._strings),
+            "hits": self.hits,
+            "misses": self.misses,
+            "passed": self.passed,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def __str__(self) -> str:
+        stats = self.stats()
+        return (
+            f"{stats['strings']} strings, "
+            f"{stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, {stats['passed']} passed through)"
+        )
+
+
+# The pool safe_unicode_str() interns into; set by interning() around a
+# (synchronous) batch parse, None everywhere else
+_active_string_pool: ContextVar[StringPool | None] = ContextVar(
+    "apple_music_string_pool", default=None
+)
+
+
+@contextmanager
+def interning(pool: StringPool | None) -> Iterator[None]:
+    """Route safe_unicode_str() through `pool` for the duration of the block."""
+    if pool is None:
+        yield
+        return
+    token = _active_string_pool.set(pool)
+    try:
+        yield
+    finally:
+        _active_string_pool.reset(token)
+
+
+# ============================================================================
+# ARTIST PARSERS UNDER TEST (copied from fix; previous and plan-based)
+# ============================================================================
+
+def _nfc(text: str) -> str:
+    """
+    NFC form of `text`, with the fast path safe_unicode_str() runs on.
+
+    ASCII is always NFC and comes back as is (str.isascii() reads a flag
+    CPython keeps on the string). Everything else goes straight to
+    normalize(), which returns NFC input unchanged after its own quick
+    check. Neither an is_normalized() pre-check nor a memo of composed
+    strings paid for itself: the pre-check scans decomposed strings
+    twice, and the memo's hash and lookup cost NFC text (nearly all of
+    what Apple sends) more than it saved on repeated NFD names (see
+    benchmark_unicode_normalization()).
+    """
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
+# True while a batch parser reads API payloads that _decode_json_body() or
+# DataItemStream already normalized (PAYLOAD_NFC): safe_unicode_str()
+# then takes str values as they are. Set by normalized_strings()
+_strings_normalized: ContextVar[bool] = ContextVar(
+    "apple_music_strings_normalized", default=False
+)
+
+
+@contextmanager
+def normalized_strings(enabled: bool = True) -> Iterator[None]:
+    """Let safe_unicode_str() skip NFC for str values within the block."""
+    if not enabled:
+        yield
+        return
+    token = _strings_normalized.set(True)
+    try:
+        yield
+    finally:
+        _strings_normalized.reset(token)
+
+
+def safe_unicode_str(value: Any, fallback: str = "") -> str:
+    """
+    Safely convert any value to a Unicode string.
+
+    Handles:
+    - None values
+    - Bytes that need decoding
+    - Invalid UTF-8 sequences
+    - All Unicode normalization forms
+
+    Args:
+        value: Any value to convert to string
+        fallback: Default value if conversion fails
+
+    Returns:
+        Safe Unicode string
+    """
+    if value is None:
+        return fallback
+
+    # If it's already a string, normalize it
+    if isinstance(value, str):
+        # Normalize to NFC (Canonical Composition) for consistent representation
+        # This ensures "é" is stored as single codepoint, not "e" + combining accent
+        # (already done once for the whole payload inside normalized_strings())
+        text = value if _strings_normalized.get() else _nfc(value)
+
+    # If it's bytes, decode with error handling
+    elif isinstance(value, bytes):
+        try:
+            # Try UTF-8 first
+            decoded = value.decode('utf-8')
+        except UnicodeDecodeError:
+            try:
+                # Fallback to Latin-1 (never fails but may be wrong)
+                decoded = value.decode('latin-1')
+            except Exception:
+                return fallback
+        text = _nfc(decoded)
+
+    # For other types, convert to string and normalize
+    else:
+        try:
+            text = _nfc(str(value))
+        except Exception:
+            return fallback
+
+    # Inside a batch parse, repeated strings share one object (StringPool)
+    pool = _active_string_pool.get()
+    return text if pool is None else pool.intern(text)
+
+
+# Normalizers measured against _nfc() by benchmark_unicode_normalization()
+def nfc_always(text: str) -> str:
+    """What safe_unicode_str() did before: normalize() every string."""
+    return unicodedata.normalize('NFC', text)
+
+
+def nfc_prechecked(text: str) -> str:
+    """ASCII check, then an is_normalized() pre-check."""
+    if text.isascii() or unicodedata.is_normalized('NFC', text):
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
+NFC_MEMO_MAX = 4096
+NFC_MEMO_MAX_LENGTH = 200
+
+_nfc_memo: dict[str, str] = {}
+
+
+def nfc_memoized(text: str) -> str:
+    """ASCII check, then a bounded memo of composed strings (dropped from _nfc())."""
+    if text.isascii():
+        return text
+    normalized = _nfc_memo.get(text)
+    if normalized is None:
+        normalized = unicodedata.normalize('NFC', text)
+        if len(text) <= NFC_MEMO_MAX_LENGTH:
+            if len(_nfc_memo) >= NFC_MEMO_MAX:
+                _nfc_memo.clear()
+            _nfc_memo[text] = normalized
+    return normalized
+
+
+def safe_unicode_str_with(nfc: Callable[[str], str]) -> Callable[[Any], str]:
+    """safe_unicode_str() (for str values) with another normalizer in place of _nfc()."""
+    def safe_str(value: Any, fallback: str = "") -> str:
+        if value is None:
+            return fallback
+        text = nfc(value) if isinstance(value, str) else nfc(str(value))
+        pool = _active_string_pool.get()
+        return text if pool is None else pool.intern(text)
+    return safe_str
+
+
+def safe_json_get(data: dict, *keys, default: Any = None) -> Any:
+    """
+    Safely navigate nested dictionary with Unicode keys and list indexing.
+
+    Args:
+        data: Dictionary to navigate
+        *keys: Sequence of keys to traverse (can include int for list indexing)
+        default: Default value if key not found
+
+    Returns:
+        Value at the nested key or default
+
+    Example:
+        safe_json_get(data, "attributes", "name", default="Unknown")
+        safe_json_get(data, "relationships", "catalog", "data", 0, "id")
+    """
+    current = data
+    for key in keys:
+        # Handle dictionary keys (and typed structs)
+        if isinstance(current, JSON_MAPPINGS):
+            current = current.get(key)
+            if current is None:
+                return default
+        # Handle list/tuple indexing
+        elif isinstance(current, (list, tuple)):
+            if isinstance(key, int):
+                try:
+                    current = current[key]
+                except (IndexError, TypeError):
+                    return default
+            else:
+                return default
+        else:
+            return default
+    return current
+
+
+def truncate_for_log(text: str, max_length: int = 100) -> str:
+    """
+    Safely truncate text for logging, preserving Unicode characters.
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length in characters (not bytes)
+
+    Returns:
+        Truncated text with ellipsis if needed
+    """
+    if not text:
+        return ""
+
+    # Ensure it's a proper string
+    text = safe_unicode_str(text)
+
+    # Truncate by character count, not byte count
+    if len(text) <= max_length:
+        return text
+
+    return text[:max_length - 3] + "..."
+
+
+# Declarative field maps: output field -> key path. RESOURCE_SOURCE_PLAN
+# reads what decides which object a library item is parsed from (its
+# catalog resource when it has one); the per-type plans read the
+# attributes of that object. compile_field_reader() turns each map into
+# one function when the module loads.
+RESOURCE_SOURCE_PLAN: dict[str, tuple] = {
+    "type": ("type",),
+    "id": ("id",),
+    "attributes": ("attributes",),
+    "catalog_id": ("relationships", "catalog", "data", 0, "id"),
+    "catalog_attributes": ("relationships", "catalog", "data", 0, "attributes"),
+}
+ARTIST_PARSE_PLAN: dict[str, tuple] = {
+    "name": ("name",),
+    "url": ("url",),
+    "artwork_url": ("artwork", "url"),
+    "artwork_width": ("artwork", "width"),
+    "artwork_height": ("artwork", "height"),
+    "genres": ("genreNames",),
+    "notes_standard": ("editorialNotes", "standard"),
+    "notes_short": ("editorialNotes", "short"),
+}
+
+# Raised by a subscript chain that runs into a missing key, a short list,
+# None or a value of another shape
+_PLAN_MISSING = (KeyError, IndexError, TypeError)
+
+
+def compile_field_reader(plan: dict[str, tuple], name: str = "read_fields") -> Callable[[Any], tuple]:
+    """
+    Compile a field map into one function returning the fields as a tuple.
+
+    Every path becomes a plain subscript chain (obj["a"]["b"][0]) in
+    generated source, so reading a field costs a few subscripts instead of
+    a safe_json_get() call walking the path; a field that is missing, null
+    or of the wrong shape anywhere along its path reads as None. Works on
+    dicts and on the typed structs alike. Values come back in plan order.
+    """
+    lines = [f"def {name}(obj):"]
+    for idx, path in enumerate(plan.values()):
+        chain = "".join(f"[{key!r}]" for key in path)
+        lines += [
+            "    try:",
+            f"        v{idx} = obj{chain}",
+            "    except _PLAN_MISSING:",
+            f"        v{idx} = None",
+        ]
+    lines.append(f"    return ({''.join(f'v{idx}, ' for idx in range(len(plan)))})")
+    namespace: dict[str, Any] = {"_PLAN_MISSING": _PLAN_MISSING}
+    exec(compile("\n".join(lines), f"<parse plan {name}>", "exec"), namespace)
+    return namespace[name]
+
+
+_read_resource_source = compile_field_reader(RESOURCE_SOURCE_PLAN, "read_resource_source")
+_read_artist_fields = compile_field_reader(ARTIST_PARSE_PLAN, "read_artist_fields")
+
+
+def _artwork_path(url: Any, width: Any, height: Any) -> str | None:
+    """Artwork URL with its {w}x{h} template filled in (600 when unknown)."""
+    if not url:
+        return None
+    try:
+        path = safe_unicode_str(url).format(
+            w=600 if width is None else width, h=600 if height is None else height
+        )
+    except (AttributeError, KeyError, IndexError, ValueError):
+        # Template with other placeholders: no image rather than no artist
+        return None
+    pool = _active_string_pool.get()
+    return path if pool is None else pool.intern(path)
+
+
+def parse_artist_previous(self, artist_obj: dict) -> Any:
+    """
+    Parse artist object with comprehensive Unicode support.
+
+    Handles all Unicode characters in artist names, descriptions, URLs.
+    Returns None on parse failure to avoid stopping sync.
+    """
+    try:
+        relationships = artist_obj.get("relationships", {})
+
+        # Extract artist ID and attributes
+        if (
+            artist_obj.get("type") == "library-artists"
+            and relationships.get("catalog", {}).get("data", []) != []
+        ):
+            artist_id = safe_json_get(
+                relationships, "catalog", "data", 0, "id",
+                default=artist_obj.get("id", "unknown")
+            )
+            attributes = safe_json_get(
+                relationships, "catalog", "data", 0, "attributes",
+                default={}
+            )
+        elif "attributes" in artist_obj:
+            artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
+            attributes = artist_obj.get("attributes", {})
+        else:
+            artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
+            self.logger.debug(
+                "No attributes found for artist %s, returning basic mapping",
+                truncate_for_log(artist_id, 50)
+            )
+            # Return basic ItemMapping for artists without full details
+            from music_assistant_models.media_items import ItemMapping, MediaType
+            return ItemMapping(
+                media_type=MediaType.ARTIST,
+                provider=self.lookup_key,
+                item_id=artist_id,
+                name=artist_id,
+            )
+
+        # Extract name with Unicode safety
+        artist_name = safe_unicode_str(
+            attributes.get("name"),
+            fallback=f"Artist {artist_id}"
+        )
+
+        # Extract URL with Unicode safety (URLs should be ASCII but handle just in case)
+        artist_url = safe_unicode_str(attributes.get("url"), fallback="")
+
+        # Create artist object
+        from music_assistant_models.media_items import Artist, ProviderMapping
+        from music_assistant_models.enums import ImageType
+        from music_assistant_models.media_items import MediaItemImage
+
+        artist = Artist(
+            item_id=artist_id,
+            name=artist_name,
+            provider=self.domain,
+            provider_mappings={
+                ProviderMapping(
+                    item_id=artist_id,
+                    provider_domain=self.domain,
+                    provider_instance=self.instance_id,
+                    url=artist_url if artist_url else None,
+                )
+            },
+        )
+
+        # Extract artwork (handle Unicode in URLs)
+        if artwork := attributes.get("artwork"):
+            try:
+                artwork_url = safe_unicode_str(artwork.get("url", ""))
+                if artwork_url:
+                    # Format URL with dimensions
+                    width = artwork.get("width", 600)
+                    height = artwork.get("height", 600)
+                    formatted_url = artwork_url.format(w=width, h=height)
+
+                    artist.metadata.images = [
+                        MediaItemImage(
+                            type=ImageType.THUMB,
+                            path=formatted_url,
+                            provider=self.lookup_key,
+                            remotely_accessible=True,
+                        )
+                    ]
+            except Exception as exc:
+                # Log but don't fail on artwork issues
+                self.logger.debug(
+                    "Could not process artwork for artist %s: %s",
+                    truncate_for_log(artist_name, 40),
+                    safe_unicode_str(str(exc))
+                )
+
+        # Extract genres (handle Unicode genre names)
+        if genres := attributes.get("genreNames"):
+            try:
+                artist.metadata.genres = {
+                    safe_unicode_str(genre) for genre in genres if genre
+                }
+            except Exception as exc:
+                self.logger.debug(
+                    "Could not process genres for artist %s: %s",
+                    truncate_for_log(artist_name, 40),
+                    safe_unicode_str(str(exc))
+                )
+
+        # Extract editorial notes (handle Unicode descriptions)
+        if notes := attributes.get("editorialNotes"):
+            try:
+                description = (
+                    safe_unicode_str(notes.get("standard")) or
+                    safe_unicode_str(notes.get("short"))
+                )
+                if description:
+                    artist.metadata.description = description
+            except Exception as exc:
+                self.logger.debug(
+                    "Could not process editorial notes for artist %s: %s",
+                    truncate_for_log(artist_name, 40),
+                    safe_unicode_str(str(exc))
+                )
+
+        return artist
+
+    except Exception as exc:
+        # Comprehensive error logging
+        artist_id = safe_unicode_str(artist_obj.get("id", "unknown"))
+        artist_name = safe_json_get(
+            artist_obj, "attributes", "name",
+            default=safe_json_get(
+                artist_obj, "relationships", "catalog", "data", 0, "attributes", "name",
+                default="Unknown"
+            )
+        )
+
+        self.logger.error(
+            "Failed to parse artist (id=%s, name=%s): %s",
+            truncate_for_log(artist_id, 30),
+            truncate_for_log(safe_unicode_str(artist_name), 50),
+            truncate_for_log(safe_unicode_str(str(exc)), 100)
+        )
+
+        # Return None to skip this artist and continue sync
+        return None
+
+
+# ============================================================================
+
+
+def parse_artist_planned(self, artist_obj: dict) -> Any:
+    """
+    Parse artist object with comprehensive Unicode support.
+
+    Handles all Unicode characters in artist names, descriptions, URLs.
+    Fields are read by the precompiled ARTIST_PARSE_PLAN reader; one
+    error boundary covers the whole item and returns None on parse
+    failure to avoid stopping sync.
+    """
+    try:
+        res_type, res_id, attributes, catalog_id, catalog_attributes = (
+            _read_resource_source(artist_obj)
+        )
+
+        # Library artist with a catalog match: parse the catalog resource
+        if res_type == "library-artists" and (catalog_id is not None or catalog_attributes is not None):
+            artist_id = res_id if catalog_id is None else catalog_id
+            if artist_id is None:
+                artist_id = "unknown"
+            attributes = catalog_attributes or {}
+        else:
+            artist_id = safe_unicode_str(res_id, fallback="unknown")
+            if attributes is None:
+                self.logger.debug(
+                    "No attributes found for artist %s, returning basic mapping",
+                    truncate_for_log(artist_id, 50)
+                )
+                # Return basic ItemMapping for artists without full details
+                return ItemMapping(
+                    media_type=MediaType.ARTIST,
+                    provider=self.lookup_key,
+                    item_id=artist_id,
+                    name=artist_id,
+                )
+
+        name, url, artwork_url, width, height, genres, notes_standard, notes_short = (
+            _read_artist_fields(attributes)
+        )
+        artist_url = safe_unicode_str(url)
+        artist = Artist(
+            item_id=artist_id,
+            name=safe_unicode_str(name, fallback=f"Artist {artist_id}"),
+            provider=self.domain,
+            provider_mappings={
+                ProviderMapping(
+                    item_id=artist_id,
+                    provider_domain=self.domain,
+                    provider_instance=self.instance_id,
+                    url=artist_url if artist_url else None,
+                )
+            },
+        )
+        if image_path := _artwork_path(artwork_url, width, height):
+            artist.metadata.images = [
+                MediaItemImage(
+                    type=ImageType.THUMB,
+                    path=image_path,
+                    provider=self.lookup_key,
+                    remotely_accessible=True,
+                )
+            ]
+        if genres:
+            artist.metadata.genres = {safe_unicode_str(genre) for genre in genres if genre}
+        if description := safe_unicode_str(notes_standard) or safe_unicode_str(notes_short):
+            artist.metadata.description = description
+        return artist
+
+    except Exception as exc:
+        # Comprehensive error logging
+        artist_id = safe_unicode_str(safe_json_get(artist_obj, "id", default="unknown"))
+        artist_name = safe_json_get(
+            artist_obj, "attributes", "name",
+            default=safe_json_get(
+                artist_obj, "relationships", "catalog", "data", 0, "attributes", "name",
+                default="Unknown"
+            )
+        )
+
+        self.logger.error(
+            "Failed to parse artist (id=%s, name=%s): %s",
+            truncate_for_log(artist_id, 30),
+            truncate_for_log(safe_unicode_str(artist_name), 50),
+            truncate_for_log(safe_unicode_str(str(exc)), 100)
+        )
+
+        # Return None to skip this artist and continue sync
+        return None
+
+
+# ============================================================================
+# PARSER FIELD READS (the lookups _parse_artist / _parse_track make)
+# ============================================================================
+
+def read_artist(artist_obj: Any) -> tuple:
+    """Every field _parse_artist reads, read the way it reads them."""
+    relationships = artist_obj.get("relationships", {})
+    if (
+        artist_obj.get("type") == "library-artists"
+        and relationships.get("catalog", {}).get("data", []) != []
+    ):
+        catalog = relationships["catalog"]["data"][0]
+        artist_id = catalog.get("id")
+        attributes = catalog.get("attributes", {})
+    else:
+        artist_id = artist_obj.get("id")
+        attributes = artist_obj.get("attributes", {})
+    artwork = attributes.get("artwork") or {}
+    notes = attributes.get("editorialNotes") or {}
+    return (
+        artist_id,
+        attributes.get("name"),
+        attributes.get("url"),
+        artwork.get("url", "").format(w=artwork.get("width", 600), h=artwork.get("height", 600)),
+        tuple(attributes.get("genreNames") or ()),
+        notes.get("standard") or notes.get("short"),
+    )
+
+
+def read_album(album_obj: Any) -> tuple:
+    """Fields _parse_album reads for an album relationship."""
+    attributes = album_obj.get("attributes", {})
+    artwork = attributes.get("artwork") or {}
+    return (
+        album_obj.get("id"),
+        attributes.get("name"),
+        attributes.get("artistName"),
+        attributes.get("releaseDate"),
+        attributes.get("upc"),
+        artwork.get("url", "").format(w=artwork.get("width", 600), h=artwork.get("height", 600)),
+    )
+
+
+def read_song(track_obj: Any) -> tuple:
+    """Fields _parse_track reads, including its artists and album."""
+    attributes = track_obj.get("attributes", {})
+    relationships = track_obj.get("relationships", {})
+    artists = relationships.get("artists", {}).get("data", [])
+    albums = relationships.get("albums", {}).get("data", [])
+    return (
+        track_obj.get("id"),
+        attributes.get("name"),
+        attributes.get("durationInMillis", 0) / 1000,
+        attributes.get("trackNumber"),
+        attributes.get("discNumber"),
+        attributes.get("isrc"),
+        attributes.get("playParams", {}).get("id"),
+        tuple(attributes.get("genreNames") or ()),
+        tuple(read_artist(artist) for artist in artists),
+        read_album(albums[0]) if albums else None,
+    )
+
+
+# ============================================================================
+# REALISTIC PAYLOADS
+# ============================================================================
+
+NAMES = [
+    "Radiohead", "The National", "Jan Bartoš", "Sigur Rós", "Björk",
+    "Motörhead", "Beyoncé", "藤井 風", "宇多田ヒカル", "BTS (방탄소년단)",
+    "فيروز", "Ελευθερία Αρβανιτάκη", "Кино", "Dvořák", "Ólafur Arnalds",
+    "Mø", "Zdeněk Svěrák", "Café Tacvba", "Sonic Youth 🎸", "Mötley Crüe",
+]
+
+
+def _artwork() -> dict:
+    return {
+        "width": 3000,
+        "height": 3000,
+        "url": "https://is1-ssl.mzstatic.com/image/thumb/Music/v4/aa/bb/cc/{w}x{h}bb.jpg",
+        "bgColor": "101010",
+        "textColor1": "f0f0f0",
+    }
+
+
+def _catalog_artist(rng: random.Random, idx: int) -> dict:
+    name = rng.choice(NAMES)
+    return {
+        "id": str(100000000 + idx),
+        "type": "artists",
+        "href": f"/v1/catalog/us/artists/{100000000 + idx}",
+        "attributes": {
+            "name": name,
+            "genreNames": rng.sample(["Alternative", "Rock", "Pop", "Electronic", "Jazz"], 2),
+            "url": f"https://music.apple.com/us/artist/{idx}",
+            "artwork": _artwork(),
+            "editorialNotes": {
+                "standard": f"{name} is one of the defining acts of their generation. " * 3,
+                "short": f"Essential {name}.",
+            },
+        },
+    }
+
+
+def library_artists_page(items: int = 50, seed: int = 1) -> bytes:
+    """One me/library/artists page with catalog relationships."""
+    rng = random.Random(seed)
+    data = []
+    for idx in range(items):
+        catalog = _catalog_artist(rng, idx)
+        data.append({
+            "id": f"r.{idx:010d}",
+            "type": "library-artists",
+            "href": f"/v1/me/library/artists/r.{idx:010d}",
+            "attributes": {"name": catalog["attributes"]["name"]},
+            "relationships": {
+                "catalog": {
+                    "href": f"/v1/me/library/artists/r.{idx:010d}/catalog",
+                    "data": [catalog],
+                }
+            },
+        })
+    body = {"next": f"/v1/me/library/artists?offset={items}", "data": data, "meta": {"total": 2500}}
+    return json.dumps(body, ensure_ascii=False).encode("utf-8")
+
+
+def catalog_songs_batch(items: int = 300, seed: int = 2) -> bytes:
+    """One catalog/{sf}/songs?ids=... batch with artists and albums included."""
+    rng = random.Random(seed)
+    data = []
+    for idx in range(items):
+        artist = _catalog_artist(rng, idx)
+        name = artist["attributes"]["name"]
+        album_id = str(1400000000 + idx // 10)
+        data.append({
+            "id": str(1500000000 + idx),
+            "type": "songs",
+            "href": f"/v1/catalog/us/songs/{1500000000 + idx}",
+            "attributes": {
+                "name": f"Track {idx} — {rng.choice(NAMES)}",
+                "artistName": name,
+                "albumName": f"Album {idx // 10} ({name})",
+                "genreNames": ["Alternative", "Music"],
+                "durationInMillis": rng.randint(120000, 420000),
+                "releaseDate": "2019-05-17",
+                "isrc": f"USAB1{idx:07d}",
+                "trackNumber": idx % 10 + 1,
+                "discNumber": 1,
+                "hasLyrics": True,
+                "audioTraits": ["lossless", "lossy-stereo"],
+                "artwork": _artwork(),
+                "playParams": {"id": str(1500000000 + idx), "kind": "song"},
+                "previews": [{"url": f"https://audio-ssl.itunes.apple.com/{idx}.m4a"}],
+                "url": f"https://music.apple.com/us/album/{album_id}?i={1500000000 + idx}",
+            },
+            "relationships": {
+                "artists": {"href": artist["href"], "data": [artist]},
+                "albums": {
+                    "href": f"/v1/catalog/us/songs/{1500000000 + idx}/albums",
+                    "data": [{
+                        "id": album_id,
+                        "type": "albums",
+                        "href": f"/v1/catalog/us/albums/{album_id}",
+                        "attributes": {
+                            "name": f"Album {idx // 10} ({name})",
+                            "artistName": name,
+                            "trackCount": 10,
+                            "releaseDate": "2019-05-17",
+                            "artwork": _artwork(),
+                            "upc": f"00{album_id}",
+                        },
+                    }],
+                },
+            },
+        })
+    return json.dumps({"data": data}, ensure_ascii=False).encode("utf-8")
+
+
+def apply_request_params(body: bytes, params: dict[str, str]) -> bytes:
+    """
+    The response Apple sends for `params`: sparse fieldsets applied.
+
+    Attributes and relationships not listed in a resource type's
+    fields[type] are dropped, as JSON:API sparse fieldsets do (that
+    includes editorialNotes, which only comes with extend=).
+    """
+    fields = {
+        key[len("fields["):-1]: set(value.split(","))
+        for key, value in params.items() if key.startswith("fields[")
+    }
+
+    def trim(resource: dict) -> None:
+        wanted = fields.get(resource.get("type"))
+        if wanted is not None:
+            for part in ("attributes", "relationships"):
+                if part in resource:
+                    resource[part] = {
+                        name: value for name, value in resource[part].items() if name in wanted
+                    }
+        for relationship in resource.get("relationships", {}).values():
+            for related in relationship.get("data", []):
+                trim(related)
+
+    doc = json.loads(body)
+    for resource in doc.get("data", []):
+        trim(resource)
+    return json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+
+# ============================================================================
+# BENCHMARK HELPERS
+# ============================================================================
+
+def bench(func: Callable[[], Any], min_time: float = 0.5) -> float:
+    """Best-of-5 mean seconds per call, each round running >= min_time / 5."""
+    calls = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 5:
+            break
+        calls *= 2
+    best = elapsed / calls
+    for _ in range(4):
+        started = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+def report(label: str, baseline: float, candidate: float) -> None:
+    print(
+        f"  {label:<34} {baseline * 1e6:>9.1f} us -> {candidate * 1e6:>9.1f} us"
+        f"  ({baseline / candidate:.2f}x)"
+    )
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def benchmark_json_decoding(payloads: dict[str, bytes]) -> None:
+    """Bytes -> str -> json vs. parsing the bytes directly."""
+    print(f"\nJSON decoding (decoder: {'orjson' if orjson else 'stdlib json'})")
+    for label, body in payloads.items():
+        assert json_loads_fast(body) == json_loads_via_text(body)
+        report(label, bench(lambda: json_loads_via_text(body)), bench(lambda: json_loads_fast(body)))
+    if orjson is not None:
+        print("  stdlib json (fallback when orjson is missing):")
+        for label, body in payloads.items():
+            report(
+                label,
+                bench(lambda: json.loads(body.decode("utf-8"))),
+                bench(lambda: json.loads(body)),
+            )
+
+
+def benchmark_request_profiles(payloads: dict[str, bytes]) -> None:
+    """Payload size per endpoint: "full" profile vs. "lean" sparse fieldsets."""
+    print("\nRequest profiles (full -> lean), body and gzip bytes per response")
+    cases = {
+        "library artists, 50 items": LEAN_PROFILE["artists"],
+        "catalog songs batch, 300 items": LEAN_PROFILE["catalog_songs"],
+    }
+    for label, params in cases.items():
+        full = payloads[label]
+        lean = apply_request_params(full, params)
+        # Sparse fieldsets must not cost the parsers a relationship
+        for full_item, lean_item in zip(json.loads(full)["data"], json.loads(lean)["data"]):
+            lost = set(full_item.get("relationships", {})) - set(lean_item.get("relationships", {}))
+            if lost:
+                raise AssertionError(f"{label}: lean profile drops relationships {sorted(lost)}")
+        full_gz, lean_gz = len(gzip.compress(full)), len(gzip.compress(lean))
+        print(
+            f"  {label:<34} {len(full) / 1024:>6.0f} KiB -> {len(lean) / 1024:>4.0f} KiB"
+            f" ({1 - len(lean) / len(full):.0%} less), gzip {full_gz / 1024:.0f} KiB ->"
+            f" {lean_gz / 1024:.0f} KiB ({1 - lean_gz / full_gz:.0%} less)"
+        )
+
+
+def benchmark_artist_parsing(items: int = 10_000) -> None:
+    """Previous _parse_artist vs. the precompiled parse plan on a 10k-artist library."""
+    if Artist is None:
+        print("\nArtist parsing: music_assistant_models is not installed, skipped")
+        return
+    provider = SimpleNamespace(
+        logger=logging.getLogger("benchmark"),
+        domain="apple_music",
+        instance_id="apple_music--bench",
+        lookup_key="apple_music--bench",
+    )
+    artists = json.loads(library_artists_page(items=items, seed=3))["data"]
+    previous = [parse_artist_previous(provider, artist).to_dict() for artist in artists[:500]]
+    planned = [parse_artist_planned(provider, artist).to_dict() for artist in artists[:500]]
+    assert previous == planned
+    print(f"\nArtist parsing, {items} library artists (items/s)")
+    for label, parse in (("previous", parse_artist_previous), ("parse plan", parse_artist_planned)):
+        seconds = bench(lambda: [parse(provider, artist) for artist in artists], min_time=2.0)
+        print(f"  {label:<34} {items / seconds:>12,.0f} items/s")
+
+
+def retained_bytes(func: Callable[[], Any]) -> int:
+    """Bytes still allocated while the result of func() is alive."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained
+
+
+def parse_song_strings(track_obj: dict) -> tuple:
+    """The strings (and genre set) a parsed Track keeps, read the way _parse_track reads them."""
+    attributes = track_obj["attributes"]
+    artists = track_obj["relationships"]["artists"]["data"]
+    album = track_obj["relationships"]["albums"]["data"][0]
+    artwork = attributes.get("artwork") or {}
+    genres = [safe_unicode_str(genre) for genre in attributes.get("genreNames") or () if genre]
+    return (
+        safe_unicode_str(track_obj["id"]),
+        safe_unicode_str(attributes.get("name")),
+        safe_unicode_str(attributes.get("isrc")),
+        safe_unicode_str(attributes.get("url")),
+        _artwork_path(artwork.get("url"), artwork.get("width"), artwork.get("height")),
+        tuple(
+            (safe_unicode_str(artist["id"]), safe_unicode_str(artist["attributes"]["name"]))
+            for artist in artists
+        ),
+        (safe_unicode_str(album["id"]), safe_unicode_str(album["attributes"]["name"])),
+        set(genres),
+    )
+
+
+def benchmark_string_interning(batches: int = 34) -> None:
+    """Parsed tracks of a synthetic ~10k-song library with and without a StringPool."""
+    bodies = [catalog_songs_batch(seed=seed) for seed in range(batches)]
+    pools: list[StringPool] = []
+
+    def parse_library(intern: bool) -> list[tuple]:
+        pool = StringPool() if intern else None
+        if pool is not None:
+            pools.append(pool)
+        songs = []
+        for body in bodies:
+            page = json_loads_fast(body)["data"]
+            with interning(pool):
+                songs += [parse_song_strings(item) for item in page]
+        return songs
+
+    assert parse_library(False) == parse_library(True)
+    tracks = len(parse_library(False))
+    print(f"\nString interning ({tracks:,} tracks in {batches} catalog batches, pages dropped after parsing)")
+    report(
+        "decode + parse library",
+        bench(lambda: parse_library(False)),
+        bench(lambda: parse_library(True)),
+    )
+    plain_bytes = retained_bytes(lambda: parse_library(False))
+    pooled_bytes = retained_bytes(lambda: parse_library(True))
+    print(
+        f"  {'memory held by parsed tracks':<34} {plain_bytes / 1024:>9.0f} KiB -> {pooled_bytes / 1024:>6.0f} KiB"
+        f"  ({plain_bytes / pooled_bytes:.2f}x)"
+    )
+    print(f"  {'pool':<34} {pools[-1]}")
+
+
+def benchmark_payload_normalization(batches: int = 34) -> None:
+    """Per-field normalization in the parsers vs. one pass over each body at decode time."""
+    nfc_bodies = [catalog_songs_batch(seed=seed) for seed in range(batches)]
+    # Uploaded / matched songs often carry decomposed (NFD) tags
+    decomposed = {name: unicodedata.normalize("NFD", name) for name in NAMES}
+    nfd_bodies = []
+    for body in nfc_bodies:
+        text = body.decode("utf-8")
+        for name, nfd_name in decomposed.items():
+            text = text.replace(name, nfd_name)
+        nfd_bodies.append(text.encode("utf-8"))
+
+    def per_field(bodies: list[bytes]) -> list[tuple]:
+        songs = []
+        for body in bodies:
+            songs += [parse_song_strings(item) for item in json_loads_fast(body)["data"]]
+        return songs
+
+    def at_decode(bodies: list[bytes]) -> list[tuple]:
+        # What _decode_json_body() does with PAYLOAD_NFC
+        songs = []
+        for body in bodies:
+            data = json_loads_fast(body)
+            if json_needs_nfc(body):
+                data = nfc_strings(data)
+            with normalized_strings():
+                songs += [parse_song_strings(item) for item in data["data"]]
+        return songs
+
+    tracks = batches * 300
+    print(f"\nPayload normalization ({tracks:,}-track library sync: decode + parse, {batches} catalog batches)")
+    for label, bodies in {"Apple payloads (NFC)": nfc_bodies, "names decomposed (NFD)": nfd_bodies}.items():
+        assert per_field(bodies) == at_decode(bodies) == per_field(nfc_bodies)
+        report(
+            f"{label}",
+            bench(lambda: per_field(bodies), min_time=2.0),
+            bench(lambda: at_decode(bodies), min_time=2.0),
+        )
+
+
+def benchmark_unicode_normalization(repeat: int = 5000, rounds: int = 30) -> None:
+    """safe_unicode_str() with each normalizer, over the names the test script checks."""
+    # The names test_unicode_handling.py checks: Czech, CJK, RTL, emoji, ASCII
+    from test_unicode_handling import TEST_CASES
+
+    corpus = [text for text, _description in TEST_CASES]
+    decomposed = [unicodedata.normalize("NFD", text) for text in corpus]
+    decomposed = [text for text in decomposed if not unicodedata.is_normalized("NFC", text)]
+    variants = {
+        "normalize() always (previous)": safe_unicode_str_with(nfc_always),
+        "isascii() only (_nfc)": safe_unicode_str_with(_nfc),
+        "isascii() + is_normalized()": safe_unicode_str_with(nfc_prechecked),
+        "isascii() + NFC memo": safe_unicode_str_with(nfc_memoized),
+    }
+
+    def best_passes(body: str) -> dict[str, float]:
+        # A synced field is a new string every time, with no cached hash:
+        # decode fresh strings for every pass and time only the pass; the
+        # variants take turns so machine noise hits them alike
+        best = dict.fromkeys(variants, float("inf"))
+        for _ in range(rounds):
+            for name, safe_str in variants.items():
+                texts = json.loads(body)
+                started = time.perf_counter()
+                for text in texts:
+                    safe_str(text)
+                best[name] = min(best[name], time.perf_counter() - started)
+        return best
+
+    print(f"\nUnicode normalization (test_unicode_handling.py names x {repeat}, best of {rounds})")
+    for label, texts in {
+        f"{len(corpus)} names as written (NFC)": corpus,
+        f"same + {len(decomposed)} NFD variants": corpus + decomposed,
+    }.items():
+        body = json.dumps(texts * repeat, ensure_ascii=False)
+        expected = [safe_unicode_str(text) for text in json.loads(body)]
+        for safe_str in variants.values():
+            assert [safe_str(text) for text in json.loads(body)] == expected
+        _nfc_memo.clear()
+        timings = best_passes(body)
+        previous = timings.pop("normalize() always (previous)")
+        print(f"  {label}:")
+        for name, seconds in timings.items():
+            report(name, previous, seconds)
+
+
+def check_struct_dict_parity() -> None:
+    """Null and absent fields read the same on a struct as on the dict json gives."""
+    body = json.dumps({"data": [{
+        "id": "r.1", "type": "library-artists",
+        "attributes": {"name": "Null Art", "artwork": {"url": "u", "width": None}},
+    }]}).encode()
+    as_dict = json.loads(body)["data"][0]["attributes"]["artwork"]
+    as_struct = msgspec.json.Decoder(ArtistList).decode(body).data[0]["attributes"]["artwork"]
+
+    def subscript(obj: Any, key: str) -> Any:
+        try:
+            return obj[key]
+        except KeyError:
+            return KeyError
+
+    for key in ("url", "width", "height"):  # present, null, absent
+        for read in (subscript, lambda obj, k: obj.get(k, "default"), lambda obj, k: k in obj):
+            if read(as_dict, key) != read(as_struct, key):
+                raise AssertionError(
+                    f"artwork[{key!r}]: dict gives {read(as_dict, key)!r}, "
+                    f"struct gives {read(as_struct, key)!r}"
+                )
+
+
+def benchmark_typed_decoding(payloads: dict[str, bytes]) -> None:
+    """Dicts (orjson / json) vs. field-selective structs: decode + parser reads, memory per page."""
+    if msgspec is None:
+        print("\nTyped decoding: msgspec is not installed, skipped")
+        return
+    check_struct_dict_parity()
+    print(f"\nTyped decoding (dicts: {'orjson' if orjson else 'stdlib json'}, structs: msgspec)")
+    cases = {
+        "library artists, 50 items": (msgspec.json.Decoder(ArtistList), read_artist),
+        "catalog songs batch, 300 items": (msgspec.json.Decoder(SongList), read_song),
+    }
+    for label, (decoder, read) in cases.items():
+        body = payloads[label]
+        as_dicts = json_loads_fast(body)["data"]
+        as_structs = decoder.decode(body).data
+        assert [read(item) for item in as_dicts] == [read(item) for item in as_structs]
+        print(f"  {label}:")
+        report("decode", bench(lambda: json_loads_fast(body)), bench(lambda: decoder.decode(body)))
+        report(
+            "parser field reads",
+            bench(lambda: [read(item) for item in as_dicts]),
+            bench(lambda: [read(item) for item in as_structs]),
+        )
+        report(
+            "decode + reads",
+            bench(lambda: [read(item) for item in json_loads_fast(body)["data"]]),
+            bench(lambda: [read(item) for item in decoder.decode(body).data]),
+        )
+        dict_bytes = retained_bytes(lambda: json_loads_fast(body))
+        struct_bytes = retained_bytes(lambda: decoder.decode(body))
+        print(
+            f"  {'memory per page':<34} {dict_bytes / 1024:>9.0f} KiB -> {struct_bytes / 1024:>6.0f} KiB"
+            f"  ({dict_bytes / struct_bytes:.2f}x)"
+        )
+
+
+def main() -> None:
+    payloads = {
+        "library artists, 50 items": library_artists_page(),
+        "catalog songs batch, 300 items": catalog_songs_batch(),
+    }
+    print("Apple Music sync hot-path benchmark")
+    for label, body in payloads.items():
+        print(f"  {label}: {len(body) / 1024:.0f} KiB")
+    benchmark_json_decoding(payloads)
+    benchmark_typed_decoding(payloads)
+    benchmark_request_profiles(payloads)
+    benchmark_artist_parsing()
+    benchmark_string_interning()
+    benchmark_unicode_normalization()
+    benchmark_payload_normalization()
+
+
+if __name__ == "__main__":
+    main()
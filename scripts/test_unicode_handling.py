@@ -18,12 +18,19 @@ from typing import Any
 # UTILITY FUNCTIONS (copied from fix)
 # ============================================================================
 
+def _nfc(text: str) -> str:
+    """NFC form of text: ASCII as is, other strings through normalize()."""
+    if text.isascii():
+        return text
+    return unicodedata.normalize('NFC', text)
+
+
 def safe_unicode_str(value: Any, fallback: str = "") -> str:
     """Safely convert any value to a Unicode string with NFC normalization."""
     if value is None:
         return fallback
     if isinstance(value, str):
-        return unicodedata.normalize('NFC', value)
+        return _nfc(value)
     if isinstance(value, bytes):
         try:
             decoded = value.decode('utf-8')
@@ -32,9 +39,9 @@ def safe_unicode_str(value: Any, fallback: str = "") -> str:
                 decoded = value.decode('latin-1')
             except Exception:
                 return fallback
-        return unicodedata.normalize('NFC', decoded)
+        return _nfc(decoded)
     try:
-        return unicodedata.normalize('NFC', str(value))
+        return _nfc(str(value))
     except Exception:
         return fallback
 
@@ -196,6 +203,13 @@ def test_safe_unicode_str():
     print(f"✅ PASS: Integer → {result!r}")
     passed += 1
 
+    # Test decomposed (NFD) input
+    decomposed = unicodedata.normalize('NFD', "Jan Bartoš")
+    result = safe_unicode_str(decomposed)
+    assert result == "Jan Bartoš" and len(result) == 10, "NFD composition failed"
+    print(f"✅ PASS: NFD input → {result!r}")
+    passed += 1
+
     print(f"\n📊 Results: {passed} passed, {failed} failed")
     return failed == 0
 